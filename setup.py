@@ -41,7 +41,10 @@ setup(
         "pyparsing>=2.3",
         'importlib-resources>=1.0; python_version < "3.7.0"',
     ],
-    extras_require={"dev": ["black", "pytest-cov", "tox", "ipython", "sphinx"]},
+    extras_require={
+        "numpy": ["numpy"],
+        "dev": ["black", "pytest-cov", "tox", "ipython", "sphinx", "numpy"],
+    },
     # package_data will include all the resolved globs into both the wheel and sdist
     package_data={"pyvalem": ["*.txt"]},
     # no need for MANIFEST.in, which should be reserved only for build-time files
@@ -44,3 +44,32 @@ def float_to_fraction(v):
     if v.is_integer():
         return str(int(v))
     return "{0:d}/2".format(int(2 * v))
+
+
+def memoized_property(fget):
+    """Return a read-only property which caches the value returned by fget.
+
+    The value is computed on first access and stored in the instance ``__dict__``
+    under the property's name prefixed by ``"_memo_"``: objects using this must
+    not be modified after the value has been computed.
+
+    Parameters
+    ----------
+    fget : callable
+
+    Returns
+    -------
+    property
+    """
+    attr = "_memo_" + fget.__name__
+
+    def getter(self):
+        try:
+            return self.__dict__[attr]
+        except KeyError:
+            value = self.__dict__[attr] = fget(self)
+            return value
+
+    getter.__name__ = fget.__name__
+    getter.__doc__ = fget.__doc__
+    return property(getter)
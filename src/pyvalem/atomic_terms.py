@@ -0,0 +1,193 @@
+"""
+This module contains functions for enumerating the LS-coupling terms and levels of
+an `AtomicConfiguration`: for example, the terms 1S, 1D and 3P of a p2
+configuration.
+
+The terms of each open subshell, ``l**nocc``, are found once and memoized: the
+number of microstates of the subshell with each (M_L, M_S) is counted by
+adding its spin-orbitals one at a time (rather than by enumerating the
+microstates), and the terms are read off from these counts. The terms of a
+configuration are then built by coupling the term tables of its open subshells
+in turn, as multisets of (2S+1, L) with multiplicities, so that the cost does not
+grow with the (possibly very large) number of microstates of the configuration.
+The coupled terms of each combination of open subshells are memoized too.
+
+Examples
+--------
+>>> from pyvalem.atomic_terms import configuration_terms, term_symbols
+>>> configuration_terms("1s2.2s2.2p2")
+{(1, 0): 1, (1, 2): 1, (3, 1): 1}
+>>> term_symbols("1s2.2s2.2p2")
+[1S_0, 1D_2, 3P_0, 3P_1, 3P_2]
+>>> term_symbols("[Ne].3s.3p", J=False)
+[1Po, 3Po]
+>>> sum(configuration_terms("[Xe].4f7").values())  # the 119 terms of f7
+119
+"""
+
+from functools import lru_cache
+
+from .states.atomic_configuration import AtomicConfiguration
+from .states.atomic_term_symbol import AtomicTermSymbol, atom_L_symbols
+
+
+class AtomicTermsError(Exception):
+    pass
+
+
+@lru_cache(maxsize=None)
+def _subshell_terms(l, nocc):
+    """The terms of the subshell l**nocc, as a sorted tuple of
+    ((2S+1, L), multiplicity) pairs."""
+    # A subshell with nocc electrons has the same terms as one with nocc holes.
+    nocc = min(nocc, 4 * l + 2 - nocc)
+    # counts[k] maps (M_L, 2M_S) to the number of microstates with k of the
+    # spin-orbitals added so far occupied.
+    counts = [{} for _ in range(nocc + 1)]
+    counts[0][0, 0] = 1
+    for ml in range(-l, l + 1):
+        for ms2 in (-1, 1):
+            for k in range(nocc, 0, -1):
+                for (ML, MS2), n in counts[k - 1].items():
+                    key = ML + ml, MS2 + ms2
+                    counts[k][key] = counts[k].get(key, 0) + n
+    counts = counts[nocc]
+
+    # The number of terms with (L, S) is the number of microstates with
+    # M_L = L, M_S = S, less those belonging to terms with larger L or S.
+    terms = {}
+    for (ML, MS2), n in counts.items():
+        if ML < 0 or MS2 < 0:
+            continue
+        n -= counts.get((ML + 1, MS2), 0) + counts.get((ML, MS2 + 2), 0)
+        n += counts.get((ML + 1, MS2 + 2), 0)
+        if n:
+            terms[MS2 + 1, ML] = n
+    return tuple(sorted(terms.items()))
+
+
+def subshell_terms(l, nocc):
+    """Return the LS-coupling terms of the subshell l**nocc.
+
+    Parameters
+    ----------
+    l : int
+        The azimuthal quantum number of the subshell.
+    nocc : int
+        The number of electrons in the subshell, ``0 <= nocc <= 4l+2``.
+
+    Returns
+    -------
+    dict
+        The number of terms with each spin multiplicity, 2S+1, and total orbital
+        angular momentum quantum number, L, keyed by (2S+1, L).
+
+    Raises
+    ------
+    AtomicTermsError
+        If `nocc` is not a valid occupancy of the subshell.
+    """
+    if not 0 <= nocc <= 4 * l + 2:
+        raise AtomicTermsError("Invalid occupancy of l={} subshell: {}".format(l, nocc))
+    return dict(_subshell_terms(l, nocc))
+
+
+def couple_terms(terms1, terms2):
+    """Return the terms arising from coupling two sets of terms.
+
+    Parameters
+    ----------
+    terms1, terms2 : dict
+        The number of terms with each (2S+1, L), as returned by `subshell_terms`.
+
+    Returns
+    -------
+    dict
+        The number of coupled terms with each (2S+1, L).
+    """
+    terms = {}
+    for (Smult1, L1), n1 in terms1.items():
+        for (Smult2, L2), n2 in terms2.items():
+            n = n1 * n2
+            for Smult in range(abs(Smult1 - Smult2) + 1, Smult1 + Smult2, 2):
+                for L in range(abs(L1 - L2), L1 + L2 + 1):
+                    terms[Smult, L] = terms.get((Smult, L), 0) + n
+    return terms
+
+
+@lru_cache(maxsize=1024)
+def _coupled_terms(subshells):
+    """The terms of the (sorted) tuple of open subshells (l, nocc), as a sorted
+    tuple of ((2S+1, L), multiplicity) pairs."""
+    terms = {(1, 0): 1}
+    for l, nocc in subshells:
+        terms = couple_terms(terms, dict(_subshell_terms(l, nocc)))
+    return tuple(sorted(terms.items()))
+
+
+def _open_subshells(configuration):
+    if not isinstance(configuration, AtomicConfiguration):
+        configuration = AtomicConfiguration(configuration)
+    subshells = []
+    parity = 0
+    for orbital in configuration.orbitals:
+        parity += orbital.l * orbital.nocc
+        if 0 < orbital.nocc < 4 * orbital.l + 2:
+            subshells.append((orbital.l, orbital.nocc))
+    return tuple(sorted(subshells)), parity % 2
+
+
+def configuration_terms(configuration):
+    """Return the LS-coupling terms of an atomic configuration.
+
+    Parameters
+    ----------
+    configuration : AtomicConfiguration or str
+
+    Returns
+    -------
+    dict
+        The number of terms with each spin multiplicity, 2S+1, and total orbital
+        angular momentum quantum number, L, keyed by (2S+1, L).
+    """
+    subshells, _ = _open_subshells(configuration)
+    return dict(_coupled_terms(subshells))
+
+
+def term_symbols(configuration, J=True):
+    """Return the distinct terms (or levels) of an atomic configuration.
+
+    Parameters
+    ----------
+    configuration : AtomicConfiguration or str
+    J : bool, default=True
+        If ``True``, return a term symbol for each level (value of J) of each
+        term; otherwise, return a term symbol without J for each term.
+
+    Returns
+    -------
+    list of AtomicTermSymbol
+        The term symbols, with the parity of the configuration, ordered by 2S+1,
+        L and J. Terms occurring more than once in the configuration are listed
+        only once (see `configuration_terms` for their multiplicities).
+
+    Raises
+    ------
+    AtomicTermsError
+        If a term has an L too large to be written as a term symbol.
+    """
+    subshells, parity = _open_subshells(configuration)
+    s_parity = "o" if parity else ""
+    symbols = []
+    for (Smult, L), _ in _coupled_terms(subshells):
+        try:
+            s_term = "{}{}{}".format(Smult, atom_L_symbols[L], s_parity)
+        except IndexError:
+            raise AtomicTermsError("No term symbol for L={}".format(L))
+        if not J:
+            symbols.append(AtomicTermSymbol(s_term))
+            continue
+        for J2 in range(abs(2 * L - Smult + 1), 2 * L + Smult, 2):
+            s_J = str(J2 // 2) if J2 % 2 == 0 else "{}/2".format(J2)
+            symbols.append(AtomicTermSymbol("{}_{}".format(s_term, s_J)))
+    return symbols
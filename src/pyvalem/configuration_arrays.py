@@ -0,0 +1,263 @@
+"""
+This module contains functions for storing and manipulating large collections of
+atomic configurations as a single 2-D array of their occupation vectors (see
+`AtomicConfiguration.occupation`), with one row per configuration and one column
+per subshell, in the order 1s, 2s, 2p, 3s, 3p, 3d, 4s, ... given by
+`subshell_index`.
+
+Counting electrons, finding parities and removing duplicate configurations are
+then whole-array operations, with no parsing or comparison of configuration
+strings. Pairs of configurations (such as the lower and upper configurations of a
+list of transitions) can be classified by the excitation relating them in the
+same way: see `classify_excitations`.
+
+This module requires NumPy.
+
+Examples
+--------
+>>> from pyvalem.configuration_arrays import (
+...     occupation_array, electron_counts, parities, from_occupation_array,
+...     classify_excitations,
+... )
+>>> occupations = occupation_array(["1s2.2s2.2p", "1s2.2p3", "[Ne].3s"])
+>>> occupations
+array([[2, 2, 1, 0],
+       [2, 0, 3, 0],
+       [2, 2, 6, 1]], dtype=uint8)
+>>> electron_counts(occupations)
+array([ 5,  5, 11])
+>>> parities(occupations)
+array([1, 1, 0])
+>>> from_occupation_array(occupations[:2])
+[1s2.2s2.2p, 1s2.2p3]
+>>> excitations = classify_excitations(occupations[:1], occupations[1:2])
+>>> excitations.rank, excitations.donors, excitations.acceptors
+(array([2]), array([[1, 1]]), array([[2, 2]]))
+"""
+
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .states.atomic_configuration import (
+    AtomicConfiguration,
+    AtomicConfigurationError,
+    _subshells,
+)
+
+Excitations = namedtuple("Excitations", "rank donors acceptors parity_change")
+Excitations.__doc__ = """\
+The excitations relating pairs of configurations, as returned by
+`classify_excitations`.
+"""
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for arrays of atomic configurations")
+
+
+def subshell_l(width):
+    """Return the azimuthal quantum number of each column of an occupation array.
+
+    Parameters
+    ----------
+    width : int
+        The number of columns.
+
+    Returns
+    -------
+    numpy.ndarray of int
+    """
+    _require_numpy()
+    return np.array([l for _, l in _subshells(width)], dtype=int)
+
+
+def occupation_array(configurations, width=None):
+    """Return the occupation vectors of atomic configurations as a 2-D array.
+
+    Parameters
+    ----------
+    configurations : iterable of AtomicConfiguration or str
+    width : int, optional
+        The number of columns (subshells) of the array. By default, this is the
+        length of the longest occupation vector.
+
+    Returns
+    -------
+    numpy.ndarray of uint8
+        The occupation vector of each configuration, padded with zeros.
+
+    Raises
+    ------
+    AtomicConfigurationError
+        If `width` is too small for an occupation vector.
+    """
+    _require_numpy()
+    occupations = []
+    for configuration in configurations:
+        if not isinstance(configuration, AtomicConfiguration):
+            configuration = AtomicConfiguration(configuration)
+        occupations.append(configuration.occupation)
+    max_width = max((len(occupation) for occupation in occupations), default=0)
+    if width is None:
+        width = max_width
+    elif width < max_width:
+        raise AtomicConfigurationError(
+            "Occupation vectors of length {} do not fit in width {}".format(
+                max_width, width
+            )
+        )
+    array = np.zeros((len(occupations), width), dtype=np.uint8)
+    for i, occupation in enumerate(occupations):
+        array[i, : len(occupation)] = np.frombuffer(occupation, dtype=np.uint8)
+    return array
+
+
+def from_occupation_array(array):
+    """Return the atomic configurations of the rows of an occupation array.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        A 2-D array of occupation vectors.
+
+    Returns
+    -------
+    list of AtomicConfiguration
+    """
+    _require_numpy()
+    array = np.asarray(array, dtype=np.uint8)
+    return [AtomicConfiguration.from_occupation(row.tobytes()) for row in array]
+
+
+def electron_counts(array):
+    """Return the number of electrons of each configuration in an occupation
+    array.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+
+    Returns
+    -------
+    numpy.ndarray of int
+    """
+    _require_numpy()
+    return np.asarray(array).sum(axis=-1, dtype=int)
+
+
+def parities(array):
+    """Return the parity of each configuration in an occupation array.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+
+    Returns
+    -------
+    numpy.ndarray of int
+        1 for odd and 0 for even configurations.
+    """
+    _require_numpy()
+    array = np.asarray(array)
+    return (array.astype(int) @ subshell_l(array.shape[-1])) % 2
+
+
+def unique_configurations(array):
+    """Find the distinct configurations in an occupation array.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+
+    Returns
+    -------
+    unique : numpy.ndarray
+        The distinct rows of `array`, sorted.
+    inverse : numpy.ndarray of int
+        The index in `unique` of each row of `array`.
+    """
+    _require_numpy()
+    unique, inverse = np.unique(np.asarray(array), axis=0, return_inverse=True)
+    return unique, inverse.reshape(-1)
+
+
+def _electron_subshells(counts, width):
+    """Return the column index of each electron counted in the rows of counts,
+    repeated as many times as it is counted, in a (rows, width) array padded
+    with -1."""
+    rank = counts.sum(axis=1)
+    electrons = np.full((len(counts), width), -1, dtype=int)
+    columns = np.repeat(
+        np.tile(np.arange(counts.shape[1]), len(counts)), counts.ravel()
+    )
+    rows = np.repeat(np.arange(len(counts)), rank)
+    # The position of each electron within its row.
+    positions = np.arange(len(columns)) - np.repeat(np.cumsum(rank) - rank, rank)
+    electrons[rows, positions] = columns
+    return electrons
+
+
+def classify_excitations(lower, upper):
+    """Classify the excitations relating pairs of configurations.
+
+    Parameters
+    ----------
+    lower, upper : numpy.ndarray
+        Occupation arrays of the same number of rows, the configurations of each
+        pair. The arrays may have different widths.
+
+    Returns
+    -------
+    Excitations
+        A named tuple of arrays, with one row for each pair of configurations:
+
+        rank : numpy.ndarray of int
+            The number of electrons moved between the configurations: 0 for
+            identical configurations, 1 for a single excitation, 2 for a double
+            excitation, and so on.
+        donors, acceptors : numpy.ndarray of int
+            The subshell index (column) of each electron removed from the lower
+            configuration, and of each electron added to make the upper one,
+            repeated for each electron moved and in order of subshell, as 2-D
+            arrays padded with -1 to the greatest rank.
+        parity_change : numpy.ndarray of bool
+            ``True`` where the configurations of a pair have opposite parities.
+
+    Raises
+    ------
+    AtomicConfigurationError
+        If the arrays have different numbers of rows, or the configurations of
+        any pair have different numbers of electrons.
+    """
+    _require_numpy()
+    lower, upper = np.asarray(lower), np.asarray(upper)
+    if len(lower) != len(upper):
+        raise AtomicConfigurationError(
+            "Occupation arrays of {} and {} rows cannot be paired".format(
+                len(lower), len(upper)
+            )
+        )
+    width = max(lower.shape[-1], upper.shape[-1])
+    difference = np.zeros((len(lower), width), dtype=int)
+    difference[:, : upper.shape[-1]] += upper
+    difference[:, : lower.shape[-1]] -= lower
+    if difference.sum(axis=1).any():
+        raise AtomicConfigurationError(
+            "Configurations with different numbers of electrons cannot be related"
+            " by an excitation"
+        )
+    holes = np.maximum(-difference, 0)
+    particles = np.maximum(difference, 0)
+    rank = particles.sum(axis=1)
+    max_rank = rank.max(initial=0)
+    return Excitations(
+        rank,
+        _electron_subshells(holes, max_rank),
+        _electron_subshells(particles, max_rank),
+        (difference @ subshell_l(width)) % 2 == 1,
+    )
@@ -0,0 +1,239 @@
+"""
+This module contains functions for generating the atomic configurations reachable
+from one or more reference configurations by single, double (or higher)
+excitations of their electrons into a set of orbitals, as used to build the
+configuration spaces of collisional-radiative and configuration-interaction
+models.
+
+Configurations are generated as occupation vectors (see
+`AtomicConfiguration.occupation`), without building or parsing any configuration
+strings. A configuration differs from its reference by a set of *holes* (the
+electrons removed from the subshells it has fewer electrons in) and a set of
+*particles* (the electrons added to the subshells it has more electrons in), and
+no subshell can be both; generating each such pair of holes and particles once
+therefore generates each configuration of a reference exactly once. The
+configurations of several references are deduplicated by their occupation
+vectors. The configurations may also be counted without generating them.
+
+Examples
+--------
+>>> from pyvalem.excitations import count_excitations, excitations
+>>> for configuration in excitations("1s2.2s", n_max=2, max_rank=1):
+...     print(configuration)
+1s.2s2
+1s.2s.2p
+1s2.2p
+>>> count_excitations("[Ne].3s2", n_max=4)
+234
+"""
+
+import itertools
+
+from .states.atomic_configuration import (
+    AtomicConfiguration,
+    _parse_subshells,
+    _subshells,
+    subshell_index,
+)
+
+
+class ExcitationError(Exception):
+    pass
+
+
+def _subshell(orbital):
+    """Return (n, l) for an orbital given as (n, l) or a string such as "3d"."""
+    if isinstance(orbital, str):
+        try:
+            n, l, _ = _parse_subshells(orbital)[0]
+        except (ValueError, IndexError):
+            raise ExcitationError("Invalid orbital: {}".format(orbital))
+    else:
+        n, l = orbital
+    if not 0 <= l < n:
+        raise ExcitationError("Invalid orbital: {}".format(orbital))
+    return n, l
+
+
+def _indices(orbitals, n_max, l_max):
+    """Return the sorted occupation-vector indices of the orbitals."""
+    if orbitals is None:
+        if n_max is None:
+            raise ExcitationError("One of orbitals or n_max must be given")
+        subshells = [(n, l) for n in range(1, n_max + 1) for l in range(n)]
+    else:
+        subshells = [_subshell(orbital) for orbital in orbitals]
+    return sorted(
+        {
+            subshell_index(n, l)
+            for n, l in subshells
+            if (n_max is None or n <= n_max) and (l_max is None or l <= l_max)
+        }
+    )
+
+
+def _references(reference):
+    if isinstance(reference, (str, AtomicConfiguration)):
+        reference = [reference]
+    for configuration in reference:
+        if not isinstance(configuration, AtomicConfiguration):
+            configuration = AtomicConfiguration(configuration)
+        yield configuration.occupation
+
+
+def _multisets(indices, rank, available):
+    """Generate the multisets of rank indices, each index i at most available[i]
+    times, as dictionaries of counts."""
+    for combination in itertools.combinations_with_replacement(indices, rank):
+        counts = {}
+        for i in combination:
+            counts[i] = counts.get(i, 0) + 1
+        if all(n <= available[i] for i, n in counts.items()):
+            yield counts
+
+
+def _count_multisets(indices, rank, available):
+    """Count the multisets generated by _multisets(indices, rank, available)."""
+    ways = [1] + [0] * rank
+    for i in indices:
+        ways = [
+            sum(ways[r - k] for k in range(min(r, available[i]) + 1))
+            for r in range(rank + 1)
+        ]
+    return ways[rank]
+
+
+class _Space:
+    """The excitation space of a single reference occupation vector."""
+
+    def __init__(self, occupation, acceptors, donors):
+        size = max([len(occupation)] + [i + 1 for i in acceptors])
+        self.occupation = list(occupation) + [0] * (size - len(occupation))
+        capacities = [4 * l + 2 for _, l in _subshells(size)]
+        self.spare = [c - nocc for c, nocc in zip(capacities, self.occupation)]
+        if donors is None:
+            self.donors = [i for i, nocc in enumerate(self.occupation) if nocc]
+        else:
+            self.donors = [i for i in donors if i < size and self.occupation[i]]
+        self.acceptors = acceptors
+
+    def holes(self, rank):
+        return _multisets(self.donors, rank, self.occupation)
+
+    def _allowed(self, holes):
+        return [i for i in self.acceptors if i not in holes]
+
+    def generate(self, rank):
+        for holes in self.holes(rank):
+            for particles in _multisets(self._allowed(holes), rank, self.spare):
+                occupation = self.occupation[:]
+                for i, n in holes.items():
+                    occupation[i] -= n
+                for i, n in particles.items():
+                    occupation[i] += n
+                yield bytes(occupation).rstrip(b"\0")
+
+    def count(self, rank):
+        return sum(
+            _count_multisets(self._allowed(holes), rank, self.spare)
+            for holes in self.holes(rank)
+        )
+
+
+def _spaces(reference, orbitals, n_max, l_max, donors):
+    acceptors = _indices(orbitals, n_max, l_max)
+    if donors is not None:
+        donors = _indices(donors, None, None)
+    return [
+        _Space(occupation, acceptors, donors) for occupation in _references(reference)
+    ]
+
+
+def excitations(
+    reference,
+    orbitals=None,
+    n_max=None,
+    l_max=None,
+    max_rank=2,
+    donors=None,
+    as_occupation=False,
+):
+    """Generate the configurations reachable from a reference by excitations.
+
+    Parameters
+    ----------
+    reference : AtomicConfiguration or str, or an iterable of these
+        The reference configuration(s).
+    orbitals : iterable of str or tuple, optional
+        The orbitals electrons may be excited into, as strings such as ``"3d"``
+        or (n, l) tuples. By default, all the orbitals with n <= `n_max`.
+    n_max, l_max : int, optional
+        The maximum principal and azimuthal quantum numbers of the orbitals
+        electrons may be excited into.
+    max_rank : int, default=2
+        The maximum number of electrons excited: 1 for single excitations, 2
+        for single and double excitations, and so on.
+    donors : iterable of str or tuple, optional
+        The orbitals electrons may be excited from. By default, all the occupied
+        orbitals of the reference.
+    as_occupation : bool, default=False
+        If ``True``, generate the occupation vectors of the configurations rather
+        than `AtomicConfiguration` objects.
+
+    Yields
+    ------
+    AtomicConfiguration or bytes
+        Each distinct configuration, other than the references, once: ordered
+        by reference, then by the number of electrons excited.
+
+    Raises
+    ------
+    ExcitationError
+        If neither `orbitals` nor `n_max` is given, or an orbital is invalid.
+    """
+    spaces = _spaces(reference, orbitals, n_max, l_max, donors)
+    # Only the configurations of more than one reference can coincide.
+    seen = {bytes(space.occupation).rstrip(b"\0") for space in spaces}
+    check_seen = len(spaces) > 1
+    for space in spaces:
+        for rank in range(1, max_rank + 1):
+            for occupation in space.generate(rank):
+                if check_seen:
+                    if occupation in seen:
+                        continue
+                    seen.add(occupation)
+                if as_occupation:
+                    yield occupation
+                else:
+                    yield AtomicConfiguration.from_occupation(occupation)
+
+
+def count_excitations(
+    reference, orbitals=None, n_max=None, l_max=None, max_rank=2, donors=None
+):
+    """Count the configurations reachable from a reference by excitations.
+
+    The parameters are those of `excitations`. For a single reference, the
+    configurations are counted combinatorially, without generating them; for
+    several references, their distinct occupation vectors are generated and
+    counted.
+
+    Returns
+    -------
+    int
+    """
+    spaces = _spaces(reference, orbitals, n_max, l_max, donors)
+    if len(spaces) == 1:
+        return sum(spaces[0].count(rank) for rank in range(1, max_rank + 1))
+    return sum(
+        1
+        for _ in excitations(
+            reference,
+            orbitals,
+            n_max,
+            l_max,
+            max_rank=max_rank,
+            donors=donors,
+            as_occupation=True,
+        )
+    )
@@ -133,6 +133,11 @@ latex_prefix_dict = {
     "γ": r"\gamma",
 }
 
+# Cheap tests for strings which cannot be formulas: see Formula._may_parse.
+_formula_chars = re.compile(r"^[A-Za-z0-9()+\-.,·±ΔΛαβγ\s]+$")
+_upper_case = re.compile("[A-Z]")
+_lower_case_runs = re.compile("[a-z]{3,}")
+
 # also allow a comma-separated list of integers, e.g. 1,1,2-
 prefix_parser = pp.delimitedList(pp.OneOrMore(integer), combine=True)
 keys_list = list(prefix_tokens.keys())
@@ -245,6 +250,54 @@ class Formula:
         self.mass = 0.0
         self._parse_formula(formula)
 
+    @staticmethod
+    def _may_parse(formula):
+        """Return False if formula cannot possibly be parsed as a Formula.
+
+        This is a cheap test of the string, used by `try_parse` to skip a full
+        parse which would certainly fail: it must never reject a valid formula.
+        Apart from the special cases, a formula contains an element symbol (and so
+        an upper-case letter) and only the characters of the formula grammar, and
+        any run of three or more lower-case letters is a prefix, such as "cis-".
+        """
+        if formula in special_cases or formula == "e":
+            return True
+        if not _formula_chars.match(formula) or not _upper_case.search(formula):
+            return False
+        return all(
+            formula[match.end() : match.end() + 1] == "-"
+            for match in _lower_case_runs.finditer(formula)
+        )
+
+    @classmethod
+    def try_parse(cls, formula):
+        """Parse a formula string, or return None if it is not a valid formula.
+
+        Strings which cannot be formulas are rejected by a cheap test before the
+        (expensive) attempt to parse them.
+
+        Parameters
+        ----------
+        formula : str
+
+        Returns
+        -------
+        Formula or None
+
+        Examples
+        --------
+        >>> Formula.try_parse("H2O+")
+        H2O+
+        >>> Formula.try_parse("Argon") is None
+        True
+        """
+        if not formula or not cls._may_parse(formula):
+            return None
+        try:
+            return cls(formula)
+        except FormulaError:
+            return None
+
     @staticmethod
     def _make_prefix_html(prefix_list):
         """Make the prefix HTML: D- and L- prefixes get written in small caps"""
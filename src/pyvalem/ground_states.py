@@ -0,0 +1,313 @@
+"""
+This module provides the ground-state electronic configuration and term symbol of
+every element, Z = 1 - 118, in every ionization stage, looked up from a
+precomputed table by atomic number and charge or from a `Formula` such as
+``"Fe+13"`` or ``"W+42"``.
+
+The table, shipped as ``_data_ground_states.txt``, was generated by
+`generate_ground_states`:
+
+* The configuration of each neutral atom follows the Madelung (n + l, n) filling
+  order, with the exceptions listed in ``CONFIGURATION_EXCEPTIONS``.
+* The configuration of each ion is that of its neutral atom with electrons
+  removed from the subshells of highest n (and, for equal n, highest l) first:
+  4s before 3d, for example. This gives the ground configuration of most ions,
+  and of all highly-charged ions; the known exceptions among the near-neutral
+  ions, such as V+ (3d4), Ni+ (3d9), Y+ (5s2) and the lanthanide and actinide
+  ions, are also listed in ``CONFIGURATION_EXCEPTIONS``.
+* The ground term follows Hund's rules, applied to the terms of the open
+  subshells of the configuration (see `pyvalem.atomic_terms`): the greatest S,
+  then the greatest L, and J = |L - S| if the open subshells are at most half
+  filled, and J = L + S otherwise. The known exceptions are listed in
+  ``TERM_EXCEPTIONS``.
+
+Superheavy elements follow the same rules, though their ground states are largely
+unmeasured.
+
+Examples
+--------
+>>> from pyvalem.ground_states import ground_state
+>>> ground_state("Fe+13")
+GroundState(configuration=1s2.2s2.2p6.3s2.3p, term=2Po_1/2)
+>>> ground_state("W+42").configuration.state_str
+'[Ar].3d10.4s2.4p2'
+>>> ground_state(26, 0).term
+5D_4
+"""
+
+from collections import namedtuple
+import platform
+
+try:
+    import importlib.resources as pkg_resources
+except ImportError:
+    # for python < 3.7, use the importlib-resources backport
+    # noinspection PyUnresolvedReferences
+    import importlib_resources as pkg_resources
+
+from .atom_data import atoms
+from .atomic_terms import configuration_terms
+from .formula import Formula
+from .states.atomic_configuration import (
+    AtomicConfiguration,
+    _subshells,
+    subshell_index,
+)
+from .states.atomic_term_symbol import AtomicTermSymbol, atom_L_symbols
+
+PYTHON3_VERSION = int(platform.python_version_tuple()[1])
+
+Z_MAX = 118
+
+# The ground configurations which do not follow the rules used to generate the
+# table, keyed by (Z, charge).
+CONFIGURATION_EXCEPTIONS = {
+    (23, 1): "[Ar].3d4",
+    (24, 0): "[Ar].3d5.4s",
+    (27, 1): "[Ar].3d8",
+    (28, 1): "[Ar].3d9",
+    (29, 0): "[Ar].3d10.4s",
+    (39, 1): "[Kr].5s2",
+    (41, 0): "[Kr].4d4.5s",
+    (42, 0): "[Kr].4d5.5s",
+    (44, 0): "[Kr].4d7.5s",
+    (45, 0): "[Kr].4d8.5s",
+    (46, 0): "[Kr].4d10",
+    (47, 0): "[Kr].4d10.5s",
+    (57, 0): "[Xe].5d.6s2",
+    (57, 1): "[Xe].5d2",
+    (58, 0): "[Xe].4f.5d.6s2",
+    (58, 1): "[Xe].4f.5d2",
+    (58, 2): "[Xe].4f2",
+    (59, 1): "[Xe].4f3.6s",
+    (64, 0): "[Xe].4f7.5d.6s2",
+    (71, 1): "[Xe].4f14.6s2",
+    (71, 2): "[Xe].4f14.6s",
+    (72, 1): "[Xe].4f14.5d.6s2",
+    (78, 0): "[Xe].4f14.5d9.6s",
+    (79, 0): "[Xe].4f14.5d10.6s",
+    (89, 0): "[Rn].6d.7s2",
+    (89, 1): "[Rn].7s2",
+    (89, 2): "[Rn].7s",
+    (90, 0): "[Rn].6d2.7s2",
+    (90, 1): "[Rn].6d2.7s",
+    (90, 2): "[Rn].5f.6d",
+    (90, 3): "[Rn].5f",
+    (91, 0): "[Rn].5f2.6d.7s2",
+    (92, 0): "[Rn].5f3.6d.7s2",
+    (92, 1): "[Rn].5f3.7s2",
+    (93, 0): "[Rn].5f4.6d.7s2",
+    (96, 0): "[Rn].5f7.6d.7s2",
+    (103, 0): "[Rn].5f14.7s2.7p",
+}
+
+# The ground terms which do not follow Hund's rules, keyed by (Z, charge).
+TERM_EXCEPTIONS = {
+    (58, 0): "1Go_4",
+    (58, 1): "4Ho_7/2",
+}
+
+GroundState = namedtuple("GroundState", "configuration term")
+GroundState.__doc__ = """\
+The ground state of an atom or ion: its `AtomicConfiguration` and
+`AtomicTermSymbol`.
+"""
+
+
+class GroundStateError(Exception):
+    pass
+
+
+def _madelung_subshells():
+    """Return the subshells (n, l) up to 7p in the Madelung filling order."""
+    subshells = [(n, l) for n, l in _subshells(subshell_index(8, 0)) if l < 4]
+    return sorted(subshells, key=lambda nl: (nl[0] + nl[1], nl[0]))[:19]
+
+
+def _ground_occupation(Z, charge):
+    """Return the ground-state occupation vector of the ion (Z, charge) by the
+    rules described in the module documentation."""
+    occupation = [0] * subshell_index(8, 0)
+    if (Z, 0) in CONFIGURATION_EXCEPTIONS:
+        neutral = AtomicConfiguration(CONFIGURATION_EXCEPTIONS[Z, 0]).occupation
+        occupation[: len(neutral)] = neutral
+    else:
+        nelectrons = Z
+        for n, l in _madelung_subshells():
+            nocc = min(nelectrons, 4 * l + 2)
+            occupation[subshell_index(n, l)] = nocc
+            nelectrons -= nocc
+    # Ionize from the subshells of greatest n, then greatest l.
+    subshells = _subshells(len(occupation))
+    nremove = charge
+    for i in sorted(range(len(occupation)), key=subshells.__getitem__, reverse=True):
+        nocc = min(nremove, occupation[i])
+        occupation[i] -= nocc
+        nremove -= nocc
+    return bytes(occupation).rstrip(b"\0")
+
+
+def hund_ground_term(configuration):
+    """Return the ground term of a configuration predicted by Hund's rules.
+
+    Parameters
+    ----------
+    configuration : AtomicConfiguration or str
+
+    Returns
+    -------
+    AtomicTermSymbol
+        The term of greatest S and, among those, greatest L, with J = |L - S|
+        if the open subshells of the configuration are at most half filled, and
+        J = L + S otherwise.
+    """
+    if not isinstance(configuration, AtomicConfiguration):
+        configuration = AtomicConfiguration(configuration)
+    Smult, L = max(configuration_terms(configuration))
+    nopen = capacity = 0
+    for (n, l), nocc in zip(
+        _subshells(len(configuration.occupation)), configuration.occupation
+    ):
+        if 0 < nocc < 4 * l + 2:
+            nopen += nocc
+            capacity += 4 * l + 2
+    J2 = abs(2 * L - Smult + 1) if 2 * nopen <= capacity else 2 * L + Smult - 1
+    s_J = str(J2 // 2) if J2 % 2 == 0 else "{}/2".format(J2)
+    return AtomicTermSymbol(
+        "{}{}{}_{}".format(Smult, atom_L_symbols[L], configuration.parity or "", s_J)
+    )
+
+
+def generate_ground_states():
+    """Generate the ground states of all the elements and their ions.
+
+    This is the function used to generate the shipped table.
+
+    Yields
+    ------
+    tuple[int, int, str, str]
+        The atomic number, charge, and the ground configuration and term (as
+        strings) of each ion, for Z = 1 - 118 and charge = 0 - Z-1.
+    """
+    for Z in range(1, Z_MAX + 1):
+        for charge in range(Z):
+            configuration = CONFIGURATION_EXCEPTIONS.get((Z, charge))
+            if configuration is None:
+                configuration = AtomicConfiguration.from_occupation(
+                    _ground_occupation(Z, charge)
+                )
+            else:
+                configuration = AtomicConfiguration(configuration)
+            term = TERM_EXCEPTIONS.get((Z, charge))
+            if term is None:
+                term = repr(hund_ground_term(configuration))
+            yield Z, charge, configuration.state_str, term
+
+
+def read_ground_states(fi):
+    """Read the table of ground states from the open file fi.
+
+    Returns
+    -------
+    dict
+        The ground configuration and term strings of each ion, keyed by
+        (Z, charge).
+    """
+    table = {}
+    for line in fi:
+        if not line.strip() or line.startswith("Z,"):
+            continue
+        Z, charge, configuration, term = (field.strip() for field in line.split(","))
+        table[int(Z), int(charge)] = configuration, term
+    return table
+
+
+if PYTHON3_VERSION < 9:
+    # NB Python 3.8 and below use open_text:
+    with pkg_resources.open_text("pyvalem", "_data_ground_states.txt") as fi:
+        _ground_state_strings = read_ground_states(fi)
+else:
+    # NB Python 3.9 and above use importlib.resources.files:
+    with pkg_resources.files("pyvalem").joinpath("_data_ground_states.txt").open(
+        "r", encoding="utf8"
+    ) as fi:
+        _ground_state_strings = read_ground_states(fi)
+
+# The GroundState objects already looked up, keyed by (Z, charge).
+_ground_states = {}
+
+
+def _Z_and_charge(species, charge):
+    if isinstance(species, int):
+        return species, charge or 0
+    if isinstance(species, str) and charge is not None:
+        # An element symbol.
+        try:
+            return atoms[species].Z, charge
+        except KeyError:
+            raise GroundStateError("Unknown element: {}".format(species))
+    formula = species if isinstance(species, Formula) else Formula(species)
+    if formula.natoms != 1 or len(formula.atoms) != 1:
+        raise GroundStateError("{} is not an atom or atomic ion".format(formula))
+    return next(iter(formula.atoms)).Z, formula.charge
+
+
+def ground_state(species, charge=None):
+    """Return the ground state of an atom or atomic ion.
+
+    Parameters
+    ----------
+    species : Formula, str or int
+        The atom or ion, as a `Formula` or formula string (such as ``"Fe+13"``),
+        or its element symbol or atomic number (in which case its charge is
+        given by `charge`).
+    charge : int, optional
+        The charge of the ion given by element symbol or atomic number.
+
+    Returns
+    -------
+    GroundState
+
+    Raises
+    ------
+    GroundStateError
+        If the species is not an atom or a positive ion of an element with
+        Z = 1 - 118 (with at least one electron).
+    """
+    key = _Z_and_charge(species, charge)
+    try:
+        return _ground_states[key]
+    except KeyError:
+        pass
+    try:
+        s_configuration, s_term = _ground_state_strings[key]
+    except KeyError:
+        raise GroundStateError("No ground state for Z={}, charge={}".format(*key))
+    state = _ground_states[key] = GroundState(
+        AtomicConfiguration(s_configuration), AtomicTermSymbol(s_term)
+    )
+    return state
+
+
+def ground_configuration(species, charge=None):
+    """Return the ground configuration of an atom or atomic ion.
+
+    The parameters are those of `ground_state`.
+
+    Returns
+    -------
+    AtomicConfiguration
+    """
+    return ground_state(species, charge).configuration
+
+
+def ground_term(species, charge=None):
+    """Return the ground term symbol of an atom or atomic ion.
+
+    The parameters are those of `ground_state`.
+
+    Returns
+    -------
+    AtomicTermSymbol
+    """
+    return ground_state(species, charge).term
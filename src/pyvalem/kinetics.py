@@ -0,0 +1,244 @@
+"""
+This module contains the `KineticsRHS` class, which compiles a set of `Reaction`
+objects into a fast function for the right-hand side of the mass-action rate
+equations, dy/dt = f(t, y, k), and its Jacobian, for use with any ODE integrator.
+
+The rate of reaction j is r_j = k_j prod_i y_i^(a_ij), where a_ij is the
+stoichiometry of species i among the reactants of reaction j, and the rate of
+change of the concentration of species i is dy_i/dt = sum_j (b_ij - a_ij) r_j,
+where b_ij is its stoichiometry among the products. On compilation, these sums and
+products are reduced to integer index arrays so that each evaluation is a gather
+from y followed by a scatter into dy/dt, without any Python loop over reactions.
+
+Species are identified by their canonical ``repr``, so state-resolved species
+(e.g. ``"CO v=0"`` and ``"CO v=1"``) are distinct. Photons are not tracked by
+default; the third body, M, is an ordinary species whose concentration should be
+set to the total number density.
+
+This module requires NumPy; the sparse Jacobian also requires SciPy.
+
+Examples
+--------
+>>> import numpy as np
+>>> from pyvalem.reaction import Reaction
+>>> from pyvalem.kinetics import KineticsRHS
+>>> f = KineticsRHS([Reaction("H + H + M → H2 + M"), Reaction("H2 + hv → H + H")])
+>>> f.species
+['H', 'M', 'H2']
+>>> f(0, np.array([1.0, 10.0, 2.0]), np.array([0.5, 0.1]))
+array([-9.6,  0. ,  4.8])
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .stateful_species import StatefulSpecies
+
+
+class KineticsError(Exception):
+    pass
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required to compile the rate equations")
+
+
+class KineticsRHS:
+    """The compiled right-hand side of the rate equations for a set of reactions.
+
+    Instances are callable as ``f(t, y, k)``, returning dy/dt, where ``y`` is the
+    array of species concentrations, in the order of ``f.species``, and ``k`` the
+    array of rate coefficients, in the order of the reactions. The time, ``t``, is
+    unused but accepted for compatibility with ODE integrators (for example,
+    ``scipy.integrate.solve_ivp(f, t_span, y0, args=(k,), jac=f.jacobian)``).
+
+    Parameters
+    ----------
+    reactions : sequence of Reaction
+    species : sequence of StatefulSpecies or str, optional
+        The species, in the order of the elements of ``y``. By default, the
+        species are ordered by their first appearance in the reactions.
+    ignore : iterable of str, default=("hν",)
+        Species which are not tracked: they are left out of ``y`` and do not
+        contribute to the reaction rates.
+
+    Attributes
+    ----------
+    species : list of str
+        The canonical representations of the species, in the order of ``y``.
+    nspecies, nreactions : int
+
+    Raises
+    ------
+    KineticsError
+        If `species` is given but does not include a species of the reactions.
+    """
+
+    def __init__(self, reactions, species=None, ignore=("hν",)):
+        _require_numpy()
+        ignore = set(ignore)
+        self._species_ids = {}
+        self.species = []
+        if species is not None:
+            for ss in species:
+                if not isinstance(ss, StatefulSpecies):
+                    ss = StatefulSpecies(ss)
+                self._species_ids.setdefault(repr(ss), len(self._species_ids))
+            self.species = list(self._species_ids)
+
+        # Reactants, with each species repeated according to its stoichiometry.
+        reactant_ids = []
+        # Net stoichiometric coefficients as (species id, reaction id, coefficient).
+        net_species, net_reactions, net_coeffs = [], [], []
+        for j, reaction in enumerate(reactions):
+            net = {}
+            reactant_ids.append([])
+            for side, sign in ((reaction.reactants, -1), (reaction.products, 1)):
+                for n, ss in side:
+                    key = repr(ss)
+                    if key in ignore:
+                        continue
+                    i = self._species_id(key, species is None)
+                    net[i] = net.get(i, 0) + sign * n
+                    if sign < 0:
+                        reactant_ids[-1].extend([i] * n)
+            for i, coeff in net.items():
+                if coeff:
+                    net_species.append(i)
+                    net_reactions.append(j)
+                    net_coeffs.append(coeff)
+
+        self.nspecies = len(self.species)
+        self.nreactions = len(reactant_ids)
+        # A (reactions x max. order) array of reactant species ids, padded with
+        # the index of an extra element of value 1 appended to y.
+        order = max((len(ids) for ids in reactant_ids), default=0)
+        self.reactant_ids = np.full((self.nreactions, order), self.nspecies, dtype=int)
+        for j, ids in enumerate(reactant_ids):
+            self.reactant_ids[j, : len(ids)] = ids
+        self.net_species = np.array(net_species, dtype=int)
+        self.net_reactions = np.array(net_reactions, dtype=int)
+        self.net_coeffs = np.array(net_coeffs, dtype=float)
+        self._compile_jacobian()
+
+    def _species_id(self, key, add):
+        try:
+            return self._species_ids[key]
+        except KeyError:
+            if not add:
+                raise KineticsError("Species {} not in the species list".format(key))
+        i = self._species_ids[key] = len(self.species)
+        self.species.append(key)
+        return i
+
+    def species_index(self, species):
+        """Return the index of a species in ``y``.
+
+        Parameters
+        ----------
+        species : StatefulSpecies or str
+
+        Returns
+        -------
+        int
+        """
+        if not isinstance(species, StatefulSpecies):
+            species = StatefulSpecies(species)
+        try:
+            return self._species_ids[repr(species)]
+        except KeyError:
+            raise KineticsError("Unknown species: {}".format(species))
+
+    def _compile_jacobian(self):
+        """Precompute the sparsity pattern of the Jacobian and the index arrays
+        mapping each contribution to it onto the pattern."""
+        # Each nonzero contribution to the Jacobian, J[i, l] += nu_ij * dr_j/dy_l,
+        # comes from a net coefficient (i, j) and a reactant column c of
+        # reaction j with species l = reactant_ids[j, c].
+        order = self.reactant_ids.shape[1]
+        entries = np.repeat(np.arange(len(self.net_coeffs)), order)
+        columns = np.tile(np.arange(order), len(self.net_coeffs))
+        reaction = self.net_reactions[entries]
+        cols = self.reactant_ids[reaction, columns]
+        real = cols < self.nspecies
+        self._jac_entries, self._jac_reactions = entries[real], reaction[real]
+        self._jac_columns = columns[real]
+        rows = self.net_species[self._jac_entries]
+        cols = cols[real]
+        pattern, self._jac_map = np.unique(
+            rows * self.nspecies + cols, return_inverse=True
+        )
+        self._jac_map = self._jac_map.ravel()
+        self.jacobian_rows = pattern // max(self.nspecies, 1)
+        self.jacobian_cols = pattern % max(self.nspecies, 1)
+
+    def rates(self, y, k):
+        """Return the rate of each reaction, r_j = k_j prod_i y_i^(a_ij).
+
+        Parameters
+        ----------
+        y : ndarray
+            The species concentrations.
+        k : ndarray
+            The rate coefficients.
+
+        Returns
+        -------
+        ndarray
+        """
+        y1 = np.append(y, 1.0)
+        return k * y1[self.reactant_ids].prod(axis=1)
+
+    def __call__(self, t, y, k):
+        """Return dy/dt for concentrations y and rate coefficients k."""
+        r = self.rates(y, k)
+        return np.bincount(
+            self.net_species,
+            weights=self.net_coeffs * r[self.net_reactions],
+            minlength=self.nspecies,
+        )
+
+    def jacobian_data(self, t, y, k):
+        """Return the values of the nonzero Jacobian elements, d(dy_i/dt)/dy_l.
+
+        The values are in the order of the sparsity pattern given by the
+        ``jacobian_rows`` and ``jacobian_cols`` attributes.
+
+        Returns
+        -------
+        ndarray
+        """
+        y1 = np.append(y, 1.0)
+        factors = y1[self.reactant_ids]
+        # The derivative of the product of each row of factors with respect to
+        # each of its elements is the product of all the others: form it from
+        # the cumulative products from the left and from the right.
+        ones = np.ones((self.nreactions, 1))
+        left = np.cumprod(np.hstack((ones, factors[:, :-1])), axis=1)
+        right = np.cumprod(np.hstack((ones, factors[:, :0:-1])), axis=1)[:, ::-1]
+        partials = k[:, None] * left * right
+        contributions = (
+            self.net_coeffs[self._jac_entries]
+            * partials[self._jac_reactions, self._jac_columns]
+        )
+        return np.bincount(
+            self._jac_map, weights=contributions, minlength=len(self.jacobian_rows)
+        )
+
+    def jacobian(self, t, y, k):
+        """Return the Jacobian of dy/dt with respect to y as a dense array."""
+        J = np.zeros((self.nspecies, self.nspecies))
+        J[self.jacobian_rows, self.jacobian_cols] = self.jacobian_data(t, y, k)
+        return J
+
+    def jacobian_sparse(self, t, y, k):
+        """Return the Jacobian of dy/dt with respect to y as a SciPy CSR matrix."""
+        from scipy.sparse import csr_matrix
+
+        return csr_matrix(
+            (self.jacobian_data(t, y, k), (self.jacobian_rows, self.jacobian_cols)),
+            shape=(self.nspecies, self.nspecies),
+        )
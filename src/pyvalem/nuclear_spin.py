@@ -0,0 +1,334 @@
+"""
+This module provides the nuclear spins of the stable isotopes of the lighter
+elements (and a few others, such as 3H), looked up from a precomputed table, and
+the nuclear-spin statistics of the rotational levels of homonuclear diatomic
+molecules, such as H2, D2, (14N)2 and (16O)2, identified from their `Formula`.
+
+For two identical nuclei of spin I, (I + 1)(2I + 1) of the (2I + 1)**2
+nuclear-spin states are symmetric under the exchange of the nuclei and I(2I + 1)
+are antisymmetric. The total wavefunction must be symmetric for bosons (integer I)
+and antisymmetric for fermions (half-integer I), so that each rotational level can
+only combine with the nuclear-spin states of one symmetry. For a Σg+ (or Σu-)
+electronic state the even-J levels are symmetric under the exchange and the odd-J
+levels antisymmetric; this is reversed for Σg- and Σu+ states, and each J level
+of a state with Λ > 0 has one Λ-doublet component of either symmetry. For a Σ
+state with S > 0 the symmetry follows the rotational quantum number N rather
+than J (the J = 2 levels of O2 X(3Σg-) have N = 1 and 3), so its levels, given
+by a `RotationalState` J, are assigned no nuclear-spin weight or label.
+
+The levels combining with the (more numerous) symmetric nuclear-spin states are
+labelled "ortho", and the others "para"; there is no such distinction for
+nuclei with I = 0, whose molecules only have the levels of one symmetry.
+
+The nuclear-spin weights of each formula are cached, and evaluated for whole
+arrays of rotational levels at once by `nuclear_spin_factors` and
+`spin_isomers`, which require NumPy. They may be included in the statistical
+weights of levels by passing ``nuclear_spin_weights=True`` to the functions of
+`pyvalem.statistical_weights`.
+
+Elements given without a mass number, as in "H2" or "N2", are taken to be their
+most abundant isotope.
+
+Examples
+--------
+>>> from pyvalem.nuclear_spin import nuclear_spin, nuclear_spin_weights, spin_isomer
+>>> nuclear_spin("14N")
+1.0
+>>> nuclear_spin_weights("H2")
+NuclearSpinWeights(even=1, odd=3)
+>>> nuclear_spin_weights("D2")
+NuclearSpinWeights(even=6, odd=3)
+>>> nuclear_spin_weights("HD") is None
+True
+>>> spin_isomer("H2 X(1SIGMA+g);v=0;J=1")
+'ortho'
+>>> spin_isomer("D2 X(1SIGMA+g);v=0;J=1")
+'para'
+"""
+
+from collections import namedtuple
+from fractions import Fraction
+from functools import lru_cache
+import platform
+
+try:
+    import importlib.resources as pkg_resources
+except ImportError:
+    # for python < 3.7, use the importlib-resources backport
+    # noinspection PyUnresolvedReferences
+    import importlib_resources as pkg_resources
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .formula import Formula
+from .stateful_species import StatefulSpecies
+from .states import MolecularTermSymbol, RotationalState
+
+PYTHON3_VERSION = int(platform.python_version_tuple()[1])
+
+NuclearSpinWeights = namedtuple("NuclearSpinWeights", "even odd")
+
+
+class NuclearSpinError(Exception):
+    pass
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for the evaluation of arrays of levels")
+
+
+def read_nuclear_spins(fi):
+    """Read the table of nuclear spins from the open file fi.
+
+    Returns
+    -------
+    tuple of dict
+        The nuclear spin of each isotope, keyed by isotope symbol (e.g.
+        ``"14N"``), and the symbol of the most abundant isotope of each element,
+        keyed by element symbol.
+    """
+    spins, principal_isotopes = {}, {}
+    for line in fi:
+        if not line.strip() or line.startswith("Z,"):
+            continue
+        Z, A, symbol, spin, principal = (field.strip() for field in line.split(","))
+        isotope_symbol = A + symbol
+        spins[isotope_symbol] = float(Fraction(spin))
+        if principal:
+            principal_isotopes[symbol] = isotope_symbol
+    return spins, principal_isotopes
+
+
+if PYTHON3_VERSION < 9:
+    # NB Python 3.8 and below use open_text:
+    with pkg_resources.open_text("pyvalem", "_data_nuclear_spins.txt") as fi:
+        nuclear_spins, principal_isotopes = read_nuclear_spins(fi)
+else:
+    # NB Python 3.9 and above use importlib.resources.files:
+    with pkg_resources.files("pyvalem").joinpath("_data_nuclear_spins.txt").open(
+        "r", encoding="utf8"
+    ) as fi:
+        nuclear_spins, principal_isotopes = read_nuclear_spins(fi)
+
+
+def nuclear_spin(symbol):
+    """Return the nuclear spin of an isotope.
+
+    Parameters
+    ----------
+    symbol : str or Atom
+        The isotope, such as ``"14N"``, or an element, such as ``"N"``, for its
+        most abundant isotope.
+
+    Returns
+    -------
+    float
+
+    Raises
+    ------
+    NuclearSpinError
+        If the nuclear spin of the isotope is not tabulated.
+    """
+    symbol = str(symbol)
+    try:
+        return nuclear_spins[principal_isotopes.get(symbol, symbol)]
+    except KeyError:
+        raise NuclearSpinError("No nuclear spin is tabulated for {}".format(symbol))
+
+
+@lru_cache(maxsize=None)
+def _nuclear_spin_weights(formula):
+    formula = Formula(formula)
+    if formula.natoms != 2 or len(formula.atom_stoich) != 1:
+        return None
+    (symbol,) = formula.atom_stoich
+    I = nuclear_spin(symbol)
+    n = int(round(2 * I)) + 1
+    symmetric, antisymmetric = n * (n + 1) // 2, n * (n - 1) // 2
+    if n % 2:
+        # Bosons: the nuclear-spin states of either symmetry combine with the
+        # rotational levels of the same symmetry.
+        return NuclearSpinWeights(symmetric, antisymmetric)
+    return NuclearSpinWeights(antisymmetric, symmetric)
+
+
+def nuclear_spin_weights(formula):
+    """Return the nuclear-spin weights of the rotational levels of a homonuclear
+    diatomic molecule.
+
+    The result is cached for each formula.
+
+    Parameters
+    ----------
+    formula : Formula or str
+
+    Returns
+    -------
+    NuclearSpinWeights or None
+        The nuclear-spin weights of the even and odd J levels of a Σg+ state, or
+        None if the formula is not of a homonuclear diatomic molecule.
+
+    Raises
+    ------
+    NuclearSpinError
+        If the nuclear spin of the isotope is not tabulated.
+    """
+    return _nuclear_spin_weights(
+        repr(formula) if isinstance(formula, Formula) else formula
+    )
+
+
+# The value of _reversed_symmetry for a state with Λ > 0, each of whose levels
+# has a Λ-doublet component of either symmetry.
+_LAMBDA_DOUBLED = "Λ-doubled"
+
+
+def _reversed_symmetry(term):
+    """Are the even-J levels of the electronic state term (a MolecularTermSymbol,
+    or None for a 1Σg+ state) antisymmetric under the exchange of the nuclei?
+
+    Returns _LAMBDA_DOUBLED for a state with Λ > 0, and None if the symmetry is not
+    determined by J: for a Σ state with S > 0 it depends on N, which is not given
+    by a RotationalState."""
+    if term is None:
+        return False
+    irrep = term.irrep
+    if irrep[0] not in "ΣΠΔΦΓ":
+        return None
+    if irrep[0] != "Σ":
+        return _LAMBDA_DOUBLED
+    if term.Smult != 1:
+        return None
+    return ("-" in irrep) != (irrep[-1] == "u")
+
+
+def _symmetric(term, J):
+    """Is the rotational level J of the electronic state term symmetric under the
+    exchange of the nuclei? None if this is not determined (or if the level has
+    components of both symmetries)."""
+    reversed_symmetry = _reversed_symmetry(term)
+    if reversed_symmetry in (None, _LAMBDA_DOUBLED) or J is None or J != int(J):
+        return None
+    return (int(J) % 2 == 0) != reversed_symmetry
+
+
+def _molecular_term(term):
+    if term is None or isinstance(term, MolecularTermSymbol):
+        return term
+    return MolecularTermSymbol(term)
+
+
+def spin_isomer(species):
+    """Return the nuclear-spin isomer of a level of a homonuclear diatomic
+    molecule.
+
+    Parameters
+    ----------
+    species : StatefulSpecies or str
+        A rotational level, such as ``"H2 X(1SIGMA+g);v=0;J=1"``; the electronic
+        state is taken to be 1Σg+ if it is not specified.
+
+    Returns
+    -------
+    str or None
+        ``"ortho"`` or ``"para"``, or None if the species is not a homonuclear
+        diatomic molecule of non-zero nuclear spin, or its rotational level (or its
+        symmetry) is not specified: as for the levels of states with Λ > 0, which
+        have components of both symmetries, and of Σ states with S > 0.
+    """
+    if not isinstance(species, StatefulSpecies):
+        species = StatefulSpecies(species)
+    weights = nuclear_spin_weights(species.formula)
+    if weights is None or not min(weights):
+        return None
+    term = J = None
+    for state in species.states:
+        if isinstance(state, MolecularTermSymbol):
+            term = state
+        elif isinstance(state, RotationalState):
+            J = state.J
+    symmetric = _symmetric(term, J)
+    if symmetric is None:
+        return None
+    weight = weights.even if symmetric else weights.odd
+    return "ortho" if weight == max(weights) else "para"
+
+
+def _symmetric_levels(formula, J, term):
+    """Return the weights of formula and, for an array of rotational levels J of the
+    electronic state term, a boolean array of their symmetry, or _LAMBDA_DOUBLED or
+    None as for _reversed_symmetry."""
+    _require_numpy()
+    weights = nuclear_spin_weights(formula)
+    J = np.asarray(J, dtype=float)
+    reversed_symmetry = _reversed_symmetry(_molecular_term(term))
+    if reversed_symmetry in (None, _LAMBDA_DOUBLED):
+        return weights, J, reversed_symmetry
+    return weights, J, (J % 2 == 0) != reversed_symmetry
+
+
+def nuclear_spin_factors(formula, J, term=None):
+    """Return the nuclear-spin weights of many rotational levels of a molecule.
+
+    Parameters
+    ----------
+    formula : Formula or str
+    J : array_like
+        The rotational quantum numbers of the levels.
+    term : MolecularTermSymbol or str, optional
+        The electronic state of the levels, 1Σg+ by default.
+
+    Returns
+    -------
+    numpy.ndarray of float
+        The nuclear-spin weight of each level: the mean of the weights of the two
+        Λ-doublet components of each J of a state with Λ > 0, and 1 where the
+        weight is not determined: if the molecule is not homonuclear, J is
+        half-integer or the state is a Σ state with S > 0.
+
+    Raises
+    ------
+    NuclearSpinError
+        If the nuclear spin of the isotope of a homonuclear diatomic molecule is
+        not tabulated.
+    """
+    weights, J, symmetric = _symmetric_levels(formula, J, term)
+    if weights is None or symmetric is None:
+        return np.ones(J.shape)
+    if symmetric is _LAMBDA_DOUBLED:
+        return np.full(J.shape, (weights.even + weights.odd) / 2)
+    factors = np.where(symmetric, weights.even, weights.odd).astype(float)
+    factors[J % 1 != 0] = 1
+    return factors
+
+
+def spin_isomers(formula, J, term=None):
+    """Return the nuclear-spin isomers of many rotational levels of a molecule.
+
+    Parameters
+    ----------
+    formula, J, term
+        As for `nuclear_spin_factors`.
+
+    Returns
+    -------
+    numpy.ndarray of str
+        ``"ortho"`` or ``"para"`` for each level, or the empty string where this
+        is not defined, as for `spin_isomer`.
+    """
+    weights, J, symmetric = _symmetric_levels(formula, J, term)
+    if (
+        weights is None
+        or symmetric is None
+        or symmetric is _LAMBDA_DOUBLED
+        or not min(weights)
+    ):
+        return np.full(J.shape, "", dtype="<U5")
+    ortho = symmetric == (weights.even > weights.odd)
+    isomers = np.where(ortho, "ortho", "para")
+    isomers[J % 1 != 0] = ""
+    return isomers
@@ -0,0 +1,313 @@
+"""
+This module contains classes representing the temperature dependence of reaction
+rate coefficients, and the `RateEvaluator` class for evaluating the rate
+coefficients of many reactions at once over a grid of temperatures.
+
+A rate law may be attached to a `Reaction` through its ``rate`` attribute (or the
+``rate`` argument to its constructor). The rate laws implemented are:
+
+``Arrhenius(A, Ea)``
+    k(T) = A exp(-Ea / T)
+``ModifiedArrhenius(A, n, Ea, T0=300)``
+    k(T) = A (T / T0)^n exp(-Ea / T)
+``TabulatedRate(T, k)``
+    k(T) interpolated from a table of values, in log-log space by default.
+
+Temperatures are in K, and activation energies, Ea, are given as temperatures
+(that is, in units of K, divided by the Boltzmann constant). The units of A and k
+are up to the user, but must be consistent across the reactions of a network.
+
+The vectorized evaluation of rate coefficients requires NumPy.
+
+Examples
+--------
+>>> import numpy as np
+>>> from pyvalem.reaction import Reaction
+>>> from pyvalem.rates import Arrhenius, ModifiedArrhenius, RateEvaluator
+>>> reactions = [
+...     Reaction("O + H2 → OH + H", rate=Arrhenius(3.44e-13, 4000)),
+...     Reaction("H + O2 → OH + O", rate=ModifiedArrhenius(3.3e-10, 0, 8460)),
+... ]
+>>> k = RateEvaluator(reactions)(np.array([1000.0, 2000.0]))
+>>> k.shape
+(2, 2)
+>>> print(np.array2string(k, precision=3))
+[[6.301e-15 4.656e-14]
+ [6.988e-14 4.802e-12]]
+"""
+
+from abc import ABC, abstractmethod
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class RateLawError(Exception):
+    pass
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for the evaluation of rate coefficients")
+
+
+class RateLaw(ABC):
+    """An abstract base class for the temperature dependence of a rate
+    coefficient."""
+
+    @abstractmethod
+    def __call__(self, T):
+        """Evaluate the rate coefficient at temperature(s) T.
+
+        Parameters
+        ----------
+        T : float or array_like
+
+        Returns
+        -------
+        float or ndarray
+        """
+        raise NotImplementedError
+
+
+class ModifiedArrhenius(RateLaw):
+    """A modified Arrhenius rate law, k(T) = A (T / T0)^n exp(-Ea / T).
+
+    Parameters
+    ----------
+    A : float
+        The pre-exponential factor.
+    n : float
+        The temperature exponent.
+    Ea : float
+        The activation energy, in K.
+    T0 : float, default=300
+        The reference temperature, in K.
+    """
+
+    def __init__(self, A, n, Ea, T0=300):
+        self.A = A
+        self.n = n
+        self.Ea = Ea
+        self.T0 = T0
+
+    def __call__(self, T):
+        _require_numpy()
+        T = np.asarray(T, dtype=float)
+        return self.A * (T / self.T0) ** self.n * np.exp(-self.Ea / T)
+
+    def __repr__(self):
+        return "ModifiedArrhenius(A={}, n={}, Ea={}, T0={})".format(
+            self.A, self.n, self.Ea, self.T0
+        )
+
+
+class Arrhenius(ModifiedArrhenius):
+    """An Arrhenius rate law, k(T) = A exp(-Ea / T).
+
+    Parameters
+    ----------
+    A : float
+        The pre-exponential factor.
+    Ea : float
+        The activation energy, in K.
+    """
+
+    def __init__(self, A, Ea):
+        super().__init__(A, 0, Ea)
+
+    def __repr__(self):
+        return "Arrhenius(A={}, Ea={})".format(self.A, self.Ea)
+
+
+class TabulatedRate(RateLaw):
+    """A rate coefficient interpolated from a table of values.
+
+    Outside the range of the table, the rate coefficient is taken to be constant,
+    equal to its value at the nearest tabulated temperature.
+
+    Parameters
+    ----------
+    T : sequence of float
+        The tabulated temperatures, in K, in strictly increasing order.
+    k : sequence of float
+        The rate coefficients at these temperatures.
+    loglog : bool, default=True
+        If ``True``, interpolate linearly in (log T, log k); in this case all the
+        values of T and k must be positive. Otherwise, interpolate linearly in
+        (T, k).
+
+    Raises
+    ------
+    RateLawError
+        If the table is invalid.
+    """
+
+    def __init__(self, T, k, loglog=True):
+        _require_numpy()
+        self.T = np.array(T, dtype=float)
+        self.k = np.array(k, dtype=float)
+        self.loglog = loglog
+        if self.T.ndim != 1 or self.T.shape != self.k.shape or len(self.T) < 2:
+            raise RateLawError(
+                "Tabulated rates need matching one-dimensional arrays of at least"
+                " two temperatures and rate coefficients"
+            )
+        if np.any(np.diff(self.T) <= 0):
+            raise RateLawError("Tabulated temperatures must be strictly increasing")
+        if loglog and (np.any(self.T <= 0) or np.any(self.k <= 0)):
+            raise RateLawError(
+                "Tabulated temperatures and rate coefficients must be positive for"
+                " log-log interpolation"
+            )
+
+    def __call__(self, T):
+        T = np.asarray(T, dtype=float)
+        if self.loglog:
+            return np.exp(np.interp(np.log(T), np.log(self.T), np.log(self.k)))
+        return np.interp(T, self.T, self.k)
+
+    def __repr__(self):
+        return "TabulatedRate({} points, {:g}-{:g} K)".format(
+            len(self.T), self.T[0], self.T[-1]
+        )
+
+
+class _TableGroup:
+    """Tabulated rates sharing the same interpolation space, concatenated so that
+    they can be interpolated together with a single call to np.searchsorted.
+
+    The abscissae of the tables are shifted so that each table lies entirely
+    above the one before it: the (shifted) query point for row i can then only
+    ever be located within the (shifted) table i.
+    """
+
+    def __init__(self, rows, tables, loglog):
+        self.rows = np.array(rows, dtype=int)
+        self.loglog = loglog
+        x = [np.log(t.T) if loglog else t.T for t in tables]
+        y = [np.log(t.k) if loglog else t.k for t in tables]
+        lengths = np.array([len(xi) for xi in x])
+        self.start = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        self.stop = self.start + lengths
+        self.xmin = np.array([xi[0] for xi in x])
+        self.xmax = np.array([xi[-1] for xi in x])
+        self.x = np.concatenate(x)
+        self.y = np.concatenate(y)
+        span = self.x.max() - self.x.min() + 1
+        self.shift = np.arange(len(tables)) * span
+        self.xshifted = self.x + np.repeat(self.shift, lengths)
+
+    def __call__(self, T):
+        x = np.log(T) if self.loglog else T
+        x = np.clip(x[None, :], self.xmin[:, None], self.xmax[:, None])
+        i = np.searchsorted(self.xshifted, x + self.shift[:, None], side="right") - 1
+        i = np.clip(i, self.start[:, None], self.stop[:, None] - 2)
+        x0, x1 = self.x[i], self.x[i + 1]
+        y0, y1 = self.y[i], self.y[i + 1]
+        y = y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+        return np.exp(y) if self.loglog else y
+
+
+class RateEvaluator:
+    """Evaluate the rate coefficients of a list of reactions over temperature grids.
+
+    On instantiation, the rate-law parameters of all the reactions are gathered
+    into arrays, so that each evaluation is a handful of array operations over the
+    whole network rather than a Python call per reaction. Rate laws of other
+    `RateLaw` subclasses are evaluated by calling them, one reaction at a time.
+
+    Parameters
+    ----------
+    reactions : sequence of Reaction
+        The reactions, each with its rate law as its ``rate`` attribute. The rate
+        coefficients of reactions without a rate law (``rate = None``) evaluate
+        to NaN.
+
+    Raises
+    ------
+    RateLawError
+        If a reaction has a rate law which is not a `RateLaw`.
+    """
+
+    def __init__(self, reactions):
+        _require_numpy()
+        self.nreactions = len(reactions)
+        arrhenius_rows, arrhenius_params = [], []
+        tabulated = {True: ([], []), False: ([], [])}
+        self.other_rates = []
+        for i, reaction in enumerate(reactions):
+            rate = reaction.rate
+            if rate is None:
+                continue
+            if isinstance(rate, ModifiedArrhenius):
+                arrhenius_rows.append(i)
+                arrhenius_params.append((rate.A, rate.n, rate.Ea, rate.T0))
+            elif isinstance(rate, TabulatedRate):
+                rows, tables = tabulated[rate.loglog]
+                rows.append(i)
+                tables.append(rate)
+            elif isinstance(rate, RateLaw):
+                self.other_rates.append((i, rate))
+            else:
+                raise RateLawError(
+                    "Unsupported rate law for reaction {}: {}".format(reaction, rate)
+                )
+
+        self.arrhenius_rows = np.array(arrhenius_rows, dtype=int)
+        params = np.array(arrhenius_params, dtype=float).reshape(-1, 4)
+        self.A, self.n, self.Ea, self.T0 = (p[:, None] for p in params.T)
+        self.table_groups = [
+            _TableGroup(rows, tables, loglog)
+            for loglog, (rows, tables) in tabulated.items()
+            if rows
+        ]
+
+    def __call__(self, T):
+        """Evaluate all the rate coefficients at the temperatures T.
+
+        Parameters
+        ----------
+        T : float or array_like
+            Temperature(s), in K.
+
+        Returns
+        -------
+        ndarray
+            The rate coefficients, with shape (number of reactions, number of
+            temperatures).
+        """
+        T = np.atleast_1d(np.asarray(T, dtype=float))
+        k = np.full((self.nreactions, len(T)), np.nan)
+        if len(self.arrhenius_rows):
+            k[self.arrhenius_rows] = (
+                self.A * (T / self.T0) ** self.n * np.exp(-self.Ea / T)
+            )
+        for group in self.table_groups:
+            k[group.rows] = group(T)
+        for i, rate in self.other_rates:
+            k[i] = rate(T)
+        return k
+
+
+def evaluate_rates(reactions, T):
+    """Evaluate the rate coefficients of a list of reactions at temperatures T.
+
+    This is a convenience function for a single use of `RateEvaluator`; to evaluate
+    the rate coefficients of the same reactions repeatedly, create and keep the
+    `RateEvaluator` instead.
+
+    Parameters
+    ----------
+    reactions : sequence of Reaction
+    T : float or array_like
+
+    Returns
+    -------
+    ndarray
+        The rate coefficients, with shape (number of reactions, number of
+        temperatures).
+    """
+    return RateEvaluator(reactions)(T)
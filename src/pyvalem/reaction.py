@@ -28,10 +28,15 @@ hν + HCl → H+ + Cl + e-
 'C6H5OH + O2 + O2 + O2 + O2 + O2 + O2 + O2 → CO2 + CO2 + CO2 + CO2 + CO2 + CO2 + H2O + H2O + H2O'
 """
 
+import copy
+import html
+import itertools
 import re
+from collections import OrderedDict, deque, namedtuple
 
 from .formula import FormulaParseError
-from .stateful_species import StatefulSpecies
+from .stateful_species import StatefulSpecies, StatefulSpeciesError
+from .states import StateParseError
 
 
 class ReactionParseError(Exception):
@@ -68,6 +73,9 @@ class Reaction:
     strict : bool, default=True
         If ``strict=False``, the stoichiometry and charge balance is not enforced.
         This is intended for incomplete or ambiguous reactions.
+    rate : RateLaw, optional
+        The temperature dependence of the reaction's rate coefficient, for example
+        an ``Arrhenius`` instance from the `pyvalem.rates` module.
 
     Attributes
     ----------
@@ -75,6 +83,7 @@ class Reaction:
         Aggregated `StatefulSpecies` instances with their stoichiometries
     products : list of tuple[int, StatefulSpecies]
         Aggregated `StatefulSpecies` instances with their stoichiometries
+    rate : RateLaw or None
     html
     latex
 
@@ -152,7 +161,9 @@ class Reaction:
 
     light_species = ("e-", "e+", "hv", "hν")
 
-    def __init__(self, r_str, strict=True):
+    def __init__(self, r_str, strict=True, rate=None):
+        self.rate = rate
+
         # If the Reaction string has no products, add a space after the
         # separator (e.g. 'Ar + e- ->' becomes 'Ar + e- -> ').
         for sep in Reaction.RP_SEPARATORS:
@@ -350,25 +361,129 @@ class Reaction:
         )
         return "{} {} {}".format(reactants_str, self.sep, products_str).strip()
 
+    def _side_repr(self, terms, side):
+        """Canonicalised representation of one side of the reaction."""
+        terms = self._sort_terms(terms, side=side)
+        terms = self._aggregate_terms(terms)
+        terms = self._expand_terms(terms)
+        return " + ".join("{}{}".format(self._silent_n(n), repr(ss)) for n, ss in terms)
+
+    def canonical_sides(self, reverse=False):
+        """Return the canonicalised representations of both sides of the reaction.
+
+        These are the reactants and products parts of ``repr(reaction)``, without
+        the side separator, and are suitable for use as hashable keys identifying
+        the reaction irrespective of its direction (``"→"`` or ``"⇌"``).
+
+        Parameters
+        ----------
+        reverse : bool, default=False
+            If ``True``, return the sides of the *reverse* reaction, as though the
+            reactants and products were swapped.
+
+        Returns
+        -------
+        tuple of str
+            The canonicalised (LHS, RHS) representations.
+
+        Examples
+        --------
+        >>> r = Reaction("H+ + 2e- → H + e-")
+        >>> r.canonical_sides()
+        ('2e- + H+', 'H + e-')
+        >>> r.canonical_sides(reverse=True)
+        ('e- + H', 'H+ + 2e-')
+        """
+        reactants, products = self.reactants, self.products
+        if reverse:
+            reactants, products = products, reactants
+        return self._side_repr(reactants, "lhs"), self._side_repr(products, "rhs")
+
+    def reversed(self):
+        """Return the reverse `Reaction`, with reactants and products swapped.
+
+        The separator is unchanged, and the species are not re-parsed. Any rate law
+        attached to this reaction does not apply to its reverse, and so is not
+        copied.
+
+        Returns
+        -------
+        Reaction
+
+        Examples
+        --------
+        >>> Reaction("CO v=1 + O2 → CO2 + O").reversed()
+        CO2 + O → CO v=1 + O2
+        """
+        reaction = copy.copy(self)
+        reaction.reactants, reaction.products = self.products, self.reactants
+        reaction.reactants_text_count_map = self.products_text_count_map
+        reaction.products_text_count_map = self.reactants_text_count_map
+        reaction.rate = None
+        return reaction
+
+    @classmethod
+    def from_species(cls, reactants, products, sep="→", strict=True, rate=None):
+        """Create a `Reaction` from already-parsed species, without a reaction string.
+
+        Parameters
+        ----------
+        reactants, products : iterable of StatefulSpecies or tuple[int, StatefulSpecies]
+            The species on each side of the reaction, optionally with their
+            stoichiometries.
+        sep : str, default="→"
+            Any of the reactant-product separators accepted by the constructor.
+        strict : bool, default=True
+            As for the constructor.
+        rate : RateLaw, optional
+            As for the constructor.
+
+        Returns
+        -------
+        Reaction
+
+        Examples
+        --------
+        >>> from pyvalem.stateful_species import StatefulSpecies
+        >>> H, H2 = StatefulSpecies("H"), StatefulSpecies("H2 v=1")
+        >>> print(Reaction.from_species([(2, H)], [H2]))
+        2H → H2 v=1
+        """
+        reaction = cls.__new__(cls)
+        reaction.rate = rate
+        try:
+            reaction.sep = cls.canonical_separators[sep]
+        except KeyError:
+            raise ReactionParseError("Invalid reactant-product separator: " + sep)
+        reaction.reactants, reaction.products = [], []
+        reaction.reactants_text_count_map, reaction.products_text_count_map = {}, {}
+        for terms, side, species_map in (
+            (reactants, reaction.reactants, reaction.reactants_text_count_map),
+            (products, reaction.products, reaction.products_text_count_map),
+        ):
+            for term in terms:
+                n, ss = term if isinstance(term, tuple) else (1, term)
+                side.append((n, ss))
+                ss_str = str(ss)
+                species_map[ss_str] = species_map.get(ss_str, 0) + n
+
+        if strict and not reaction.stoichiometry_conserved():
+            raise ReactionStoichiometryError(
+                "Stoichiometry not preserved for reaction: {}".format(reaction)
+            )
+        if strict and not reaction.charge_conserved():
+            raise ReactionChargeError(
+                "Charge not preserved for reaction: {}".format(reaction)
+            )
+        return reaction
+
     def __repr__(self):
         """
         Performs canonicalisation of the reaction string by expanding
         aggregated stoichiometries of all the heavy species and by aggregating
         light species (e, hv) and moving them to the side.
         """
-        reactants = self._sort_terms(self.reactants, side="lhs")
-        products = self._sort_terms(self.products, side="rhs")
-        reactants = self._aggregate_terms(reactants)
-        products = self._aggregate_terms(products)
-        reactants = self._expand_terms(reactants)
-        products = self._expand_terms(products)
-
-        reactants_repr = " + ".join(
-            "{}{}".format(self._silent_n(n), repr(ss)) for n, ss in reactants
-        )
-        products_repr = " + ".join(
-            "{}{}".format(self._silent_n(n), repr(ss)) for n, ss in products
-        )
+        reactants_repr, products_repr = self.canonical_sides()
         return "{} {} {}".format(reactants_repr, self.sep, products_repr).strip()
 
     @staticmethod
@@ -413,6 +528,22 @@ class Reaction:
     def __eq__(self, other):
         return repr(self) == repr(other)
 
+    def __hash__(self):
+        return hash(repr(self))
+
+    def _render(self, render_species, sep):
+        """Render the reaction with the function render_species(ss) for each
+        StatefulSpecies and the side separator sep."""
+        reactants = " + ".join(
+            "{}{}".format(self._silent_n(n), render_species(ss))
+            for n, ss in self.reactants
+        )
+        products = " + ".join(
+            "{}{}".format(self._silent_n(n), render_species(ss))
+            for n, ss in self.products
+        )
+        return "{} {} {}".format(reactants, sep, products).strip()
+
     @property
     def html(self):
         """HTML representation of the `Reaction` instance.
@@ -421,13 +552,7 @@ class Reaction:
         -------
         str
         """
-        reactants_html = " + ".join(
-            "{}{}".format(self._silent_n(n), ss.html) for n, ss in self.reactants
-        )
-        products_html = " + ".join(
-            "{}{}".format(self._silent_n(n), ss.html) for n, ss in self.products
-        )
-        return "{} {} {}".format(reactants_html, self.sep, products_html).strip()
+        return self._render(lambda ss: ss.html, self.sep)
 
     @property
     def latex(self):
@@ -437,12 +562,197 @@ class Reaction:
         -------
         str
         """
-        reactants_latex = " + ".join(
-            "{}{}".format(self._silent_n(n), ss.latex) for n, ss in self.reactants
-        )
-        products_latex = " + ".join(
-            "{}{}".format(self._silent_n(n), ss.latex) for n, ss in self.products
-        )
-        return "{} {} {}".format(
-            reactants_latex, self.latex_sep[self.sep], products_latex
-        ).strip()
+        return self._render(lambda ss: ss.latex, self.latex_sep[self.sep])
+
+
+ReactionLineError = namedtuple("ReactionLineError", "lineno error")
+ReactionLineError.__doc__ = """\
+A record of a line which could not be parsed by `iter_reactions`: its (1-based)
+line number and the exception raised.
+"""
+
+# The exceptions captured per-line by iter_reactions: everything a badly-formed
+# or unbalanced reaction string can raise, including the ValueErrors raised for
+# states which parse but are invalid (such as J1J2_CouplingValidationError).
+_reaction_line_errors = (
+    ReactionParseError,
+    StateParseError,
+    StatefulSpeciesError,
+    ValueError,
+)
+
+
+def _parse_reaction_lines(numbered_lines, strict):
+    """Parse a sequence of (lineno, r_str) pairs into a list of `Reaction` or
+    `ReactionLineError` objects."""
+    parsed = []
+    for lineno, r_str in numbered_lines:
+        try:
+            parsed.append(Reaction(r_str, strict=strict))
+        except _reaction_line_errors as err:
+            parsed.append(ReactionLineError(lineno, err))
+    return parsed
+
+
+def iter_reactions(
+    fileobj,
+    strict=True,
+    column=None,
+    delimiter="\t",
+    comment="#",
+    processes=None,
+    chunksize=1000,
+    max_chunks=None,
+):
+    """Parse reactions from a text file, one reaction per line.
+
+    This is a generator which reads the file line by line, so the whole file is
+    never held in memory. Lines which are blank, or which start with the `comment`
+    string, are skipped. Lines which cannot be parsed do not stop the iteration:
+    a `ReactionLineError` record is yielded in place of the `Reaction`.
+
+    Parameters
+    ----------
+    fileobj : iterable of str
+        An open text file or any other iterable of lines.
+    strict : bool, default=True
+        Passed to the `Reaction` constructor: if ``True``, reactions which do not
+        conserve stoichiometry and charge are reported as errors.
+    column : int, optional
+        If given, each line is split on `delimiter` and the reaction string is
+        taken from the field with this (0-based) index. Otherwise, the whole line
+        is the reaction string.
+    delimiter : str, default="\\t"
+        The field delimiter used if `column` is given.
+    comment : str or None, default="#"
+        Lines starting with this string are skipped.
+    processes : int, optional
+        If greater than 1, parse the reactions in this many worker processes.
+        Results are still yielded in the order of the lines in the file.
+    chunksize : int, default=1000
+        The number of lines sent to a worker process at a time.
+    max_chunks : int, optional
+        The maximum number of chunks being parsed, or waiting to be yielded, at
+        any one time; this bounds the memory used when `processes` is given.
+        The default is twice the number of processes.
+
+    Yields
+    ------
+    Reaction or ReactionLineError
+
+    Examples
+    --------
+    >>> import io
+    >>> f = io.StringIO("# Example file\\nCO + O2 → CO2 + O\\nBeH+ + I2 → BeI + HI\\n")
+    >>> for parsed in iter_reactions(f):
+    ...     print(repr(parsed))
+    CO + O2 → CO2 + O
+    ReactionLineError(lineno=3, error=ReactionChargeError('Charge not preserved for reaction: BeH+ + I2 → BeI + HI'))
+    """
+
+    def numbered_lines():
+        for lineno, line in enumerate(fileobj, start=1):
+            line = line.strip()
+            if not line or (comment and line.startswith(comment)):
+                continue
+            if column is not None:
+                fields = line.split(delimiter)
+                try:
+                    line = fields[column].strip()
+                except IndexError:
+                    yield lineno, ""
+                    continue
+            yield lineno, line
+
+    if not processes or processes < 2:
+        for lineno, r_str in numbered_lines():
+            yield from _parse_reaction_lines([(lineno, r_str)], strict)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    if max_chunks is None:
+        max_chunks = 2 * processes
+    lines = numbered_lines()
+    with ProcessPoolExecutor(processes) as executor:
+        in_flight = deque()
+        while True:
+            while len(in_flight) < max_chunks:
+                chunk = list(itertools.islice(lines, chunksize))
+                if not chunk:
+                    break
+                in_flight.append(executor.submit(_parse_reaction_lines, chunk, strict))
+            if not in_flight:
+                return
+            yield from in_flight.popleft().result()
+
+
+def render_rows(reactions, markup="html", columns=(), cache_size=10000):
+    """Render reactions as the rows of an HTML or LaTeX table.
+
+    This is a generator, yielding one row per reaction, so that tables of any
+    length can be written out (or streamed to a client) in bounded memory. The
+    renderings of the species are cached across reactions, so that a species
+    occurring in many reactions (e.g. ``e-``, ``N2``) is rendered only once; at
+    most `cache_size` species renderings are kept, the least recently used being
+    discarded first.
+
+    Parameters
+    ----------
+    reactions : iterable of Reaction
+    markup : {"html", "latex"}, default="html"
+    columns : sequence of callable, optional
+        Functions of a `Reaction` giving the contents of additional cells, placed
+        after the cell containing the reaction. In HTML rows, their ``str`` values
+        are escaped.
+    cache_size : int, default=10000
+
+    Yields
+    ------
+    str
+        The table rows: ``"<tr><td>...</td>...</tr>"`` for HTML, or
+        ``"$...$ & ... \\\\\\\\"`` for LaTeX.
+
+    Examples
+    --------
+    >>> reactions = [Reaction("e- + N2 → N2+ + 2e-"), Reaction("e- + N2+ → N + N")]
+    >>> for row in render_rows(reactions, columns=[lambda r: r.sep]):
+    ...     print(row)
+    <tr><td>e<sup>-</sup> + N<sub>2</sub> → N<sub>2</sub><sup>+</sup> + 2e<sup>-</sup></td><td>→</td></tr>
+    <tr><td>e<sup>-</sup> + N<sub>2</sub><sup>+</sup> → N + N</td><td>→</td></tr>
+    >>> print(next(render_rows(reactions, "latex")))
+    $\\mathrm{e}^- + \\mathrm{N}_{2} \\rightarrow \\mathrm{N}_{2}^{+} + 2\\mathrm{e}^-$ \\\\
+    """
+    if markup not in ("html", "latex"):
+        raise ValueError("Unknown markup for rendering reactions: {}".format(markup))
+
+    cache = OrderedDict()
+
+    def render_species(ss):
+        # The states are keyed in the order given, since this is the order in
+        # which they are rendered.
+        key = (ss.formula.formula, tuple(repr(state) for state in ss.states))
+        try:
+            cache.move_to_end(key)
+            return cache[key]
+        except KeyError:
+            rendered = cache[key] = getattr(ss, markup)
+            if len(cache) > cache_size:
+                cache.popitem(last=False)
+            return rendered
+
+    for reaction in reactions:
+        if markup == "html":
+            cells = [reaction._render(render_species, reaction.sep)]
+            cells.extend(html.escape(str(column(reaction))) for column in columns)
+            yield "".join("<td>{}</td>".format(cell) for cell in cells).join(
+                ("<tr>", "</tr>")
+            )
+        else:
+            cells = [
+                "${}$".format(
+                    reaction._render(render_species, reaction.latex_sep[reaction.sep])
+                )
+            ]
+            cells.extend(str(column(reaction)) for column in columns)
+            yield " & ".join(cells) + r" \\"
@@ -0,0 +1,372 @@
+"""
+This module contains a rule-based classifier assigning a process type
+(ionization, excitation, charge exchange, etc.) to reactions.
+
+To make the classification of large reaction lists fast, reactions are first
+*encoded* into integer records: each distinct `StatefulSpecies` is interned once in a
+`SpeciesTable`, which also holds its per-species properties (kind of particle,
+charge, formula id, etc.), and a reaction record is just a pair of sorted tuples of
+species ids for its reactants and products (repeated according to their
+stoichiometries), with a flag marking the reactions in which an ion and a neutral
+of the same composition exchange places as written, such as the symmetric
+resonant charge exchange "Ar+ + Ar → Ar + Ar+" (which would otherwise be
+indistinguishable from the elastic collision "Ar+ + Ar → Ar+ + Ar"). The
+classifier never looks at a string again: each record is reduced to a
+`ReactionFeatures` tuple, and the rules are predicates on these features, tried in
+order until one matches.
+
+Examples
+--------
+>>> from pyvalem.reaction import Reaction
+>>> from pyvalem.reaction_classifier import ReactionClassifier
+>>> classifier = ReactionClassifier()
+>>> classifier.classify(Reaction("e- + Ar → Ar+ + 2e-"))
+'ionization'
+>>> classifier.classify(Reaction("e- + O2 → O- + O"))
+'attachment'
+>>> records = [classifier.encode(Reaction(s)) for s in (
+...     "Ar+ + H → Ar + H+", "e- + CO v=0 → e- + CO v=1", "e- + H2 → e- + H + H"
+... )]
+>>> classifier.classify_all(records)
+['charge exchange', 'excitation', 'dissociation']
+"""
+
+from array import array
+from collections import namedtuple
+
+ELASTIC = "elastic"
+IONIZATION = "ionization"
+DETACHMENT = "detachment"
+RECOMBINATION = "recombination"
+ATTACHMENT = "attachment"
+CHARGE_EXCHANGE = "charge exchange"
+DISSOCIATION = "dissociation"
+ASSOCIATION = "association"
+RADIATIVE = "radiative"
+EXCITATION = "excitation"
+REARRANGEMENT = "rearrangement"
+UNCLASSIFIED = "unclassified"
+
+# The kinds of particle distinguished in the SpeciesTable.
+HEAVY, ELECTRON, POSITRON, PHOTON, THIRD_BODY = range(5)
+special_kinds = {"e-": ELECTRON, "e+": POSITRON, "hν": PHOTON, "M": THIRD_BODY}
+
+
+class ReactionClassifierError(Exception):
+    pass
+
+
+ReactionRecord = namedtuple("ReactionRecord", "lhs rhs charge_swapped")
+ReactionRecord.__new__.__defaults__ = (False,)
+
+ReactionFeatures = namedtuple(
+    "ReactionFeatures",
+    [
+        # numbers of electrons and photons on each side:
+        "n_e_lhs",
+        "n_e_rhs",
+        "n_hv_lhs",
+        "n_hv_rhs",
+        # True if a third body, M, takes part in the reaction:
+        "third_body",
+        # sorted tuples of the species ids of the heavy species on each side:
+        "lhs",
+        "rhs",
+        # sorted tuples of their formula ids (formula with charge, without states):
+        "lhs_formulas",
+        "rhs_formulas",
+        # sorted tuples of the ids of their neutral atomic compositions:
+        "lhs_neutrals",
+        "rhs_neutrals",
+        # total charge of the heavy species on each side:
+        "lhs_charge",
+        "rhs_charge",
+        # True if any heavy species on the side is a positive / negative ion:
+        "lhs_cation",
+        "rhs_cation",
+        "lhs_anion",
+        "rhs_anion",
+        # True if an ion and a neutral of the same composition exchange places in
+        # the reaction as written (symmetric resonant charge exchange):
+        "charge_swapped",
+    ],
+)
+
+
+class SpeciesTable:
+    """An interning table of `StatefulSpecies`, with their integer properties.
+
+    Each distinct species (by canonical ``repr``) is assigned an integer id, its
+    index into the per-species property arrays.
+
+    Attributes
+    ----------
+    species : list of str
+        The canonical representations of the interned species, by id.
+    kinds : array of int
+        One of ``HEAVY``, ``ELECTRON``, ``POSITRON``, ``PHOTON``, ``THIRD_BODY``.
+    charges : array of int
+    formula_ids : array of int
+        Ids of the species formula (including charge but no states).
+    neutral_ids : array of int
+        Ids of the species atomic composition, ignoring charge and states.
+    """
+
+    def __init__(self):
+        self.species = []
+        self.kinds = array("b")
+        self.charges = array("l")
+        self.formula_ids = array("l")
+        self.neutral_ids = array("l")
+        self._species_ids = {}
+        self._formula_ids = {}
+        self._neutral_ids = {}
+        self._side_summaries = {}
+
+    def __len__(self):
+        return len(self.species)
+
+    def species_id(self, species):
+        """Return the id of a `StatefulSpecies`, interning it if necessary.
+
+        Parameters
+        ----------
+        species : StatefulSpecies
+
+        Returns
+        -------
+        int
+        """
+        key = repr(species)
+        try:
+            return self._species_ids[key]
+        except KeyError:
+            pass
+
+        formula = species.formula
+        formula_key = repr(formula)
+        kind = special_kinds.get(formula_key, HEAVY)
+        neutral_key = tuple(sorted(formula.atom_stoich.items()))
+        sid = self._species_ids[key] = len(self.species)
+        self.species.append(key)
+        self.kinds.append(kind)
+        self.charges.append(formula.charge or 0)
+        self.formula_ids.append(
+            self._formula_ids.setdefault(formula_key, len(self._formula_ids))
+        )
+        self.neutral_ids.append(
+            self._neutral_ids.setdefault(neutral_key, len(self._neutral_ids))
+        )
+        return sid
+
+    def encode(self, reaction):
+        """Encode a `Reaction` as a `ReactionRecord` of species ids.
+
+        Parameters
+        ----------
+        reaction : Reaction
+
+        Returns
+        -------
+        ReactionRecord
+        """
+        lhs, rhs = (
+            [sid for n, ss in side for sid in (self.species_id(ss),) * n]
+            for side in (reaction.reactants, reaction.products)
+        )
+        record_lhs, record_rhs = tuple(sorted(lhs)), tuple(sorted(rhs))
+        charge_swapped = record_lhs == record_rhs and any(
+            self.neutral_ids[i] == self.neutral_ids[j]
+            and self.charges[i] != self.charges[j]
+            for i, j in zip(lhs, rhs)
+        )
+        return ReactionRecord(record_lhs, record_rhs, charge_swapped)
+
+    def _side_summary(self, side):
+        """Summarise the species ids on one side of a `ReactionRecord`.
+
+        The summaries are cached, since the same reactants (e.g. ``"e- + Ar"``)
+        typically occur in many reactions.
+        """
+        try:
+            return self._side_summaries[side]
+        except KeyError:
+            pass
+        kinds, charges = self.kinds, self.charges
+        counts = [0] * 5
+        heavy = []
+        for sid in side:
+            kind = kinds[sid]
+            if kind == HEAVY:
+                heavy.append(sid)
+            else:
+                counts[kind] += 1
+        heavy_charges = [charges[sid] for sid in heavy]
+        summary = self._side_summaries[side] = (
+            counts[ELECTRON],
+            counts[PHOTON],
+            counts[THIRD_BODY],
+            tuple(heavy),
+            tuple(sorted(self.formula_ids[sid] for sid in heavy)),
+            tuple(sorted(self.neutral_ids[sid] for sid in heavy)),
+            sum(heavy_charges),
+            any(charge > 0 for charge in heavy_charges),
+            any(charge < 0 for charge in heavy_charges),
+        )
+        return summary
+
+    def features(self, record):
+        """Reduce a `ReactionRecord` to its `ReactionFeatures`.
+
+        Parameters
+        ----------
+        record : ReactionRecord
+
+        Returns
+        -------
+        ReactionFeatures
+        """
+        n_e_lhs, n_hv_lhs, n_m_lhs, *lhs = self._side_summary(record[0])
+        n_e_rhs, n_hv_rhs, n_m_rhs, *rhs = self._side_summary(record[1])
+        return ReactionFeatures(
+            n_e_lhs,
+            n_e_rhs,
+            n_hv_lhs,
+            n_hv_rhs,
+            bool(n_m_lhs or n_m_rhs),
+            *(value for pair in zip(lhs, rhs) for value in pair),
+            len(record) > 2 and bool(record[2])
+        )
+
+
+def _net_electrons(f):
+    return f.n_e_rhs - f.n_e_lhs
+
+
+# The default rules, as (label, predicate) pairs, tried in this order.
+default_rules = [
+    # symmetric resonant charge exchange, e.g. Ar+ + Ar → Ar + Ar+
+    (CHARGE_EXCHANGE, lambda f: f.lhs == f.rhs and f.charge_swapped),
+    (ELASTIC, lambda f: f.lhs == f.rhs and _net_electrons(f) == 0 and f.lhs),
+    (DETACHMENT, lambda f: _net_electrons(f) > 0 and f.lhs_charge < 0),
+    (IONIZATION, lambda f: _net_electrons(f) > 0),
+    (RECOMBINATION, lambda f: _net_electrons(f) < 0 and f.lhs_cation),
+    (ATTACHMENT, lambda f: _net_electrons(f) < 0),
+    # ion-ion recombination (mutual neutralization), e.g. A+ + B- → A + B
+    (
+        RECOMBINATION,
+        lambda f: f.lhs_cation and f.lhs_anion and not (f.rhs_cation or f.rhs_anion),
+    ),
+    (DISSOCIATION, lambda f: f.lhs and len(f.rhs) > len(f.lhs)),
+    (ASSOCIATION, lambda f: f.rhs and len(f.rhs) < len(f.lhs)),
+    (
+        CHARGE_EXCHANGE,
+        lambda f: f.lhs_neutrals == f.rhs_neutrals and f.lhs_formulas != f.rhs_formulas,
+    ),
+    (RADIATIVE, lambda f: f.lhs_formulas == f.rhs_formulas and f.n_hv_lhs + f.n_hv_rhs),
+    (EXCITATION, lambda f: f.lhs_formulas == f.rhs_formulas and f.lhs != f.rhs),
+    (REARRANGEMENT, lambda f: f.lhs and f.rhs),
+]
+
+
+class ReactionClassifier:
+    """A rule-based classifier of reactions by process type.
+
+    Parameters
+    ----------
+    species_table : SpeciesTable, optional
+        The table used to intern species when encoding reactions. A new, empty
+        table is created if none is given.
+
+    Attributes
+    ----------
+    species_table : SpeciesTable
+    rules : list of tuple[str, callable]
+        The ``(label, predicate)`` rules, tried in order: the label of the first
+        rule whose predicate returns a true value for a reaction's
+        `ReactionFeatures` is the classification of that reaction.
+    """
+
+    def __init__(self, species_table=None):
+        if species_table is None:
+            species_table = SpeciesTable()
+        self.species_table = species_table
+        self.rules = list(default_rules)
+
+    def register(self, label, predicate, before=None):
+        """Register an additional classification rule.
+
+        Parameters
+        ----------
+        label : str
+            The classification to assign if `predicate` matches.
+        predicate : callable
+            A function taking a `ReactionFeatures` tuple and returning a true value
+            if the reaction belongs in the class `label`. Species properties not
+            held in the features can be looked up by species id in
+            ``classifier.species_table``.
+        before : str, optional
+            Try the new rule before the first existing rule with this label. By
+            default, the new rule is tried before *all* of the existing rules.
+
+        Raises
+        ------
+        ReactionClassifierError
+            If there is no existing rule with label `before`.
+        """
+        if before is None:
+            self.rules.insert(0, (label, predicate))
+            return
+        for i, (rule_label, _) in enumerate(self.rules):
+            if rule_label == before:
+                self.rules.insert(i, (label, predicate))
+                return
+        raise ReactionClassifierError("No rule with label {}".format(before))
+
+    def encode(self, reaction):
+        """Encode a `Reaction` as a `ReactionRecord`; see `SpeciesTable.encode`."""
+        return self.species_table.encode(reaction)
+
+    def classify(self, reaction):
+        """Classify a single `Reaction` or `ReactionRecord`.
+
+        Parameters
+        ----------
+        reaction : Reaction or ReactionRecord
+
+        Returns
+        -------
+        str
+            The label of the first matching rule, or ``UNCLASSIFIED``.
+        """
+        if not isinstance(reaction, tuple):
+            reaction = self.encode(reaction)
+        features = self.species_table.features(reaction)
+        for label, predicate in self.rules:
+            if predicate(features):
+                return label
+        return UNCLASSIFIED
+
+    def classify_all(self, records):
+        """Classify each of an iterable of `ReactionRecord`s.
+
+        Parameters
+        ----------
+        records : iterable of ReactionRecord
+
+        Returns
+        -------
+        list of str
+        """
+        features = self.species_table.features
+        rules = self.rules
+        labels = []
+        for record in records:
+            f = features(record)
+            for label, predicate in rules:
+                if predicate(f):
+                    labels.append(label)
+                    break
+            else:
+                labels.append(UNCLASSIFIED)
+        return labels
@@ -0,0 +1,114 @@
+"""
+This module contains the `diff_reactions` function, which reports the reactions
+added, removed and changed between two versions of a collection of reactions
+(for example, two releases of a reaction database).
+
+Reactions in the two versions are paired by their canonical identity, the
+``repr`` of the `Reaction` (or, optionally, its direction-independent pair key;
+see `pyvalem.reaction_pairs.pair_key`), rather than by comparing every reaction of
+one version with every reaction of the other. The old version is filed in a hash
+table under these keys in a single pass, and the new version is then streamed
+against it: the comparison takes time linear in the total number of reactions and
+its results are yielded as they are found.
+
+Examples
+--------
+>>> from pyvalem.reaction_diff import diff_reactions
+>>> old = ["CO + O2 → CO2 + O", "H + H + M → H2 + M", "e- + Ar → Ar+ + 2e-"]
+>>> new = ["2H + M → H2 + M", "e- + Ar → Ar+ + 2e-", "e- + N2 → N2+ + 2e-"]
+>>> for entry in diff_reactions(old, new):
+...     print(entry.status, entry.old_index, entry.new_index, entry.old, entry.new)
+changed 1 0 H + H + M → H2 + M 2H + M → H2 + M
+added None 2 None e- + N2 → N2+ + 2e-
+removed 0 None CO + O2 → CO2 + O None
+"""
+
+from collections import deque, namedtuple
+
+from .reaction import Reaction
+from .reaction_pairs import pair_key
+
+ADDED, REMOVED, CHANGED, UNCHANGED = "added", "removed", "changed", "unchanged"
+
+ReactionDiff = namedtuple("ReactionDiff", "status old_index new_index old new")
+ReactionDiff.__doc__ = """\
+One entry of the difference between two versions of a collection of reactions:
+its status (``"added"``, ``"removed"``, ``"changed"`` or ``"unchanged"``), the
+indices of the reaction in the old and new versions, and the reactions themselves
+(``None`` for the version in which the reaction is absent).
+"""
+
+
+def _as_reaction(reaction, strict):
+    if isinstance(reaction, Reaction):
+        return reaction
+    return Reaction(reaction, strict=strict)
+
+
+def _written_differently(old, new):
+    return str(old) != str(new)
+
+
+def diff_reactions(
+    old, new, changed=None, match_reverse=False, unchanged=False, strict=True
+):
+    """Compare two versions of a collection of reactions.
+
+    The reactions of `old` and `new` are paired by their canonical identity: a
+    reaction of `new` with no counterpart in `old` is reported as added, and one
+    of `old` with no counterpart in `new` as removed. Paired reactions are
+    reported as changed if the `changed` function says so. If a reaction
+    appears more than once in either version, its occurrences are paired in
+    order.
+
+    This is a generator: the added and changed reactions are yielded in the order
+    of `new` as it is read, and the removed reactions in the order of `old` once
+    `new` is exhausted. `old` is held in memory, but `new` is not.
+
+    Parameters
+    ----------
+    old, new : iterable of Reaction or str
+        The two versions; reaction strings are parsed into `Reaction` instances.
+    changed : callable, optional
+        A function ``changed(old_reaction, new_reaction)`` returning ``True`` if
+        a pair of reactions with the same identity should be reported as
+        changed, for example to compare their ``rate`` attributes. By default,
+        reactions are changed if they are written differently (that is, their
+        ``str`` representations differ).
+    match_reverse : bool, default=False
+        If ``True``, a reaction is also paired with its reverse (see
+        `pyvalem.reaction_pairs.pair_key`).
+    unchanged : bool, default=False
+        If ``True``, also yield the pairs of reactions which are unchanged.
+    strict : bool, default=True
+        Passed to the `Reaction` constructor for reaction strings.
+
+    Yields
+    ------
+    ReactionDiff
+    """
+    if changed is None:
+        changed = _written_differently
+    key = pair_key if match_reverse else repr
+
+    old_entries = {}
+    for i, reaction in enumerate(old):
+        reaction = _as_reaction(reaction, strict)
+        old_entries.setdefault(key(reaction), deque()).append((i, reaction))
+
+    for j, reaction in enumerate(new):
+        reaction = _as_reaction(reaction, strict)
+        entries = old_entries.get(key(reaction))
+        if not entries:
+            yield ReactionDiff(ADDED, None, j, None, reaction)
+            continue
+        i, old_reaction = entries.popleft()
+        if changed(old_reaction, reaction):
+            yield ReactionDiff(CHANGED, i, j, old_reaction, reaction)
+        elif unchanged:
+            yield ReactionDiff(UNCHANGED, i, j, old_reaction, reaction)
+
+    removed = [entry for entries in old_entries.values() for entry in entries]
+    removed.sort(key=lambda entry: entry[0])
+    for i, reaction in removed:
+        yield ReactionDiff(REMOVED, i, None, reaction, None)
@@ -0,0 +1,206 @@
+"""
+This module contains functions for enumerating all the reactions among a set of
+species which conserve the elements and charge, for example to build the candidate
+charge-exchange and ionization channels of a system.
+
+Each species is reduced to a *composition vector*: its number of atoms of each
+element (isotopes counting as distinct elements, as in
+`Reaction.stoichiometry_conserved`), the number of third bodies, M, and its
+charge. Rather than testing every pair of reactant and product combinations for
+conservation, the product combinations are filed in a hash table under their summed
+composition vectors: each combination of reactants then finds all of its
+conserving products in a single lookup (a "meet-in-the-middle" search).
+
+Examples
+--------
+>>> from pyvalem.reaction_enumeration import enumerate_reactions
+>>> species = ["H", "H+", "O", "O+", "OH", "e-"]
+>>> for reaction in enumerate_reactions(species, reactants=["H+", "O"]):
+...     print(reaction)
+H+ + O → H + O+
+>>> for reaction in enumerate_reactions(species, n_products=3, reactants=["e-"]):
+...     print(repr(reaction))
+e- + H → H+ + 2e-
+e- + O → O+ + 2e-
+e- + OH → H + O + e-
+"""
+
+import itertools
+
+from .reaction import Reaction
+from .stateful_species import StatefulSpecies
+
+
+class ReactionEnumerationError(Exception):
+    pass
+
+
+def composition(species):
+    """Return the composition of a species as a dictionary.
+
+    Parameters
+    ----------
+    species : StatefulSpecies
+
+    Returns
+    -------
+    dict
+        The number of atoms of each element, keyed by element (or isotope)
+        symbol, the number of third bodies, keyed by ``"M"``, and the charge,
+        keyed by ``None``. Zero counts are omitted.
+    """
+    formula = species.formula
+    if formula.formula == "M":
+        return {"M": 1}
+    counts = {symbol: n for symbol, n in formula.atom_stoich.items() if n}
+    if formula.charge:
+        counts[None] = formula.charge
+    return counts
+
+
+class CompositionTable:
+    """The composition vectors of a set of species.
+
+    Parameters
+    ----------
+    species : iterable of StatefulSpecies or str
+        Duplicate species (with the same canonical representation) are kept only
+        once.
+
+    Attributes
+    ----------
+    species : list of StatefulSpecies
+    components : list
+        The components of the composition vectors: element symbols, ``"M"`` and
+        ``None`` (for the charge).
+    vectors : list of tuple of int
+        The composition vector of each species.
+    """
+
+    def __init__(self, species):
+        self.species = []
+        self._species_ids = {}
+        for ss in species:
+            self.species_id(ss, add=True)
+        compositions = [composition(ss) for ss in self.species]
+        self.components = sorted(
+            {c for counts in compositions for c in counts}, key=lambda c: (c is None, c)
+        )
+        self.vectors = [
+            tuple(counts.get(c, 0) for c in self.components) for counts in compositions
+        ]
+
+    def species_id(self, species, add=False):
+        """Return the index of a species in the table.
+
+        Parameters
+        ----------
+        species : StatefulSpecies or str
+        add : bool, default=False
+            If ``True``, add the species to the table if it is not already
+            there (for internal use: the composition vectors are not updated).
+
+        Returns
+        -------
+        int
+
+        Raises
+        ------
+        ReactionEnumerationError
+            If the species is not in the table.
+        """
+        if not isinstance(species, StatefulSpecies):
+            species = StatefulSpecies(species)
+        key = repr(species)
+        try:
+            return self._species_ids[key]
+        except KeyError:
+            if not add:
+                raise ReactionEnumerationError("Unknown species: {}".format(key))
+        isp = self._species_ids[key] = len(self.species)
+        self.species.append(species)
+        return isp
+
+    def __len__(self):
+        return len(self.species)
+
+    def total(self, combination):
+        """Return the summed composition vector of a combination of species ids."""
+        return tuple(map(sum, zip(*(self.vectors[isp] for isp in combination))))
+
+
+def _arities(n):
+    return (n,) if isinstance(n, int) else tuple(n)
+
+
+def enumerate_channels(
+    species, n_reactants=2, n_products=2, reactants=None, elastic=False
+):
+    """Enumerate the element- and charge-conserving reactions among species.
+
+    Parameters
+    ----------
+    species : CompositionTable or iterable of StatefulSpecies or str
+        The species which may appear in the reactions.
+    n_reactants, n_products : int or iterable of int, default=2
+        The number(s) of reactants and products.
+    reactants : iterable of StatefulSpecies or str, optional
+        If given, every reaction must have at least one reactant from this
+        subset of `species`.
+    elastic : bool, default=False
+        If ``True``, include the reactions whose products are the same as their
+        reactants.
+
+    Yields
+    ------
+    tuple[tuple of int, tuple of int]
+        The (sorted) ids of the reactants and the products of each reaction in
+        the `CompositionTable` of the species: for ``n`` reactants of the same
+        species, its id is repeated ``n`` times.
+    """
+    table = species if isinstance(species, CompositionTable) else None
+    if table is None:
+        table = CompositionTable(species)
+    required = None
+    if reactants is not None:
+        required = {table.species_id(ss) for ss in reactants}
+    ids = range(len(table))
+
+    # The product combinations of each arity, keyed by their total composition.
+    products_by_total = {}
+    for n in _arities(n_products):
+        for combination in itertools.combinations_with_replacement(ids, n):
+            products_by_total.setdefault(table.total(combination), []).append(
+                combination
+            )
+
+    for n in _arities(n_reactants):
+        for combination in itertools.combinations_with_replacement(ids, n):
+            if required is not None and required.isdisjoint(combination):
+                continue
+            for products in products_by_total.get(table.total(combination), ()):
+                if elastic or products != combination:
+                    yield combination, products
+
+
+def enumerate_reactions(species, n_reactants=2, n_products=2, reactants=None, **kwargs):
+    """Enumerate the element- and charge-conserving reactions among species.
+
+    This is a generator of the reactions found by `enumerate_channels`, built
+    directly from the species (that is, without parsing a reaction string for each
+    of them); see that function for the parameters. Any further keyword
+    arguments are passed to `enumerate_channels`.
+
+    Yields
+    ------
+    Reaction
+    """
+    table = CompositionTable(species)
+    for lhs, rhs in enumerate_channels(
+        table, n_reactants, n_products, reactants=reactants, **kwargs
+    ):
+        yield Reaction.from_species(
+            [table.species[isp] for isp in lhs],
+            [table.species[isp] for isp in rhs],
+            strict=False,
+        )
@@ -0,0 +1,340 @@
+"""
+This module contains the `ReactionIndex` class, an inverted index for searching
+collections of `Reaction` instances by their participating species.
+
+The index keeps separate posting lists for the reactants (left-hand side) and the
+products (right-hand side) of each reaction, mapping each species key to the set of
+integer ids of the reactions in which it appears. Species are keyed at two levels of
+granularity: by their full canonical ``repr`` (formula *and* states) and by their
+formula only.
+
+Examples
+--------
+>>> from pyvalem.reaction import Reaction
+>>> from pyvalem.reaction_index import ReactionIndex
+>>> index = ReactionIndex()
+>>> index.add(Reaction("CO v=1 + O2 → CO2 + O"))
+0
+>>> index.add(Reaction("e- + Ar → Ar+ + 2e-"))
+1
+>>> index.add(Reaction("Ar+ + H2 → ArH+ + H"))
+2
+>>> index.find(reactants=["CO v=1"])
+[0]
+>>> index.find(products=["e-"])
+[1]
+>>> index.find(species=["Ar+", "H2"])
+[2]
+>>> index.find(species=["Ar", "Ar+"], match="any")
+[1, 2]
+"""
+
+import json
+
+from .formula import Formula
+from .stateful_species import StatefulSpecies
+
+FORMAT_NAME = "pyvalem.ReactionIndex"
+FORMAT_VERSION = 1
+
+
+class ReactionIndexError(Exception):
+    pass
+
+
+def species_key(species, states=True):
+    """Return the index key for a species.
+
+    Parameters
+    ----------
+    species : StatefulSpecies
+    states : bool, default=True
+        If ``True``, the key is the canonical representation of the species,
+        including its states; otherwise it is the formula only.
+
+    Returns
+    -------
+    str
+    """
+    if states:
+        return repr(species)
+    return repr(species.formula)
+
+
+class ReactionIndex:
+    """An inverted index from species to the reactions they take part in.
+
+    Each reaction added to the index is assigned an integer id (or the caller may
+    supply one). Queries return sorted lists of these ids, so the caller is
+    expected to keep the reactions themselves in some id-addressable container.
+
+    Species passed to the query methods may be `StatefulSpecies` or `Formula`
+    instances, or strings parseable as `StatefulSpecies`. A species without states
+    (e.g. ``"CO"``) matches at formula-only granularity, that is, it matches *any*
+    ``CO`` whatever its states; a species with states (e.g. ``"CO v=1"``) matches
+    only that fully-specified species.
+
+    Attributes
+    ----------
+    ids : list of int
+        The ids of all the reactions in the index, in increasing order.
+    """
+
+    def __init__(self):
+        # reaction id -> (tuple of reactant keys, tuple of product keys)
+        self._reactions = {}
+        # Posting lists, species key -> set of reaction ids, for each side and
+        # granularity.
+        self._lhs_species = {}
+        self._rhs_species = {}
+        self._lhs_formulas = {}
+        self._rhs_formulas = {}
+        self._next_id = 0
+
+    def __len__(self):
+        return len(self._reactions)
+
+    def __contains__(self, reaction_id):
+        return reaction_id in self._reactions
+
+    @property
+    def ids(self):
+        return sorted(self._reactions)
+
+    @staticmethod
+    def _side_keys(side):
+        """Return the tuple of unique species keys from one side of a reaction."""
+        keys = []
+        for _, ss in side:
+            key = species_key(ss)
+            if key not in keys:
+                keys.append(key)
+        return tuple(keys)
+
+    @staticmethod
+    def _post(postings, key, reaction_id):
+        try:
+            postings[key].add(reaction_id)
+        except KeyError:
+            postings[key] = {reaction_id}
+
+    @staticmethod
+    def _unpost(postings, key, reaction_id):
+        ids = postings[key]
+        ids.discard(reaction_id)
+        if not ids:
+            del postings[key]
+
+    def _insert_keys(self, reaction_id, lhs_keys, rhs_keys):
+        if reaction_id in self._reactions:
+            raise ReactionIndexError(
+                "Reaction id {} is already in the index".format(reaction_id)
+            )
+        self._reactions[reaction_id] = lhs_keys, rhs_keys
+        for keys, species_postings, formula_postings in (
+            (lhs_keys, self._lhs_species, self._lhs_formulas),
+            (rhs_keys, self._rhs_species, self._rhs_formulas),
+        ):
+            for key in keys:
+                self._post(species_postings, key, reaction_id)
+                self._post(formula_postings, key.split(" ", 1)[0], reaction_id)
+        if reaction_id >= self._next_id:
+            self._next_id = reaction_id + 1
+
+    def add(self, reaction, reaction_id=None):
+        """Add a `Reaction` to the index.
+
+        Parameters
+        ----------
+        reaction : Reaction
+        reaction_id : int, optional
+            The id to file the reaction under. If not given, the next unused id
+            (one greater than the largest id used so far) is assigned.
+
+        Returns
+        -------
+        int
+            The id of the added reaction.
+
+        Raises
+        ------
+        ReactionIndexError
+            If `reaction_id` is already in use.
+        """
+        if reaction_id is None:
+            reaction_id = self._next_id
+        self._insert_keys(
+            reaction_id,
+            self._side_keys(reaction.reactants),
+            self._side_keys(reaction.products),
+        )
+        return reaction_id
+
+    def update(self, reactions):
+        """Add each `Reaction` from an iterable to the index.
+
+        Parameters
+        ----------
+        reactions : iterable of Reaction
+
+        Returns
+        -------
+        list of int
+            The ids assigned to the added reactions.
+        """
+        return [self.add(reaction) for reaction in reactions]
+
+    def remove(self, reaction_id):
+        """Remove the reaction with id `reaction_id` from the index.
+
+        Parameters
+        ----------
+        reaction_id : int
+
+        Raises
+        ------
+        ReactionIndexError
+            If there is no reaction with this id in the index.
+        """
+        try:
+            lhs_keys, rhs_keys = self._reactions.pop(reaction_id)
+        except KeyError:
+            raise ReactionIndexError(
+                "Reaction id {} is not in the index".format(reaction_id)
+            )
+        for keys, species_postings, formula_postings in (
+            (lhs_keys, self._lhs_species, self._lhs_formulas),
+            (rhs_keys, self._rhs_species, self._rhs_formulas),
+        ):
+            for key in keys:
+                self._unpost(species_postings, key, reaction_id)
+            # NB several species on this side may share the same formula.
+            for formula_key in {key.split(" ", 1)[0] for key in keys}:
+                self._unpost(formula_postings, formula_key, reaction_id)
+
+    @staticmethod
+    def _query_key(species):
+        """Resolve a query species into its key and granularity."""
+        if isinstance(species, Formula):
+            return repr(species), False
+        if not isinstance(species, StatefulSpecies):
+            species = StatefulSpecies(species)
+        if species.states:
+            return repr(species), True
+        return repr(species.formula), False
+
+    def _postings(self, species, side):
+        key, states = self._query_key(species)
+        if side == "lhs":
+            postings = self._lhs_species if states else self._lhs_formulas
+            return postings.get(key, set())
+        if side == "rhs":
+            postings = self._rhs_species if states else self._rhs_formulas
+            return postings.get(key, set())
+        return self._postings(species, "lhs") | self._postings(species, "rhs")
+
+    def find(self, reactants=(), products=(), species=(), match="all"):
+        """Return the ids of the reactions involving the given species.
+
+        Parameters
+        ----------
+        reactants : iterable of StatefulSpecies, Formula or str
+            Species which must appear among the reactants.
+        products : iterable of StatefulSpecies, Formula or str
+            Species which must appear among the products.
+        species : iterable of StatefulSpecies, Formula or str
+            Species which must appear on either side of the reaction.
+        match : {"all", "any"}, default="all"
+            If ``"all"``, return the reactions satisfying *every* condition (AND);
+            if ``"any"``, return those satisfying *at least one* (OR).
+
+        Returns
+        -------
+        list of int
+            The matching reaction ids, in increasing order.
+        """
+        if match not in ("all", "any"):
+            raise ReactionIndexError("Invalid match specifier: {}".format(match))
+        posting_sets = []
+        for side, side_species in (
+            ("lhs", reactants),
+            ("rhs", products),
+            ("both", species),
+        ):
+            if isinstance(side_species, (str, Formula, StatefulSpecies)):
+                side_species = [side_species]
+            posting_sets.extend(self._postings(sp, side) for sp in side_species)
+        if not posting_sets:
+            return []
+
+        if match == "any":
+            return sorted(set().union(*posting_sets))
+        # Intersect starting from the shortest posting list.
+        posting_sets.sort(key=len)
+        ids = set(posting_sets[0])
+        for posting_set in posting_sets[1:]:
+            if not ids:
+                break
+            ids.intersection_update(posting_set)
+        return sorted(ids)
+
+    def dump(self, fp):
+        """Write the index to the open text file `fp`.
+
+        The format is JSON: a single table of the distinct species keys, and for
+        each reaction its id and the positions of its reactant and product keys in
+        that table.
+
+        Parameters
+        ----------
+        fp : file-like object
+        """
+        keys = {}
+        records = []
+        for reaction_id in sorted(self._reactions):
+            lhs_keys, rhs_keys = self._reactions[reaction_id]
+            record = [reaction_id]
+            for side_keys in (lhs_keys, rhs_keys):
+                record.append([keys.setdefault(key, len(keys)) for key in side_keys])
+            records.append(record)
+        json.dump(
+            {
+                "format": FORMAT_NAME,
+                "version": FORMAT_VERSION,
+                "species": list(keys),
+                "reactions": records,
+            },
+            fp,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def load(cls, fp):
+        """Read an index previously written by `dump` from the open text file `fp`.
+
+        Parameters
+        ----------
+        fp : file-like object
+
+        Returns
+        -------
+        ReactionIndex
+
+        Raises
+        ------
+        ReactionIndexError
+            If the file is not a `ReactionIndex` in a supported format.
+        """
+        data = json.load(fp)
+        if data.get("format") != FORMAT_NAME or data.get("version") != FORMAT_VERSION:
+            raise ReactionIndexError("Unsupported ReactionIndex file format")
+        keys = data["species"]
+        index = cls()
+        for reaction_id, lhs, rhs in data["reactions"]:
+            index._insert_keys(
+                reaction_id,
+                tuple(keys[i] for i in lhs),
+                tuple(keys[i] for i in rhs),
+            )
+        return index
@@ -0,0 +1,334 @@
+"""
+This module contains the `ReactionNetwork` class, a bipartite graph of species and
+the reactions connecting them, with pathway search and reachability queries.
+
+The adjacency of the graph is held in compressed sparse row (CSR) form: for each
+kind of edge (species consumed by reaction, reaction producing species, and the
+reverse of both) an ``indptr`` array of offsets and an ``indices`` array of the
+neighbouring node ids, such that the neighbours of node ``i`` are
+``indices[indptr[i]:indptr[i+1]]``.
+
+Examples
+--------
+>>> from pyvalem.reaction import Reaction
+>>> from pyvalem.reaction_network import ReactionNetwork
+>>> network = ReactionNetwork([
+...     Reaction("e- + N2 → N2+ + 2e-"),
+...     Reaction("N2+ + O2 → O2+ + N2"),
+...     Reaction("e- + O2+ → O + O"),
+...     Reaction("e- + N2 → N + N + e-"),
+... ])
+>>> pathway = network.shortest_path("N2", "O")
+>>> pathway.species
+['N2', 'N2+', 'O2+', 'O']
+>>> pathway.reactions
+[0, 1, 2]
+>>> sorted(network.reachable(["N2"]).species)
+['N', 'N2', 'N2+']
+"""
+
+import heapq
+from array import array
+from collections import deque, namedtuple
+
+from .stateful_species import StatefulSpecies
+
+Pathway = namedtuple("Pathway", "species reactions cost")
+Pathway.__doc__ = """\
+A pathway through a `ReactionNetwork`: the keys of the species visited (from
+source to target), the indices of the reactions connecting them and the total
+cost of the pathway.
+"""
+
+Closure = namedtuple("Closure", "species reactions")
+Closure.__doc__ = """\
+The species keys and reaction indices reachable from a set of seed species.
+"""
+
+
+class ReactionNetworkError(Exception):
+    pass
+
+
+def _csr(nrows, edges):
+    """Build CSR (indptr, indices) arrays from a list of (row, col) pairs."""
+    indptr = array("l", [0] * (nrows + 1))
+    for row, _ in edges:
+        indptr[row + 1] += 1
+    for i in range(nrows):
+        indptr[i + 1] += indptr[i]
+    indices = array("l", [0] * len(edges))
+    fill = array("l", indptr[:-1])
+    for row, col in edges:
+        indices[fill[row]] = col
+        fill[row] += 1
+    return indptr, indices
+
+
+class ReactionNetwork:
+    """A species-reaction bipartite graph built from a collection of reactions.
+
+    Species are identified by their canonical ``repr``, so that, for example,
+    ``"CO v=1"`` and ``"CO v=2"`` are different nodes of the graph. Species may be
+    referred to in the query methods either as `StatefulSpecies` instances or as
+    strings parseable as such.
+
+    Parameters
+    ----------
+    reactions : iterable of Reaction
+    ignore : iterable of str, optional
+        Species which are not made nodes of the graph. By default these are the
+        light species (electrons, positrons and photons) and the third body, M,
+        which would otherwise create spurious shortcuts between unrelated species.
+
+    Attributes
+    ----------
+    reactions : list of Reaction
+    species : list of str
+        The species keys, indexed by species id.
+    """
+
+    default_ignore = ("e-", "e+", "hν", "M")
+
+    def __init__(self, reactions, ignore=default_ignore):
+        self.reactions = list(reactions)
+        self.ignore = set(ignore)
+        self.species = []
+        self._species_ids = {}
+
+        consumes, produces = [], []
+        for ir, reaction in enumerate(self.reactions):
+            for side, edges in (
+                (reaction.reactants, consumes),
+                (reaction.products, produces),
+            ):
+                seen = set()
+                for _, ss in side:
+                    key = repr(ss)
+                    if key in self.ignore or key in seen:
+                        continue
+                    seen.add(key)
+                    edges.append((self._add_species(key), ir))
+
+        nspecies, nreactions = len(self.species), len(self.reactions)
+        # species -> reactions consuming it, and reaction -> its reactants
+        self.consumers_indptr, self.consumers_indices = _csr(nspecies, consumes)
+        self.reactants_indptr, self.reactants_indices = _csr(
+            nreactions, [(ir, isp) for isp, ir in consumes]
+        )
+        # species -> reactions producing it, and reaction -> its products
+        self.producers_indptr, self.producers_indices = _csr(nspecies, produces)
+        self.products_indptr, self.products_indices = _csr(
+            nreactions, [(ir, isp) for isp, ir in produces]
+        )
+
+    def _add_species(self, key):
+        try:
+            return self._species_ids[key]
+        except KeyError:
+            isp = self._species_ids[key] = len(self.species)
+            self.species.append(key)
+            return isp
+
+    def species_id(self, species):
+        """Return the id of a species node.
+
+        Parameters
+        ----------
+        species : StatefulSpecies or str
+
+        Returns
+        -------
+        int
+
+        Raises
+        ------
+        ReactionNetworkError
+            If the species is not in the network.
+        """
+        if not isinstance(species, StatefulSpecies):
+            species = StatefulSpecies(species)
+        try:
+            return self._species_ids[repr(species)]
+        except KeyError:
+            raise ReactionNetworkError("Species not in network: {}".format(species))
+
+    @staticmethod
+    def _row(indptr, indices, i):
+        return indices[indptr[i] : indptr[i + 1]]
+
+    def consumers(self, species):
+        """Return the indices of the reactions consuming `species`."""
+        isp = self.species_id(species)
+        return list(self._row(self.consumers_indptr, self.consumers_indices, isp))
+
+    def producers(self, species):
+        """Return the indices of the reactions producing `species`."""
+        isp = self.species_id(species)
+        return list(self._row(self.producers_indptr, self.producers_indices, isp))
+
+    def _reaction_costs(self, cost):
+        """Resolve the cost argument of shortest_path into a per-reaction array."""
+        if callable(cost):
+            costs = array("d", (cost(reaction) for reaction in self.reactions))
+        else:
+            costs = array("d", cost)
+        if len(costs) != len(self.reactions):
+            raise ReactionNetworkError(
+                "{} reaction costs given for {} reactions".format(
+                    len(costs), len(self.reactions)
+                )
+            )
+        if any(c < 0 for c in costs):
+            raise ReactionNetworkError("Reaction costs must not be negative")
+        return costs
+
+    def _pathway(self, source, target, pred_reaction, pred_species, cost):
+        species, reactions = [target], []
+        isp = target
+        while isp != source:
+            reactions.append(pred_reaction[isp])
+            isp = pred_species[isp]
+            species.append(isp)
+        return Pathway(
+            [self.species[isp] for isp in reversed(species)],
+            reactions[::-1],
+            cost,
+        )
+
+    def shortest_path(self, source, target, cost=None):
+        """Find the cheapest pathway of reactions from `source` to `target`.
+
+        A pathway is a sequence of reactions, each of which consumes a species
+        produced by the one before it. With no `cost` given, the pathway with the
+        fewest reactions is found by breadth-first search; otherwise Dijkstra's
+        algorithm is used with the given per-reaction costs.
+
+        Parameters
+        ----------
+        source, target : StatefulSpecies or str
+        cost : sequence of float or callable, optional
+            The cost of each reaction, as a sequence in the order of
+            ``self.reactions``, or a function of a `Reaction` returning its cost.
+            Costs must be non-negative.
+
+        Returns
+        -------
+        Pathway or None
+            The pathway found, or ``None`` if `target` cannot be reached from
+            `source`.
+        """
+        source, target = self.species_id(source), self.species_id(target)
+        nspecies = len(self.species)
+        pred_reaction = array("l", [-1] * nspecies)
+        pred_species = array("l", [-1] * nspecies)
+        c_indptr, c_indices = self.consumers_indptr, self.consumers_indices
+        p_indptr, p_indices = self.products_indptr, self.products_indices
+        if source == target:
+            return Pathway([self.species[source]], [], 0)
+
+        if cost is None:
+            visited_reactions = bytearray(len(self.reactions))
+            visited = bytearray(nspecies)
+            visited[source] = 1
+            dist = {source: 0}
+            queue = deque([source])
+            while queue:
+                isp = queue.popleft()
+                for ir in c_indices[c_indptr[isp] : c_indptr[isp + 1]]:
+                    if visited_reactions[ir]:
+                        continue
+                    visited_reactions[ir] = 1
+                    for jsp in p_indices[p_indptr[ir] : p_indptr[ir + 1]]:
+                        if visited[jsp]:
+                            continue
+                        visited[jsp] = 1
+                        pred_reaction[jsp], pred_species[jsp] = ir, isp
+                        dist[jsp] = dist[isp] + 1
+                        if jsp == target:
+                            return self._pathway(
+                                source, target, pred_reaction, pred_species, dist[jsp]
+                            )
+                        queue.append(jsp)
+            return None
+
+        costs = self._reaction_costs(cost)
+        dist = array("d", [float("inf")] * nspecies)
+        dist[source] = 0.0
+        heap = [(0.0, source)]
+        while heap:
+            d, isp = heapq.heappop(heap)
+            if d > dist[isp]:
+                continue
+            if isp == target:
+                return self._pathway(source, target, pred_reaction, pred_species, d)
+            for ir in c_indices[c_indptr[isp] : c_indptr[isp + 1]]:
+                dr = d + costs[ir]
+                for jsp in p_indices[p_indptr[ir] : p_indptr[ir + 1]]:
+                    if dr < dist[jsp]:
+                        dist[jsp] = dr
+                        pred_reaction[jsp], pred_species[jsp] = ir, isp
+                        heapq.heappush(heap, (dr, jsp))
+        return None
+
+    def reachable(self, seeds, require_all_reactants=True):
+        """Find the species and reactions reachable from a set of seed species.
+
+        Parameters
+        ----------
+        seeds : iterable of StatefulSpecies or str
+        require_all_reactants : bool, default=True
+            If ``True``, a reaction is reachable only once *all* of its reactants
+            are reachable (that is, the result is the set of species which can be
+            formed from the seeds); otherwise any one reachable reactant suffices.
+
+        Returns
+        -------
+        Closure
+            The keys of the reachable species (including the seeds) and the
+            indices of the reachable reactions.
+        """
+        c_indptr, c_indices = self.consumers_indptr, self.consumers_indices
+        p_indptr, p_indices = self.products_indptr, self.products_indices
+        r_indptr = self.reactants_indptr
+        if require_all_reactants:
+            missing = array(
+                "l",
+                (r_indptr[ir + 1] - r_indptr[ir] for ir in range(len(r_indptr) - 1)),
+            )
+        else:
+            missing = array("l", [1] * len(self.reactions))
+
+        reached = bytearray(len(self.species))
+        reactions = []
+        queue = deque()
+
+        def fire(ir):
+            reactions.append(ir)
+            for jsp in p_indices[p_indptr[ir] : p_indptr[ir + 1]]:
+                if not reached[jsp]:
+                    reached[jsp] = 1
+                    queue.append(jsp)
+
+        # Reactions with no reactants in the graph (e.g. e- + e+ → 2hν) are
+        # always reachable.
+        for ir, n in enumerate(missing):
+            if require_all_reactants and not n:
+                fire(ir)
+        for species in seeds:
+            isp = self.species_id(species)
+            if not reached[isp]:
+                reached[isp] = 1
+                queue.append(isp)
+
+        while queue:
+            isp = queue.popleft()
+            for ir in c_indices[c_indptr[isp] : c_indptr[isp + 1]]:
+                missing[ir] -= 1
+                if missing[ir] == 0:
+                    fire(ir)
+
+        return Closure(
+            [self.species[isp] for isp, flag in enumerate(reached) if flag],
+            sorted(reactions),
+        )
@@ -0,0 +1,155 @@
+"""
+This module contains functions for finding duplicate reactions and forward/reverse
+reaction pairs in a collection of `Reaction` instances, and for folding these into
+single reversible reactions.
+
+Every reaction is filed under a hashable, direction-independent *pair key*: of the
+canonicalised (LHS, RHS) sides of the reaction and of its reverse (see
+`Reaction.canonical_sides`), the pair key is the lesser. A reaction and its reverse
+therefore share the same pair key, and the whole collection can be grouped in a
+single pass over it, rather than by comparing every pair of reactions.
+
+Examples
+--------
+>>> from pyvalem.reaction import Reaction
+>>> from pyvalem.reaction_pairs import find_reverse_pairs, fold_reversible
+>>> reactions = [
+...     Reaction("CO + O2 → CO2 + O"),
+...     Reaction("H + H + M → H2 + M"),
+...     Reaction("CO2 + O → CO + O2"),
+...     Reaction("2H + M → H2 + M"),
+... ]
+>>> find_reverse_pairs(reactions)
+[(0, 2)]
+>>> fold_reversible(reactions)
+[CO + O2 ⇌ CO2 + O, H + H + M → H2 + M]
+"""
+
+import copy
+from collections import namedtuple
+
+ReactionGroup = namedtuple("ReactionGroup", "forward reverse reversible")
+ReactionGroup.__doc__ = """\
+The indices of all the reactions sharing the same pair key.
+
+``forward`` are the indices of the reactions in the same direction as the first
+reaction of the group to appear in the collection, ``reverse`` those in the
+opposite direction, and ``reversible`` those given with the ``"⇌"`` separator
+(in either direction).
+"""
+
+
+def pair_key(reaction):
+    """Return the direction-independent pair key of a `Reaction`.
+
+    Parameters
+    ----------
+    reaction : Reaction
+
+    Returns
+    -------
+    tuple of str
+    """
+    return min(reaction.canonical_sides(), reaction.canonical_sides(reverse=True))
+
+
+def group_reactions(reactions):
+    """Group reactions which are duplicates or reverses of each other.
+
+    Parameters
+    ----------
+    reactions : iterable of Reaction
+
+    Returns
+    -------
+    list of ReactionGroup
+        The groups, ordered by the first appearance of any of their members.
+    """
+    groups = {}
+    for i, reaction in enumerate(reactions):
+        sides = reaction.canonical_sides()
+        reverse_sides = reaction.canonical_sides(reverse=True)
+        key = min(sides, reverse_sides)
+        try:
+            first_sides, group = groups[key]
+        except KeyError:
+            first_sides, group = groups[key] = sides, ReactionGroup([], [], [])
+        if reaction.sep == "⇌":
+            group.reversible.append(i)
+        elif sides == first_sides:
+            group.forward.append(i)
+        else:
+            group.reverse.append(i)
+    return [group for _, group in groups.values()]
+
+
+def find_duplicates(reactions):
+    """Find the groups of reactions which are identical to each other.
+
+    Reactions are identical if they are equal, that is they have the same
+    canonicalised representation (``repr``); reversible reactions given in
+    opposite directions are also considered identical.
+
+    Parameters
+    ----------
+    reactions : iterable of Reaction
+
+    Returns
+    -------
+    list of list of int
+        The indices of each set of two or more identical reactions.
+    """
+    duplicates = []
+    for group in group_reactions(reactions):
+        for indices in group:
+            if len(indices) > 1:
+                duplicates.append(indices)
+    return duplicates
+
+
+def find_reverse_pairs(reactions):
+    """Find the pairs of irreversible reactions which are the reverse of each other.
+
+    Parameters
+    ----------
+    reactions : iterable of Reaction
+
+    Returns
+    -------
+    list of tuple[int, int]
+        The indices of the first forward and the first reverse reaction of each
+        pair, in the order of their first appearance.
+    """
+    return [
+        (group.forward[0], group.reverse[0])
+        for group in group_reactions(reactions)
+        if group.forward and group.reverse
+    ]
+
+
+def fold_reversible(reactions):
+    """Fold duplicate and forward/reverse reactions into single entries.
+
+    Each group of reactions sharing the same pair key is replaced by a single
+    reaction in the direction of its first member: if the group contains both
+    directions, or any reversible reaction, this is a reversible (``"⇌"``)
+    reaction; otherwise it is the first reaction itself.
+
+    Parameters
+    ----------
+    reactions : sequence of Reaction
+
+    Returns
+    -------
+    list of Reaction
+    """
+    folded = []
+    for group in group_reactions(reactions):
+        first = min(i for indices in group for i in indices)
+        reaction = reactions[first]
+        if group.reversible or (group.forward and group.reverse):
+            if reaction.sep != "⇌":
+                reaction = copy.copy(reaction)
+                reaction.sep = "⇌"
+        folded.append(reaction)
+    return folded
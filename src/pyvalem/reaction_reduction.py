@@ -0,0 +1,274 @@
+"""
+This module contains the `NetworkReducer` class, which reduces a network of
+reactions between state-resolved species to a smaller one by *lumping* together
+species which are equivalent under a chosen rule, merging the duplicate reactions
+this produces, and dropping the species (and reactions) outside a set of interest.
+
+A lumping rule is a function mapping a `StatefulSpecies` to the `StatefulSpecies`
+representing its lump. The rules provided are:
+
+``strip_states``
+    Lump all the states of each species together.
+``electronic_states``
+    Keep only the electronic states of each species, lumping together its
+    vibrational and rotational levels (and any key-value pair states).
+``vibrational_above(n)``
+    Lump together the vibrational levels above ``v=n`` as a single species with
+    the state ``v=n+1+`` (for example, ``"CO v=6+"`` for ``n=5``).
+
+Examples
+--------
+>>> from pyvalem.reaction import Reaction
+>>> from pyvalem.reaction_reduction import NetworkReducer, vibrational_above
+>>> reducer = NetworkReducer(vibrational_above(1))
+>>> reducer.add([
+...     Reaction("e- + CO v=0 → e- + CO v=1"),
+...     Reaction("e- + CO v=0 → e- + CO v=2"),
+...     Reaction("e- + CO v=0 → e- + CO v=3"),
+...     Reaction("e- + CO v=2 → e- + CO v=3"),
+...     Reaction("e- + N2 → e- + N2 v=1"),
+... ])
+>>> reducer.reactions
+[e- + CO v=0 → CO v=1 + e-, e- + CO v=0 → CO v=2+ + e-, e- + N2 → N2 v=1 + e-]
+>>> reducer.sources
+[[0], [1, 2], [4]]
+>>> reducer.reduce(seeds=["CO v=0"]).reactions
+[e- + CO v=0 → CO v=1 + e-, e- + CO v=0 → CO v=2+ + e-]
+"""
+
+from collections import namedtuple
+
+from .reaction import Reaction
+from .reaction_network import ReactionNetwork
+from .stateful_species import StatefulSpecies
+from .states import ELECTRONIC_STATES, VibrationalState
+
+ReducedNetwork = namedtuple("ReducedNetwork", "reactions sources")
+ReducedNetwork.__doc__ = """\
+A reduced reaction network: the lumped reactions and, for each, the indices of
+the original reactions merged into it.
+"""
+
+
+def _with_states(species, states):
+    """Return species with its states replaced by the state strings states."""
+    if not states:
+        return StatefulSpecies(repr(species.formula))
+    return StatefulSpecies("{} {}".format(species.formula, ";".join(states)))
+
+
+def strip_states(species):
+    """Lump all the states of a species together.
+
+    Parameters
+    ----------
+    species : StatefulSpecies
+
+    Returns
+    -------
+    StatefulSpecies
+    """
+    return _with_states(species, [])
+
+
+def electronic_states(species):
+    """Lump together the states of a species with the same electronic state.
+
+    Parameters
+    ----------
+    species : StatefulSpecies
+
+    Returns
+    -------
+    StatefulSpecies
+    """
+    return _with_states(
+        species,
+        [
+            repr(state)
+            for state in species.states
+            if isinstance(state, ELECTRONIC_STATES)
+        ],
+    )
+
+
+def vibrational_above(n):
+    """Return a lumping rule for the vibrational levels above v=n.
+
+    The vibrational levels of each species (and electronic state) with ``v > n``
+    are lumped into one, labelled by the state ``v=n+1+``; all the other states
+    are unchanged. Polyatomic and unspecified vibrational states are not lumped.
+
+    Parameters
+    ----------
+    n : int
+
+    Returns
+    -------
+    callable
+    """
+
+    def lump(species):
+        states = []
+        for state in species.states:
+            if isinstance(state, VibrationalState) and isinstance(state.v, int):
+                if state.v > n:
+                    states.append("v={}+".format(n + 1))
+                    continue
+            states.append(repr(state))
+        return _with_states(species, states)
+
+    return lump
+
+
+def _counts(terms):
+    counts = {}
+    for n, ss in terms:
+        key = repr(ss)
+        counts[key] = counts.get(key, 0) + n
+    return counts
+
+
+class NetworkReducer:
+    """Reduce a reaction network by lumping equivalent species together.
+
+    Reactions are added to the reducer (all at once or in batches, with `add`),
+    which rewrites each in terms of the lumped species, and merges it with any
+    rewritten reaction already added which has the same canonical representation.
+    The lumped species are cached, so that each distinct species is lumped only
+    once, however many reactions it takes part in.
+
+    Parameters
+    ----------
+    lump : callable
+        The lumping rule: a function of a `StatefulSpecies` returning the
+        `StatefulSpecies` for its lump, such as `strip_states`,
+        `electronic_states` or the rule returned by `vibrational_above`.
+    drop_null : bool, default=True
+        If ``True``, drop the reactions which lumping reduces to a null process,
+        with the same products as reactants (for example, vibrational excitation
+        when the vibrational levels are lumped together).
+
+    Attributes
+    ----------
+    reactions : list of Reaction
+        The distinct rewritten reactions. A rewritten reaction keeps the rate law
+        of its original reaction only for as long as it is merged with no other;
+        the rate laws of merged reactions must be combined by the caller, using
+        `sources`.
+    sources : list of list of int
+        The indices of the original reactions merged into each rewritten
+        reaction, counting the reactions in the order they were added.
+    nadded : int
+        The number of reactions added.
+    """
+
+    def __init__(self, lump, drop_null=True):
+        self.lump = lump
+        self.drop_null = drop_null
+        self.reactions = []
+        self.sources = []
+        self.nadded = 0
+        self._lumped = {}
+        self._reaction_ids = {}
+
+    def lumped(self, species):
+        """Return the lump of a species.
+
+        Parameters
+        ----------
+        species : StatefulSpecies or str
+
+        Returns
+        -------
+        StatefulSpecies
+        """
+        if not isinstance(species, StatefulSpecies):
+            species = StatefulSpecies(species)
+        key = repr(species)
+        try:
+            return self._lumped[key]
+        except KeyError:
+            lumped = self._lumped[key] = self.lump(species)
+            return lumped
+
+    def add(self, reactions):
+        """Rewrite and merge further reactions into the reduced network.
+
+        Parameters
+        ----------
+        reactions : iterable of Reaction
+        """
+        for reaction in reactions:
+            index = self.nadded
+            self.nadded += 1
+            reduced = Reaction.from_species(
+                [(n, self.lumped(ss)) for n, ss in reaction.reactants],
+                [(n, self.lumped(ss)) for n, ss in reaction.products],
+                sep=reaction.sep,
+                strict=False,
+                rate=reaction.rate,
+            )
+            lhs, rhs = reduced.canonical_sides()
+            if self.drop_null and _counts(reduced.reactants) == _counts(
+                reduced.products
+            ):
+                continue
+            key = reduced.sep, lhs, rhs
+            try:
+                ir = self._reaction_ids[key]
+            except KeyError:
+                self._reaction_ids[key] = len(self.reactions)
+                self.reactions.append(reduced)
+                self.sources.append([index])
+                continue
+            self.sources[ir].append(index)
+            self.reactions[ir].rate = None
+
+    def reduce(self, seeds=None, species=None, require_all_reactants=True):
+        """Return the reduced network, restricted to a set of species.
+
+        Parameters
+        ----------
+        seeds : iterable of StatefulSpecies or str, optional
+            If given, keep only the reactions reachable from these species (see
+            `ReactionNetwork.reachable`). The seeds are lumped before use, so
+            they may be given as any member of their lump.
+        species : iterable of StatefulSpecies or str, optional
+            If given, keep only the reactions involving no species (other than
+            those ignored by `ReactionNetwork`, such as electrons) outside this
+            set. These species are also lumped before use.
+        require_all_reactants : bool, default=True
+            Passed to `ReactionNetwork.reachable`.
+
+        Returns
+        -------
+        ReducedNetwork
+        """
+        keep = range(len(self.reactions))
+        if seeds is not None:
+            network = ReactionNetwork(self.reactions)
+            seeds = [
+                seed
+                for seed in (repr(self.lumped(ss)) for ss in seeds)
+                if seed in network.species
+            ]
+            keep = network.reachable(seeds, require_all_reactants).reactions
+        if species is not None:
+            allowed = {repr(self.lumped(ss)) for ss in species}
+            allowed.update(ReactionNetwork.default_ignore)
+            keep = [
+                ir
+                for ir in keep
+                if all(
+                    repr(ss) in allowed
+                    for side in (
+                        self.reactions[ir].reactants,
+                        self.reactions[ir].products,
+                    )
+                    for _, ss in side
+                )
+            ]
+        return ReducedNetwork(
+            [self.reactions[ir] for ir in keep], [self.sources[ir] for ir in keep]
+        )
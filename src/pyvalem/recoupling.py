@@ -0,0 +1,356 @@
+"""
+This module contains functions for building the matrices transforming between
+the LS-, jj- and jK-coupled bases of the levels of an atomic configuration with
+two open subshells, such as 2p5.3p.
+
+With S1, L1 and S2, L2 the spins and orbital angular momenta of the terms of the
+first and second open subshells (the *parent* terms), the bases of the levels of
+total angular momentum J are:
+
+``"LS"``
+    ((S1 S2)S, (L1 L2)L)J, labelled by an `AtomicTermSymbol` such as ``3D_3``.
+``"jj"``
+    ((S1 L1)J1, (S2 L2)J2)J, labelled by a `J1J2_Coupling` such as
+    ``(3/2,1/2)_2``.
+``"jK"``
+    (((S1 L1)J1, L2)K, S2)J, labelled by a `J1K_LK_Coupling` such as
+    ``2[5/2]_3``.
+
+Each basis state is returned as a `BasisState`, with its parent terms (and
+their J1 and J2, where these are quantum numbers of the basis) as a
+`CompoundLSCoupling` such as ``2p5(2Po_3/2)3p(2Po)``. The matrix elements are
+products of the recoupling coefficients of the parent and coupled angular
+momenta, which are 6j and 9j symbols (see `pyvalem.wigner`); both these and the
+coefficients are memoized.
+
+This module requires NumPy.
+
+Examples
+--------
+>>> from pyvalem.recoupling import transformation_matrix
+>>> transformation = transformation_matrix("1s2.2s2.2p5.3p", 3, "LS", "jK")
+>>> transformation.columns
+[BasisState(parents=2p5(2Po)3p(2Po), state=3D_3)]
+>>> transformation.rows
+[BasisState(parents=2p5(2Po_3/2)3p(2Po), state=2[5/2]_3)]
+>>> transformation.matrix
+array([[1.]])
+"""
+
+from collections import namedtuple
+from fractions import Fraction
+from functools import lru_cache
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .atomic_terms import subshell_terms
+from .states import (
+    AtomicConfiguration,
+    AtomicTermSymbol,
+    CompoundLSCoupling,
+    J1J2_Coupling,
+    J1K_LK_Coupling,
+)
+from .states.atomic_configuration import subshell_index
+from .states.atomic_term_symbol import atom_L_symbols
+from .wigner import wigner_6j, wigner_9j
+
+SCHEMES = ("LS", "jj", "jK")
+
+BasisState = namedtuple("BasisState", "parents state")
+BasisState.__doc__ = """\
+A state of a coupled basis: its parent terms, as a `CompoundLSCoupling`, and its
+coupled state.
+"""
+
+Transformation = namedtuple("Transformation", "matrix rows columns")
+Transformation.__doc__ = """\
+A transformation between two bases: the matrix of the overlaps <row|column> of
+the states of the bases, as a NumPy array, and the rows and columns as lists of
+`BasisState`.
+"""
+
+
+class RecouplingError(Exception):
+    pass
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for recoupling matrices")
+
+
+def _couple(j1, j2):
+    """Return the angular momenta obtained by coupling j1 and j2."""
+    return [abs(j1 - j2) + k for k in range(int(j1 + j2 - abs(j1 - j2)) + 1)]
+
+
+def _triangle(j1, j2, j3):
+    return abs(j1 - j2) <= j3 <= j1 + j2 and (j1 + j2 + j3).denominator == 1
+
+
+def _phase(exponent):
+    return -1 if int(exponent) % 2 else 1
+
+
+def _s_j(j):
+    return str(j.numerator) if j.denominator == 1 else "{}/2".format(2 * j)
+
+
+def _s_term(Smult, L, parity, J=None):
+    s_term = "{}{}{}".format(Smult, atom_L_symbols[L], parity)
+    return s_term if J is None else "{}_{}".format(s_term, _s_j(J))
+
+
+@lru_cache(maxsize=4096)
+def _ls_jj(S1, L1, S2, L2, S, L, J1, J2, J):
+    """<((S1 L1)J1, (S2 L2)J2)J | ((S1 S2)S, (L1 L2)L)J>."""
+    return math.sqrt((2 * J1 + 1) * (2 * J2 + 1) * (2 * S + 1) * (2 * L + 1)) * (
+        wigner_9j(S1, S2, S, L1, L2, L, J1, J2, J)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _ls_jK(S1, L1, S2, L2, S, L, J1, K, J):
+    """<(((S1 L1)J1, L2)K, S2)J | ((S1 S2)S, (L1 L2)L)J>."""
+    # Recouple through the states ((S1 (L1 L2)L)K, S2)J.
+    orbital = (
+        _phase(S1 + L1 + L2 + K)
+        * math.sqrt((2 * J1 + 1) * (2 * L + 1))
+        * wigner_6j(S1, L1, J1, L2, K, L)
+    )
+    spin = (
+        _phase(S1 + S2 - S + S2 + S1 + L + J + S2 + K - J)
+        * math.sqrt((2 * S + 1) * (2 * K + 1))
+        * wigner_6j(S2, S1, S, L, J, K)
+    )
+    return orbital * spin
+
+
+@lru_cache(maxsize=4096)
+def _jj_jK(S2, L2, J1, J2, K, J):
+    """<((J1 L2)K, S2)J | (J1, (S2 L2)J2)J>."""
+    return (
+        _phase(S2 + L2 - J2 + J1 + L2 + S2 + J)
+        * math.sqrt((2 * K + 1) * (2 * J2 + 1))
+        * wigner_6j(J1, L2, K, S2, J, J2)
+    )
+
+
+def _open_subshells(configuration):
+    """Return the orbitals of the two open subshells of a configuration, in the
+    standard subshell order."""
+    if not isinstance(configuration, AtomicConfiguration):
+        configuration = AtomicConfiguration(configuration)
+    orbitals = sorted(
+        (
+            orbital
+            for orbital in configuration.orbitals
+            if 0 < orbital.nocc < 4 * orbital.l + 2
+        ),
+        key=lambda orbital: subshell_index(orbital.n, orbital.l),
+    )
+    if len(orbitals) != 2:
+        raise RecouplingError(
+            "{} does not have two open subshells".format(configuration)
+        )
+    return orbitals
+
+
+def _parent_terms(orbital, parent):
+    """Return the terms (S, L) of an open subshell, or just that of parent."""
+    terms = subshell_terms(orbital.l, orbital.nocc)
+    if parent is not None:
+        if not isinstance(parent, AtomicTermSymbol):
+            parent = AtomicTermSymbol(parent)
+        if (parent.Smult, parent.L) not in terms:
+            raise RecouplingError(
+                "{} is not a term of {}".format(parent.state_str, orbital)
+            )
+        terms = {(parent.Smult, parent.L): terms[parent.Smult, parent.L]}
+    for (Smult, L), n in sorted(terms.items()):
+        if n > 1:
+            raise RecouplingError(
+                "The term {} of {} occurs more than once: its parent terms must"
+                " be given".format(_s_term(Smult, L, ""), orbital)
+            )
+        yield Fraction(Smult - 1, 2), L
+
+
+def basis(configuration, J, scheme="LS", parents=None):
+    """Return the states of a coupled basis of the levels of a configuration.
+
+    Parameters
+    ----------
+    configuration : AtomicConfiguration or str
+        A configuration with two open subshells.
+    J : int, float, Fraction or str
+        The total angular momentum quantum number of the levels.
+    scheme : str, default="LS"
+        The coupling scheme: ``"LS"``, ``"jj"`` or ``"jK"``.
+    parents : sequence of (AtomicTermSymbol, str or None), optional
+        The terms of the first and second open subshells to which the basis is
+        restricted (``None`` for all the terms of a subshell).
+
+    Returns
+    -------
+    list of BasisState
+
+    Raises
+    ------
+    RecouplingError
+        If the configuration does not have two open subshells, the scheme is
+        unknown, or a term of an open subshell occurs more than once and its
+        parent terms are not given.
+    """
+    return [label for _, label in _basis(configuration, J, scheme, parents)]
+
+
+def _basis(configuration, J, scheme, parents):
+    """Generate the states of a basis as (quantum numbers, BasisState) pairs."""
+    if scheme not in SCHEMES:
+        raise RecouplingError("Unknown coupling scheme: {}".format(scheme))
+    J = Fraction(J)
+    orbital1, orbital2 = _open_subshells(configuration)
+    parent1, parent2 = parents or (None, None)
+    parity1, parity2 = (
+        "o" if orbital.l * orbital.nocc % 2 else "" for orbital in (orbital1, orbital2)
+    )
+    parity = "o" if (parity1 == "o") != (parity2 == "o") else ""
+    for S1, L1 in _parent_terms(orbital1, parent1):
+        for S2, L2 in _parent_terms(orbital2, parent2):
+            qn_parents = (S1, L1, S2, L2)
+            Smult1, Smult2 = int(2 * S1 + 1), int(2 * S2 + 1)
+
+            def label(s_state, J1=None, J2=None):
+                s_parents = "{}({}){}({})".format(
+                    orbital1,
+                    _s_term(Smult1, L1, parity1, J1),
+                    orbital2,
+                    _s_term(Smult2, L2, parity2, J2),
+                )
+                return CompoundLSCoupling(s_parents), s_state
+
+            if scheme == "LS":
+                for S in _couple(S1, S2):
+                    for L in _couple(Fraction(L1), Fraction(L2)):
+                        if _triangle(S, L, J):
+                            state = AtomicTermSymbol(
+                                _s_term(int(2 * S + 1), int(L), parity, J)
+                            )
+                            yield qn_parents + (S, int(L)), BasisState(*label(state))
+            elif scheme == "jj":
+                for J1 in _couple(S1, Fraction(L1)):
+                    for J2 in _couple(S2, Fraction(L2)):
+                        if _triangle(J1, J2, J):
+                            state = J1J2_Coupling(
+                                "({},{}){}_{}".format(
+                                    _s_j(J1), _s_j(J2), parity, _s_j(J)
+                                )
+                            )
+                            yield qn_parents + (J1, J2), BasisState(
+                                *label(state, J1, J2)
+                            )
+            else:
+                for J1 in _couple(S1, Fraction(L1)):
+                    for K in _couple(J1, Fraction(L2)):
+                        if _triangle(K, S2, J):
+                            state = J1K_LK_Coupling(
+                                "{}[{}]{}_{}".format(Smult2, _s_j(K), parity, _s_j(J))
+                            )
+                            yield qn_parents + (J1, K), BasisState(*label(state, J1))
+
+
+def _coefficient(scheme1, qn1, scheme2, qn2, J):
+    """Return <qn2|qn1> for the states with quantum numbers qn1 in scheme1 and
+    qn2 in scheme2."""
+    if qn1[:4] != qn2[:4]:
+        return 0.0
+    S1, L1, S2, L2 = qn1[:4]
+    if scheme1 == scheme2:
+        return float(qn1 == qn2)
+    pair = scheme1 + "-" + scheme2
+    if pair in ("LS-jj", "jj-LS"):
+        (S, L), (J1, J2) = (qn1[4:], qn2[4:]) if scheme1 == "LS" else (qn2[4:], qn1[4:])
+        return _ls_jj(S1, L1, S2, L2, S, L, J1, J2, J)
+    if pair in ("LS-jK", "jK-LS"):
+        (S, L), (J1, K) = (qn1[4:], qn2[4:]) if scheme1 == "LS" else (qn2[4:], qn1[4:])
+        return _ls_jK(S1, L1, S2, L2, S, L, J1, K, J)
+    (J1, J2), (J1_K, K) = (qn1[4:], qn2[4:]) if scheme1 == "jj" else (qn2[4:], qn1[4:])
+    if J1 != J1_K:
+        return 0.0
+    return _jj_jK(S2, L2, J1, J2, K, J)
+
+
+def transformation_matrix(configuration, J, from_scheme, to_scheme, parents=None):
+    """Return the matrix transforming between two coupled bases of the levels of
+    a configuration.
+
+    Parameters
+    ----------
+    configuration : AtomicConfiguration or str
+        A configuration with two open subshells.
+    J : int, float, Fraction or str
+        The total angular momentum quantum number of the levels.
+    from_scheme, to_scheme : str
+        The coupling schemes of the bases: ``"LS"``, ``"jj"`` or ``"jK"``.
+    parents : sequence of (AtomicTermSymbol, str or None), optional
+        The terms of the first and second open subshells to which the bases are
+        restricted (see `basis`).
+
+    Returns
+    -------
+    Transformation
+        The (orthogonal) matrix of the overlaps of the states of the `to_scheme`
+        basis (rows) with those of the `from_scheme` basis (columns), so that the
+        matrix transforms the components of a level in the `from_scheme` basis
+        into its components in the `to_scheme` basis.
+
+    Raises
+    ------
+    RecouplingError
+        As for `basis`.
+    """
+    _require_numpy()
+    columns = list(_basis(configuration, J, from_scheme, parents))
+    rows = list(_basis(configuration, J, to_scheme, parents))
+    J = Fraction(J)
+    matrix = np.array(
+        [
+            [_coefficient(from_scheme, qn1, to_scheme, qn2, J) for qn1, _ in columns]
+            for qn2, _ in rows
+        ]
+    ).reshape(len(rows), len(columns))
+    return Transformation(
+        matrix, [label for _, label in rows], [label for _, label in columns]
+    )
+
+
+def transformation_matrices(configuration, from_scheme, to_scheme, parents=None):
+    """Return the matrices transforming between two coupled bases of the levels of
+    a configuration, for each J.
+
+    The parameters are those of `transformation_matrix`.
+
+    Returns
+    -------
+    dict
+        The `Transformation` for each J of the levels of the configuration (as a
+        Fraction), in increasing order of J.
+    """
+    orbital1, orbital2 = _open_subshells(configuration)
+    Js = set()
+    parent1, parent2 = parents or (None, None)
+    for S1, L1 in _parent_terms(orbital1, parent1):
+        for S2, L2 in _parent_terms(orbital2, parent2):
+            for J1 in _couple(S1, Fraction(L1)):
+                for J2 in _couple(S2, Fraction(L2)):
+                    Js.update(_couple(J1, J2))
+    return {
+        J: transformation_matrix(configuration, J, from_scheme, to_scheme, parents)
+        for J in sorted(Js)
+    }
@@ -0,0 +1,283 @@
+"""
+This module contains functions for checking the radiative selection rules of
+transitions between pairs of `StatefulSpecies` (an upper and a lower level), for
+electric and magnetic multipole transitions such as E1, M1 and E2.
+
+The rules are applied to the quantum numbers parsed from the states of the
+species: J, S, L and the parity of an `AtomicTermSymbol` (or just the parity of
+an `AtomicConfiguration`); J, K and the parity of a `J1K_LK_Coupling`; J, J1, J2
+and the parity of a `J1J2_Coupling`; S, Λ, the Σ reflection symmetry, the g/u
+parity and Ω of a `MolecularTermSymbol`; and the J of a `RotationalState`. A rule
+is only applied if both levels specify the quantum numbers it involves.
+
+The result of a check is an integer code, the bitwise OR of the flags of the
+rules violated by the transition, so that 0 (``ALLOWED``) means no rule is
+violated:
+
+``FORBIDDEN_J``
+    The triangle rule for J, e.g. ΔJ = 0, ±1, not 0 ↔ 0 for E1 and M1.
+``FORBIDDEN_PARITY``
+    The parity rule: a change of parity for E1, E3, M2, ...; no change for M1,
+    E2, ....
+``FORBIDDEN_SPIN``
+    ΔS = 0 (for LS coupling, and Hund's cases (a) and (b)): transitions
+    violating only this rule are intercombination lines.
+``FORBIDDEN_COUPLING``
+    The rules of the angular momentum coupling scheme of the levels: the
+    triangle rule for L (or K) with rank k for Ek and k-1 for Mk (so ΔL = 0 for
+    M1); ΔJ1 = 0 and the triangle rule for J2 in J1J2 coupling; |ΔΛ| <= k,
+    |ΔΩ| <= k and Σ+ ↔ Σ+, Σ- ↔ Σ- (Σ+ ↔ Σ- for magnetic multipoles) for
+    molecules.
+``DIFFERENT_SPECIES``
+    The upper and lower levels are of different species.
+
+The flags of the rigorous rules, which hold whatever the coupling of the
+levels, are combined in ``RIGOROUS``.
+
+Line lists of many transitions are checked with `check_transitions`, which
+parses each distinct level once, tabulates its quantum numbers and applies the
+rules to whole arrays of (upper, lower) pairs; this requires NumPy.
+
+Examples
+--------
+>>> from pyvalem.selection_rules import check_transition, FORBIDDEN_SPIN
+>>> check_transition("C 1s2.2s2.2p.3s 3Po_1", "C 1s2.2s2.2p2 3P_2")
+0
+>>> check_transition("C 1s2.2s2.2p.3s 3Po_1", "C 1s2.2s2.2p2 1D_2") == FORBIDDEN_SPIN
+True
+>>> check_transition("O 1s2.2s2.2p4 1S_0", "O 1s2.2s2.2p4 1D_2", multipole="E2")
+0
+"""
+
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .stateful_species import StatefulSpecies
+from .states import (
+    AtomicConfiguration,
+    AtomicTermSymbol,
+    J1J2_Coupling,
+    J1K_LK_Coupling,
+    MolecularTermSymbol,
+    RotationalState,
+)
+
+ALLOWED = 0
+FORBIDDEN_J = 1
+FORBIDDEN_PARITY = 2
+FORBIDDEN_SPIN = 4
+FORBIDDEN_COUPLING = 8
+DIFFERENT_SPECIES = 16
+RIGOROUS = FORBIDDEN_J | FORBIDDEN_PARITY | DIFFERENT_SPECIES
+
+# The quantum numbers of a level used by the selection rules, with angular
+# momenta doubled so that they are integers; -1 (or 0 for the Σ reflection
+# symmetry, otherwise +1 or -1) if not specified.
+_QuantumNumbers = namedtuple(
+    "_QuantumNumbers", "J2 parity S2 L K2 J1_2 J2_2 Lambda reflection Omega2"
+)
+
+_Lambdas = {"Σ": 0, "Π": 1, "Δ": 2, "Φ": 3, "Γ": 4}
+
+
+class SelectionRuleError(Exception):
+    pass
+
+
+def _doubled(j):
+    return -1 if j is None else int(round(2 * j))
+
+
+def _multipole(multipole):
+    """Return (k, magnetic) for a multipole such as "E1" or "M1"."""
+    try:
+        kind, k = multipole[0].upper(), int(multipole[1:])
+    except (IndexError, ValueError):
+        kind, k = "", 0
+    if kind not in ("E", "M") or k < 1:
+        raise SelectionRuleError("Invalid multipole: {}".format(multipole))
+    return k, kind == "M"
+
+
+def quantum_numbers(species):
+    """Return the quantum numbers of a level used by the selection rules.
+
+    Parameters
+    ----------
+    species : StatefulSpecies or str
+
+    Returns
+    -------
+    tuple
+        The formula of the species (as a string) and a named tuple of its
+        quantum numbers: 2J, parity (0 for even, 1 for odd), 2S, L, 2K, 2J1, 2J2,
+        Λ, the Σ reflection symmetry (+1 or -1) and 2Ω, each -1 (0 for the
+        reflection symmetry) if not specified by the states of the species.
+    """
+    if not isinstance(species, StatefulSpecies):
+        species = StatefulSpecies(species)
+    qn = dict.fromkeys(_QuantumNumbers._fields, -1)
+    qn["reflection"] = 0
+    for state in species.states:
+        if isinstance(state, AtomicConfiguration):
+            if qn["parity"] == -1:
+                qn["parity"] = int(state.parity == "o")
+        elif isinstance(state, AtomicTermSymbol):
+            qn.update(J2=_doubled(state.J), S2=state.Smult - 1, L=state.L)
+            qn["parity"] = int(state.parity == "o")
+        elif isinstance(state, J1K_LK_Coupling):
+            qn.update(J2=_doubled(state.J), K2=_doubled(state.K))
+            qn["parity"] = int(state.parity == "o")
+        elif isinstance(state, J1J2_Coupling):
+            qn.update(J2=_doubled(state.J), J1_2=_doubled(state.J1))
+            qn.update(J2_2=_doubled(state.J2), parity=int(state.parity == "o"))
+        elif isinstance(state, MolecularTermSymbol):
+            irrep = state.irrep
+            qn["S2"] = state.Smult - 1
+            if irrep[0] in _Lambdas:
+                # Λ is only defined for the states of linear molecules.
+                qn["Lambda"] = _Lambdas[irrep[0]]
+            qn["Omega2"] = _doubled(state.Omega)
+            if "+" in irrep or "-" in irrep:
+                qn["reflection"] = 1 if "+" in irrep else -1
+            if irrep[-1] in "gu":
+                qn["parity"] = int(irrep[-1] == "u")
+        elif isinstance(state, RotationalState):
+            qn["J2"] = _doubled(state.J)
+    return repr(species.formula), _QuantumNumbers(**qn)
+
+
+def _known(a, b):
+    return (a >= 0) & (b >= 0)
+
+
+def _triangle_violated(a2, b2, k):
+    """Are the doubled angular momenta a2, b2 known and not coupled by rank k?"""
+    return _known(a2, b2) & ((abs(a2 - b2) > 2 * k) | (a2 + b2 < 2 * k))
+
+
+def _codes(upper, lower, k, magnetic):
+    """Return the code(s) for upper and lower _QuantumNumbers, whose fields may be
+    ints or (for a batch of transitions) NumPy arrays."""
+    # The orbital (L, K, J2) rank: k for Ek and k-1 for Mk.
+    kl = k - magnetic
+    parity_change = (k + magnetic) % 2
+    code = FORBIDDEN_J * _triangle_violated(upper.J2, lower.J2, k)
+    code |= FORBIDDEN_PARITY * (
+        _known(upper.parity, lower.parity)
+        & ((upper.parity + lower.parity) % 2 != parity_change)
+    )
+    code |= FORBIDDEN_SPIN * (_known(upper.S2, lower.S2) & (upper.S2 != lower.S2))
+    coupling = _triangle_violated(2 * upper.L, 2 * lower.L, kl)
+    coupling |= _triangle_violated(upper.K2, lower.K2, kl)
+    coupling |= _known(upper.J1_2, lower.J1_2) & (upper.J1_2 != lower.J1_2)
+    coupling |= _triangle_violated(upper.J2_2, lower.J2_2, kl)
+    Lambda_known = _known(upper.Lambda, lower.Lambda)
+    coupling |= Lambda_known & (abs(upper.Lambda - lower.Lambda) > k)
+    coupling |= _known(upper.Omega2, lower.Omega2) & (
+        abs(upper.Omega2 - lower.Omega2) > 2 * k
+    )
+    reflections = upper.reflection * lower.reflection
+    coupling |= (reflections != 0) & (reflections == (1 if magnetic else -1))
+    code |= FORBIDDEN_COUPLING * coupling
+    return code
+
+
+def check_transition(upper, lower, multipole="E1"):
+    """Check the selection rules for a transition between two levels.
+
+    Parameters
+    ----------
+    upper, lower : StatefulSpecies or str
+        The upper and lower levels of the transition.
+    multipole : str, default="E1"
+        The multipole of the transition: ``"E1"``, ``"M1"``, ``"E2"``, and so on.
+
+    Returns
+    -------
+    int
+        The bitwise OR of the flags of the selection rules the transition
+        violates: ``ALLOWED`` (0) if it violates none.
+
+    Raises
+    ------
+    SelectionRuleError
+        If the multipole is invalid.
+    """
+    k, magnetic = _multipole(multipole)
+    upper_formula, upper_qn = quantum_numbers(upper)
+    lower_formula, lower_qn = quantum_numbers(lower)
+    code = int(_codes(upper_qn, lower_qn, k, magnetic))
+    if upper_formula != lower_formula:
+        code |= DIFFERENT_SPECIES
+    return code
+
+
+def check_transitions(uppers, lowers, multipole="E1", levels=None):
+    """Check the selection rules for many transitions at once.
+
+    Each distinct level is parsed once, and the rules are applied to the arrays
+    of the quantum numbers of all the transitions together.
+
+    Parameters
+    ----------
+    uppers, lowers : sequence or numpy.ndarray
+        The upper and lower levels of the transitions, as `StatefulSpecies` or
+        strings, or (if `levels` is given) as integer indices into `levels`.
+    multipole : str, default="E1"
+        The multipole of the transitions: ``"E1"``, ``"M1"``, ``"E2"``, and so on.
+    levels : sequence of StatefulSpecies or str, optional
+        The levels referred to by `uppers` and `lowers`, as in a line list with a
+        separate table of levels.
+
+    Returns
+    -------
+    numpy.ndarray of uint8
+        The code of each transition, as returned by `check_transition`.
+
+    Raises
+    ------
+    SelectionRuleError
+        If the multipole is invalid, or `uppers` and `lowers` have different
+        lengths.
+    """
+    if np is None:
+        raise ImportError("NumPy is required to check transitions in batches")
+    k, magnetic = _multipole(multipole)
+    if len(uppers) != len(lowers):
+        raise SelectionRuleError(
+            "{} upper and {} lower levels cannot be paired".format(
+                len(uppers), len(lowers)
+            )
+        )
+    if levels is None:
+        keys = [
+            species if isinstance(species, str) else repr(species)
+            for species in list(uppers) + list(lowers)
+        ]
+        levels, indices = np.unique(np.array(keys, dtype=str), return_inverse=True)
+        indices = indices.reshape(-1)
+        upper_indices, lower_indices = indices[: len(uppers)], indices[len(uppers) :]
+    else:
+        upper_indices = np.asarray(uppers, dtype=int)
+        lower_indices = np.asarray(lowers, dtype=int)
+
+    formula_ids = {}
+    formulas = np.empty(len(levels), dtype=int)
+    table = np.empty((len(levels), len(_QuantumNumbers._fields)), dtype=np.int16)
+    for i, species in enumerate(levels):
+        formula, qn = quantum_numbers(species)
+        formulas[i] = formula_ids.setdefault(formula, len(formula_ids))
+        table[i] = qn
+    codes = _codes(
+        _QuantumNumbers(*table[upper_indices].T),
+        _QuantumNumbers(*table[lower_indices].T),
+        k,
+        magnetic,
+    )
+    codes |= DIFFERENT_SPECIES * (formulas[upper_indices] != formulas[lower_indices])
+    return codes.astype(np.uint8)
@@ -0,0 +1,286 @@
+"""
+This module contains the `SpeciesIndex` class, an index over a collection of
+`StatefulSpecies` supporting queries on their formulas, the types of their states
+and the numeric quantum numbers parsed by the `State` classes, for example "all CO
+species with v ≥ 3" or "all species with an atomic term symbol with J=1/2".
+
+The quantum numbers indexed for each State class are listed in
+``QUANTUM_NUMBERS``; key-value pair states with a numeric value (such as ``n=3``)
+are indexed under their key. Each query is answered from the index, by hash
+lookups and binary searches over the distinct values of the quantum numbers,
+rather than by looping over the states of every species.
+
+Examples
+--------
+>>> from pyvalem.species_index import SpeciesIndex
+>>> from pyvalem.states import AtomicTermSymbol
+>>> index = SpeciesIndex([
+...     "CO v=0", "CO v=3", "CO X(1SIGMA+);v=5", "CO+ v=4", "Ar+ 2P_1/2",
+...     "Ar+ 2P_3/2", "Ar+", "Ar 3p5.4s 3P_1", "H2 J=3",
+... ])
+>>> index.find(formula="CO", v=(3, None))
+[CO v=3, CO X(1Σ+);v=5]
+>>> index.find(state_type=AtomicTermSymbol, J=0.5)
+[Ar+ 2P_1/2]
+>>> index.find(formula="Ar+")
+[Ar+ 2P_1/2, Ar+ 2P_3/2, Ar+]
+>>> index.find(J=3)
+[H2 J=3]
+"""
+
+from bisect import bisect_left, bisect_right, insort
+
+from .formula import Formula
+from .stateful_species import StatefulSpecies
+from .states import (
+    AtomicTermSymbol,
+    GenericExcitedState,
+    J1J2_Coupling,
+    J1K_LK_Coupling,
+    KeyValuePair,
+    MolecularTermSymbol,
+    RacahSymbol,
+    RotationalState,
+    VibrationalState,
+)
+from .states._state_parser import state_parser
+
+# The names of the numeric quantum numbers (attributes) of each State class.
+QUANTUM_NUMBERS = {
+    GenericExcitedState: ("int_n",),
+    AtomicTermSymbol: ("S", "L", "J", "seniority"),
+    MolecularTermSymbol: ("S", "Omega"),
+    J1K_LK_Coupling: ("S", "K", "J"),
+    J1J2_Coupling: ("J1", "J2", "J"),
+    VibrationalState: ("v",),
+    RotationalState: ("J",),
+    RacahSymbol: ("principal", "J"),
+}
+
+# The attributes holding the quantum numbers which are not named after them.
+_ATTRIBUTE_NAMES = {(RacahSymbol, "J"): "j_term"}
+
+
+def quantum_numbers(state):
+    """Return the numeric quantum numbers of a state.
+
+    Parameters
+    ----------
+    state : State
+
+    Returns
+    -------
+    dict
+        The values of the quantum numbers which are specified for `state`, keyed
+        by name. For a `KeyValuePair` state with a numeric value, this is its
+        value keyed by its key.
+    """
+    if isinstance(state, KeyValuePair):
+        try:
+            return {state.key: float(state.value)}
+        except ValueError:
+            return {}
+    qns = {}
+    for name in QUANTUM_NUMBERS.get(type(state), ()):
+        value = getattr(state, _ATTRIBUTE_NAMES.get((type(state), name), name), None)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            qns[name] = value
+    return qns
+
+
+def formula_key(formula):
+    """Return the canonical key of a formula.
+
+    Parameters
+    ----------
+    formula : Formula, StatefulSpecies or str
+
+    Returns
+    -------
+    str
+    """
+    if isinstance(formula, StatefulSpecies):
+        formula = formula.formula
+    elif not isinstance(formula, Formula):
+        formula = Formula(formula)
+    return repr(formula)
+
+
+class _ValueIndex:
+    """Species ids indexed by the value of one quantum number, with the distinct
+    values kept sorted for range queries."""
+
+    def __init__(self):
+        self.ids = {}
+        self.values = []
+
+    def add(self, value, species_id):
+        try:
+            self.ids[value].add(species_id)
+        except KeyError:
+            self.ids[value] = {species_id}
+            insort(self.values, value)
+
+    def find(self, value):
+        """Return the ids of the species with quantum number value, a number or a
+        (min, max) tuple of inclusive bounds, either of which may be None."""
+        if not isinstance(value, tuple):
+            return self.ids.get(value, set())
+        lo, hi = value
+        i = 0 if lo is None else bisect_left(self.values, lo)
+        j = len(self.values) if hi is None else bisect_right(self.values, hi)
+        return set().union(*(self.ids[v] for v in self.values[i:j]))
+
+
+class SpeciesIndex:
+    """An index of `StatefulSpecies` by formula, state type and quantum numbers.
+
+    Species are identified by their canonical ``repr``: adding a species equal
+    to one already in the index does nothing.
+
+    Parameters
+    ----------
+    species : iterable of StatefulSpecies or str, optional
+
+    Attributes
+    ----------
+    species : list of StatefulSpecies
+        The indexed species, in the order they were added; the position of a
+        species in this list is its id.
+    """
+
+    def __init__(self, species=()):
+        self.species = []
+        self._ids = {}
+        self._by_formula = {}
+        self._by_state_type = {}
+        self._by_state = {}
+        # (State class, quantum number name) -> _ValueIndex
+        self._by_quantum_number = {}
+        self.update(species)
+
+    def __len__(self):
+        return len(self.species)
+
+    def __iter__(self):
+        return iter(self.species)
+
+    def __contains__(self, species):
+        if not isinstance(species, StatefulSpecies):
+            species = StatefulSpecies(species)
+        return repr(species) in self._ids
+
+    def add(self, species):
+        """Add a species to the index.
+
+        Parameters
+        ----------
+        species : StatefulSpecies or str
+
+        Returns
+        -------
+        int
+            The id of the species.
+        """
+        if not isinstance(species, StatefulSpecies):
+            species = StatefulSpecies(species)
+        key = repr(species)
+        try:
+            return self._ids[key]
+        except KeyError:
+            pass
+        isp = self._ids[key] = len(self.species)
+        self.species.append(species)
+        self._by_formula.setdefault(formula_key(species), set()).add(isp)
+        for state in species.states:
+            state_type = type(state)
+            self._by_state_type.setdefault(state_type, set()).add(isp)
+            self._by_state.setdefault((state_type, repr(state)), set()).add(isp)
+            for name, value in quantum_numbers(state).items():
+                qn_key = state_type, name
+                try:
+                    value_index = self._by_quantum_number[qn_key]
+                except KeyError:
+                    value_index = self._by_quantum_number[qn_key] = _ValueIndex()
+                value_index.add(value, isp)
+        return isp
+
+    def update(self, species):
+        """Add several species to the index.
+
+        Parameters
+        ----------
+        species : iterable of StatefulSpecies or str
+        """
+        for ss in species:
+            self.add(ss)
+
+    def _quantum_number_ids(self, state_type, name, value):
+        ids = set()
+        for (qn_state_type, qn_name), value_index in self._by_quantum_number.items():
+            if qn_name != name:
+                continue
+            if state_type is not None and not issubclass(qn_state_type, state_type):
+                continue
+            ids |= value_index.find(value)
+        return ids
+
+    def find_ids(self, formula=None, state_type=None, state=None, **conditions):
+        """Return the ids of the species satisfying all the given conditions.
+
+        Parameters
+        ----------
+        formula : Formula, StatefulSpecies or str, optional
+            The species must have this formula.
+        state_type : type, optional
+            The species must have a state of this `State` class. This also
+            restricts the states considered for the quantum number conditions.
+        state : State or str, optional
+            The species must have this state.
+        **conditions : number or tuple
+            Conditions on the quantum numbers of the states of the species (e.g.
+            ``v=2`` or ``J=0.5``), given as a value or a ``(min, max)`` tuple of
+            inclusive bounds, either of which may be ``None``. With no
+            `state_type`, a condition is satisfied by any state with a quantum
+            number of this name: for example, ``J`` is the rotational quantum
+            number of a `RotationalState` and the total angular momentum quantum
+            number of an `AtomicTermSymbol`.
+
+        Returns
+        -------
+        list of int
+            The ids of the matching species, in increasing order.
+        """
+        candidates = []
+        if formula is not None:
+            candidates.append(self._by_formula.get(formula_key(formula), set()))
+        if state_type is not None:
+            ids = set()
+            for indexed_type, type_ids in self._by_state_type.items():
+                if issubclass(indexed_type, state_type):
+                    ids |= type_ids
+            candidates.append(ids)
+        if state is not None:
+            if isinstance(state, str):
+                state = state_parser(state)
+            candidates.append(self._by_state.get((type(state), repr(state)), set()))
+        for name, value in conditions.items():
+            candidates.append(self._quantum_number_ids(state_type, name, value))
+        if not candidates:
+            return list(range(len(self.species)))
+        candidates.sort(key=len)
+        return sorted(set.intersection(*candidates))
+
+    def find(self, formula=None, state_type=None, state=None, **conditions):
+        """Return the species satisfying all the given conditions.
+
+        The parameters are those of `find_ids`.
+
+        Returns
+        -------
+        list of StatefulSpecies
+        """
+        return [
+            self.species[isp]
+            for isp in self.find_ids(formula, state_type, state, **conditions)
+        ]
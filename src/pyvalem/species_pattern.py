@@ -0,0 +1,225 @@
+"""
+This module contains the `SpeciesPattern` class, for matching `StatefulSpecies`
+against patterns written in pyvalem syntax with wildcards and ranges, such as
+``"CO v=*"``, ``"Ar+ *"`` or ``"H2 X(1SIGMA+g);v=0-5;J=*"``.
+
+A pattern is a formula (or ``*``, for any formula) followed by zero or more state
+terms, separated, as for `StatefulSpecies`, by semicolons or whitespace. Each
+state term is one of:
+
+``key=*``
+    A wildcard: the species must have a state of this kind, with any value. The
+    keys ``v`` and ``J`` refer to vibrational and rotational states; any other
+    key to the key-value pair states with that key.
+``key=min-max``
+    A range: the species must have a state of this kind with a numeric value
+    between ``min`` and ``max`` inclusive (which may be integers or fractions,
+    such as ``J=1/2-5/2``, and negative, such as ``n=-2-2``). A value with a
+    leading minus sign alone, such as ``n=-1``, is a literal state.
+``*``
+    The species may have any other states (including none).
+Any other state
+    The species must have this state, as parsed by pyvalem.
+
+Unless the pattern has the ``*`` term, a species matches only if every one of its
+states is matched by a term of the pattern. Note that in a pattern, a lone ``*``
+therefore does not refer to the `GenericExcitedState` ``*``.
+
+Patterns are compiled once, on instantiation, into predicates on the formula and
+on the types and numeric quantum numbers of the states, so that no string
+comparison of the species' representations is needed. Given a `SpeciesIndex`,
+the candidate species are also looked up from the index rather than tested one
+by one.
+
+Examples
+--------
+>>> from pyvalem.species_pattern import SpeciesPattern
+>>> species = ["CO", "CO v=2", "CO v=7", "CO X(1SIGMA+);v=1", "Ar+", "Ar+ 2P_3/2"]
+>>> [repr(ss) for ss in SpeciesPattern("CO v=0-5").filter(species)]
+['CO v=2']
+>>> [repr(ss) for ss in SpeciesPattern("CO v=* *").filter(species)]
+['CO v=2', 'CO v=7', 'CO X(1Σ+);v=1']
+>>> [repr(ss) for ss in SpeciesPattern("Ar+ *").filter(species)]
+['Ar+', 'Ar+ 2P_3/2']
+"""
+
+from fractions import Fraction
+import re
+
+from .species_index import formula_key, quantum_numbers
+from .stateful_species import StatefulSpecies
+from .states import KeyValuePair, RotationalState, StateParseError, VibrationalState
+from .states._state_parser import state_parser
+
+# The State class and quantum number referred to by the keys of wildcard and
+# range terms; other keys refer to KeyValuePair states.
+PATTERN_KEYS = {
+    "v": (VibrationalState, "v"),
+    "J": (RotationalState, "J"),
+}
+
+
+# A range value, <min>-<max>; the minimum may not be empty, so that a negative
+# value, such as the -1 of "n=-1", is a literal.
+_range_value = re.compile(r"^(-?[^-]+)-(.*)$")
+
+
+class SpeciesPatternError(Exception):
+    pass
+
+
+class _StateTerm:
+    """One state term of a pattern: a literal state, or a wildcard or range on the
+    value of a state of a given type."""
+
+    def __init__(self, term_str):
+        self.literal = None
+        self.min = self.max = None
+        key, sep, value = term_str.partition("=")
+        range_match = _range_value.match(value)
+        if sep and (value == "*" or range_match):
+            self.state_type, self.name = PATTERN_KEYS.get(key, (KeyValuePair, key))
+            if range_match:
+                try:
+                    self.min, self.max = (Fraction(s) for s in range_match.groups())
+                except ValueError:
+                    raise SpeciesPatternError("Invalid range: {}".format(term_str))
+            return
+        try:
+            self.literal = state_parser(term_str)
+        except (StateParseError, ValueError) as err:
+            raise SpeciesPatternError("Invalid state term {}: {}".format(term_str, err))
+        self.state_type = type(self.literal)
+        self.literal_repr = repr(self.literal)
+
+    @property
+    def has_range(self):
+        return self.min is not None
+
+    def matches(self, state):
+        if type(state) is not self.state_type:
+            return False
+        if self.literal is not None:
+            return repr(state) == self.literal_repr
+        if self.state_type is KeyValuePair and state.key != self.name:
+            return False
+        if not self.has_range:
+            return True
+        value = quantum_numbers(state).get(self.name)
+        return value is not None and self.min <= value <= self.max
+
+
+class SpeciesPattern:
+    """A compiled species pattern.
+
+    Parameters
+    ----------
+    pattern : str
+        The pattern, in the syntax described in the module documentation.
+
+    Raises
+    ------
+    SpeciesPatternError
+        If a state term of the pattern cannot be parsed.
+    """
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        fields = pattern.strip().replace(";", " ").replace(", ", " ").split()
+        if not fields:
+            raise SpeciesPatternError("Empty species pattern")
+        formula, terms = fields[0], fields[1:]
+        self.formula_key = None if formula == "*" else formula_key(formula)
+        self.open = "*" in terms
+        self.terms = [_StateTerm(term) for term in terms if term != "*"]
+
+    def __repr__(self):
+        return "SpeciesPattern({!r})".format(self.pattern)
+
+    def matches(self, species):
+        """Return ``True`` if the species matches the pattern.
+
+        Parameters
+        ----------
+        species : StatefulSpecies or str
+
+        Returns
+        -------
+        bool
+        """
+        if not isinstance(species, StatefulSpecies):
+            species = StatefulSpecies(species)
+        if self.formula_key is not None and repr(species.formula) != self.formula_key:
+            return False
+        if not self.open and len(species.states) != len(self.terms):
+            return False
+        unmatched = list(species.states)
+        for term in self.terms:
+            for i, state in enumerate(unmatched):
+                if term.matches(state):
+                    del unmatched[i]
+                    break
+            else:
+                return False
+        return True
+
+    def filter(self, species):
+        """Generate the species matching the pattern.
+
+        Parameters
+        ----------
+        species : iterable of StatefulSpecies or str
+
+        Yields
+        ------
+        StatefulSpecies
+        """
+        for ss in species:
+            if not isinstance(ss, StatefulSpecies):
+                ss = StatefulSpecies(ss)
+            if self.matches(ss):
+                yield ss
+
+    def select_ids(self, index):
+        """Return the ids of the species in a `SpeciesIndex` matching the pattern.
+
+        Parameters
+        ----------
+        index : SpeciesIndex
+
+        Returns
+        -------
+        list of int
+            The ids of the matching species, in increasing order.
+        """
+        candidates = None
+        if self.formula_key is not None:
+            candidates = set(index.find_ids(formula=self.formula_key))
+        for term in self.terms:
+            if term.literal is not None:
+                ids = index.find_ids(state=term.literal)
+            elif term.has_range:
+                ids = index.find_ids(
+                    state_type=term.state_type, **{term.name: (term.min, term.max)}
+                )
+            else:
+                ids = index.find_ids(state_type=term.state_type)
+            candidates = set(ids) if candidates is None else candidates & set(ids)
+            if not candidates:
+                return []
+        if candidates is None:
+            candidates = range(len(index))
+        return sorted(isp for isp in candidates if self.matches(index.species[isp]))
+
+    def select(self, index):
+        """Return the species in a `SpeciesIndex` matching the pattern.
+
+        Parameters
+        ----------
+        index : SpeciesIndex
+
+        Returns
+        -------
+        list of StatefulSpecies
+        """
+        return [index.species[isp] for isp in self.select_ids(index)]
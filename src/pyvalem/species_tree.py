@@ -0,0 +1,287 @@
+"""
+This module contains the `SpeciesTree` class, a trie of `StatefulSpecies`
+organised by formula, then electronic state, vibrational state and rotational
+state, for grouping the levels of species and aggregating quantities (such as
+populations) over them.
+
+The levels of the tree follow the sort order of the states used in
+``StatefulSpecies.__repr__`` (see ``STATES``): the electronic states of a species
+(its configurations, term symbols, couplings and excitation labels) form the
+first level below the formula, then its vibrational and rotational states, and
+finally any other (key-value pair) states. A species with no state at some level
+is filed under the empty key at that level. Every node keeps the total of the
+values and the number of species in its subtree, updated along the path from the
+root whenever a value is set, so that inserting, looking up and aggregating over
+any subtree take time proportional only to the depth of the tree.
+
+Examples
+--------
+>>> from pyvalem.species_tree import SpeciesTree
+>>> tree = SpeciesTree()
+>>> tree["CO X(1SIGMA+);v=0"] = 0.7
+>>> tree["CO X(1SIGMA+);v=1;J=1"] = 0.1
+>>> tree["CO X(1SIGMA+);v=1;J=2"] = 0.05
+>>> tree["CO a(3PI);v=0"] = 0.15
+>>> tree.total("CO X(1SIGMA+)")
+0.85
+>>> tree.count("CO X(1SIGMA+);v=1")
+2
+>>> tree.aggregate("electronic")
+{'CO X(1Σ+)': 0.85, 'CO a(3Π)': 0.15}
+"""
+
+from .stateful_species import StatefulSpecies
+from .states import ELECTRONIC_STATES, RotationalState, VibrationalState
+from .states._state_parser import STATES
+
+LEVELS = ("formula", "electronic", "vibrational", "rotational", "other")
+
+
+class SpeciesTreeError(Exception):
+    pass
+
+
+def _state_level(state):
+    if isinstance(state, ELECTRONIC_STATES):
+        return 1
+    if isinstance(state, VibrationalState):
+        return 2
+    if isinstance(state, RotationalState):
+        return 3
+    return 4
+
+
+def species_path(species):
+    """Return the path of a species in a `SpeciesTree`.
+
+    Parameters
+    ----------
+    species : StatefulSpecies or str
+
+    Returns
+    -------
+    tuple of str
+        The key of the species at each level of the tree, from its formula down
+        to its last specified state.
+    """
+    if not isinstance(species, StatefulSpecies):
+        species = StatefulSpecies(species)
+    keys = [[] for _ in LEVELS]
+    keys[0].append(repr(species.formula))
+    for state in sorted(
+        species.states, key=lambda state: (STATES[type(state)], state.ordering)
+    ):
+        keys[_state_level(state)].append(repr(state))
+    path = [";".join(level_keys) for level_keys in keys]
+    while len(path) > 1 and not path[-1]:
+        path.pop()
+    return tuple(path)
+
+
+def _path_repr(path):
+    """Return the species representation of a path (or path prefix)."""
+    states = ";".join(key for key in path[1:] if key)
+    return "{} {}".format(path[0], states) if states else path[0]
+
+
+class _Node:
+    __slots__ = ("children", "species", "value", "total", "count")
+
+    def __init__(self):
+        self.children = {}
+        self.species = None
+        self.value = 0
+        self.total = 0
+        self.count = 0
+
+
+class SpeciesTree:
+    """A trie of species by formula, electronic, vibrational and rotational state,
+    holding a numeric value for each species and its totals over every subtree.
+
+    Species and subtrees are referred to by `StatefulSpecies` or strings parsed as
+    such: the subtree of the species ``"CO X(1SIGMA+)"``, for example, contains
+    all the species with this formula and electronic state, whatever their other
+    states.
+    """
+
+    def __init__(self):
+        self.root = _Node()
+
+    def __len__(self):
+        return self.root.count
+
+    def _find(self, path):
+        node = self.root
+        for key in path:
+            node = node.children.get(key)
+            if node is None:
+                return None
+        return node
+
+    def __contains__(self, species):
+        node = self._find(species_path(species))
+        return node is not None and node.species is not None
+
+    def __getitem__(self, species):
+        node = self._find(species_path(species))
+        if node is None or node.species is None:
+            raise KeyError(species)
+        return node.value
+
+    def get(self, species, default=None):
+        """Return the value of a species, or `default` if it is not in the tree."""
+        try:
+            return self[species]
+        except KeyError:
+            return default
+
+    def __setitem__(self, species, value):
+        self._set(species, value, increment=False)
+
+    def add(self, species, value=0):
+        """Add a species to the tree, or add value to its value if it is already
+        in the tree.
+
+        Parameters
+        ----------
+        species : StatefulSpecies or str
+        value : number, default=0
+        """
+        self._set(species, value, increment=True)
+
+    def _set(self, species, value, increment):
+        if not isinstance(species, StatefulSpecies):
+            species = StatefulSpecies(species)
+        path = species_path(species)
+        nodes = [self.root]
+        for key in path:
+            children = nodes[-1].children
+            try:
+                nodes.append(children[key])
+            except KeyError:
+                node = children[key] = _Node()
+                nodes.append(node)
+        leaf = nodes[-1]
+        new = leaf.species is None
+        if new:
+            leaf.species = species
+        delta = value if increment else value - leaf.value
+        leaf.value += delta
+        for node in nodes:
+            node.total += delta
+            node.count += new
+
+    def __delitem__(self, species):
+        path = species_path(species)
+        nodes = [self.root]
+        for key in path:
+            node = nodes[-1].children.get(key)
+            if node is None:
+                raise KeyError(species)
+            nodes.append(node)
+        leaf = nodes[-1]
+        if leaf.species is None:
+            raise KeyError(species)
+        value, leaf.species, leaf.value = leaf.value, None, 0
+        for node in nodes:
+            node.total -= value
+            node.count -= 1
+        # Prune the nodes left with no species below them.
+        for parent, key in zip(reversed(nodes[:-1]), reversed(path)):
+            if parent.children[key].count:
+                break
+            del parent.children[key]
+
+    def total(self, prefix=None):
+        """Return the total of the values of the species in a subtree.
+
+        Parameters
+        ----------
+        prefix : StatefulSpecies or str, optional
+            The species at the root of the subtree; by default, the whole tree.
+
+        Returns
+        -------
+        number
+        """
+        node = self.root if prefix is None else self._find(species_path(prefix))
+        return 0 if node is None else node.total
+
+    def count(self, prefix=None):
+        """Return the number of species in a subtree.
+
+        Parameters
+        ----------
+        prefix : StatefulSpecies or str, optional
+            The species at the root of the subtree; by default, the whole tree.
+
+        Returns
+        -------
+        int
+        """
+        node = self.root if prefix is None else self._find(species_path(prefix))
+        return 0 if node is None else node.count
+
+    def items(self, prefix=None):
+        """Generate the species in a subtree, with their values.
+
+        Parameters
+        ----------
+        prefix : StatefulSpecies or str, optional
+            The species at the root of the subtree; by default, the whole tree.
+
+        Yields
+        ------
+        tuple[StatefulSpecies, number]
+            The species, depth first and in the order their nodes were created.
+        """
+        node = self.root if prefix is None else self._find(species_path(prefix))
+        if node is None:
+            return
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.species is not None:
+                yield node.species, node.value
+            stack.extend(reversed(list(node.children.values())))
+
+    def aggregate(self, level):
+        """Return the totals of the values of the species grouped at a level.
+
+        Parameters
+        ----------
+        level : str or int
+            One of ``LEVELS`` (``"formula"``, ``"electronic"``, ``"vibrational"``,
+            ``"rotational"`` or ``"other"``), or its index.
+
+        Returns
+        -------
+        dict
+            The total of each group, keyed by the representation of the species
+            at the root of its subtree. Species with fewer levels than `level`
+            are grouped under their own representation (together with any species
+            differing from them only in states below `level`).
+        """
+        if isinstance(level, str):
+            try:
+                level = LEVELS.index(level)
+            except ValueError:
+                raise SpeciesTreeError("Unknown level: {}".format(level))
+        totals = {}
+        stack = [((key,), child) for key, child in self.root.children.items()]
+        stack.reverse()
+        while stack:
+            path, node = stack.pop()
+            key = _path_repr(path)
+            if len(path) == level + 1 or not node.children:
+                totals[key] = totals.get(key, 0) + node.total
+                continue
+            if node.species is not None:
+                # A species ending above the requested level is its own group.
+                totals[key] = totals.get(key, 0) + node.value
+            stack.extend(
+                (path + (key,), child)
+                for key, child in reversed(list(node.children.items()))
+            )
+        return totals
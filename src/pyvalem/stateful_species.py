@@ -5,13 +5,15 @@ molecule), optionally with with one or more State objects associated with it.
 The Formula of the StatefulSpecies is separated from its States by whitespace;
 States are separated from each other by semicolons (;) or whitespace.
 """
+
 from pyvalem.states.atomic_configuration import AtomicConfiguration
 from pyvalem.states.diatomic_molecular_configuration import (
     DiatomicMolecularConfiguration,
 )
+from ._utils import memoized_property
 from .formula import Formula
 from pyvalem.states.key_value_pair import KeyValuePair
-from pyvalem.states._state_parser import state_parser, STATES
+from pyvalem.states._state_parser import state_parser, try_parse_state, STATES
 
 
 class StatefulSpeciesError(Exception):
@@ -20,20 +22,69 @@ class StatefulSpeciesError(Exception):
 
 class StatefulSpecies:
     def __init__(self, s):
-        s = s.strip()
-        if " " not in s:
+        s_formula, s_states = self._split(s)
+        self.formula = Formula(s_formula)
+        if not s_states:
             # No states, just a Formula
             self.states = []
-            self.formula = Formula(s)
             return
 
-        i = s.index(" ")
-        self.formula = Formula(s[:i])
-        s = s.replace(";", " ").replace(", ", " ")
-        self.states = state_parser(s[i + 1 :].split())
+        self.states = state_parser(s_states)
 
         self._verify_states()
 
+    @staticmethod
+    def _split(s):
+        """Split s into its formula string and a list of its state strings."""
+        s = s.strip()
+        if " " not in s:
+            return s, []
+        i = s.index(" ")
+        s_states = s[i + 1 :].replace(";", " ").replace(", ", " ")
+        return s[:i], s_states.split()
+
+    @classmethod
+    def try_parse(cls, s):
+        """Parse a species string, or return None if it is not a valid species.
+
+        The formula and the states are parsed with `Formula.try_parse` and the
+        `try_parse` methods of the State classes, so that an invalid string is
+        rejected without raising (and catching) an exception for each State class
+        tried.
+
+        Parameters
+        ----------
+        s : str
+
+        Returns
+        -------
+        StatefulSpecies or None
+        """
+        s_formula, s_states = cls._split(s)
+        formula = Formula.try_parse(s_formula)
+        if formula is None:
+            return None
+        states = []
+        for s_state in s_states:
+            try:
+                state = try_parse_state(s_state)
+            except ValueError:
+                # A well-formed state with invalid quantum numbers, such as
+                # J1J2_Coupling "(1,1/2)_2".
+                state = None
+            if state is None:
+                return None
+            states.append(state)
+        species = cls.__new__(cls)
+        species.formula = formula
+        species.states = states
+        if states:
+            try:
+                species._verify_states()
+            except StatefulSpeciesError:
+                return None
+        return species
+
     def __repr__(self):
         """Return a canonical text representation of the StatefulSpecies."""
         if self.states:
@@ -136,13 +187,13 @@ class StatefulSpecies:
                 " key specified for {}".format(self)
             )
 
-    @property
+    @memoized_property
     def html(self):
         if not self.states:
             return self.formula.html
         return "{} {}".format(self.formula.html, " ".join(s.html for s in self.states))
 
-    @property
+    @memoized_property
     def latex(self):
         if not self.states:
             return self.formula.latex
@@ -43,6 +43,11 @@ class J1J2_CouplingValidationError(ValueError):
 
 
 class J1J2_Coupling(State):
+    @staticmethod
+    def _may_parse(state_str):
+        # The J1 and J2 quantum numbers are given in parentheses.
+        return "(" in state_str
+
     def __init__(self, state_str):
         self.state_str = state_str
         self.J1 = None
@@ -3,7 +3,7 @@ The J1K_LK_Coupling class, representing an atomic term symbol under
 the coupling conditions J1l -> K, J1L2 -> K or L, S1 -> K. These
 are described in Martin et al. (sec. 11.8.4 and 11.8.5). NB there is
 currently no check that the coupling quantum numbers given actually
-make sense: 
+make sense:
 
 W. C. Martin, W. Wiese, A. Kramida, "Atomic Spectroscopy" in "Springer
 Handbook of Atomic, Molecular and Optical Physics", G. W. F. Drake (ed.),
@@ -43,6 +43,11 @@ class J1K_LK_CouplingValidationError(ValueError):
 
 
 class J1K_LK_Coupling(State):
+    @staticmethod
+    def _may_parse(state_str):
+        # The K quantum number is given in square brackets.
+        return "[" in state_str
+
     def __init__(self, state_str):
         self.state_str = state_str
         self.Smult = None
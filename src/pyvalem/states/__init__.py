@@ -19,3 +19,16 @@ from .J1K_LK_coupling import (
     J1K_LK_CouplingValidationError,
 )
 from .J1J2_coupling import J1J2_Coupling, J1J2_CouplingError
+
+# The State classes describing the electronic state of a species.
+ELECTRONIC_STATES = (
+    GenericExcitedState,
+    AtomicConfiguration,
+    CompoundLSCoupling,
+    AtomicTermSymbol,
+    DiatomicMolecularConfiguration,
+    MolecularTermSymbol,
+    J1K_LK_Coupling,
+    J1J2_Coupling,
+    RacahSymbol,
+)
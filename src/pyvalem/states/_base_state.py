@@ -8,6 +8,8 @@ one of those and don't instantiate State objects directly.
 from abc import ABC, abstractmethod
 import html
 
+from pyvalem._utils import memoized_property
+
 
 class StateError(Exception):
     """A base class for state related exceptions."""
@@ -21,11 +23,61 @@ class StateParseError(StateError):
     pass
 
 
+def _has_digit(s):
+    return any(c.isdigit() for c in s)
+
+
 # noinspection PyUnresolvedReferences
 class State(ABC):
+    """
+    The ``html`` and ``latex`` representations of a State are computed once, on
+    first access, and cached: State instances should be treated as immutable.
+    """
+
     multiple_allowed = False
 
-    @property
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Memoize the renderings overridden by subclasses.
+        for name in ("html", "latex"):
+            prop = cls.__dict__.get(name)
+            if isinstance(prop, property):
+                setattr(cls, name, memoized_property(prop.fget))
+
+    @staticmethod
+    def _may_parse(state_str):
+        """Return False if state_str cannot possibly be parsed as this State.
+
+        This is a cheap test of the string, overridden by the subclasses, used by
+        `try_parse` to skip a full parse which would certainly fail: it must never
+        reject a valid state string.
+        """
+        return True
+
+    @classmethod
+    def try_parse(cls, state_str):
+        """Parse state_str as this State class, or return None if it cannot be.
+
+        Unlike the constructor, no exception is raised for a string which does not
+        have the syntax of this State class. Errors in the values of the quantum
+        numbers of a correctly-formed state are still raised.
+
+        Parameters
+        ----------
+        state_str : str
+
+        Returns
+        -------
+        State or None
+        """
+        if not cls._may_parse(state_str):
+            return None
+        try:
+            return cls(state_str)
+        except StateParseError:
+            return None
+
+    @memoized_property
     def html(self):
         """HTML representation of the State instance.
 
@@ -35,7 +87,7 @@ class State(ABC):
         """
         return html.escape(repr(self))
 
-    @property
+    @memoized_property
     def latex(self):
         """LaTeX representation of the State instance.
 
@@ -2,6 +2,7 @@
 A module for parsing strings or sequences of strings into appropriate
 State-like objects or sequences of such objects.
 """
+
 from collections import OrderedDict
 
 from ._base_state import StateParseError
@@ -39,6 +40,19 @@ STATES = OrderedDict(
 )
 
 
+def try_parse_state(s_state):
+    """Parse the string s_state into an appropriate State-like object, or return
+    None if it cannot be parsed as any kind of State."""
+
+    # Try each of the possible derived State classes one by one in a particular
+    # order: the first to parse the string wins.
+    for StateClass in STATES:
+        state = StateClass.try_parse(s_state)
+        if state is not None:
+            return state
+    return None
+
+
 def state_parser(s_state):
     """Parse s_state into an appropriate State-like object or list of such."""
 
@@ -50,12 +64,7 @@ def state_parser(s_state):
         # of State-like objects.
         return [state_parser(s.strip()) for s in s_state]
 
-    # Try to parse the string s_state into a State-like object by trying each
-    # of the possible derived State classes one by one in a particular order.
-    for StateClass in STATES:
-        try:
-            return StateClass(s_state)
-        except StateParseError:
-            pass
-
-    raise StateParseError("Could not parse {}".format(s_state))
+    state = try_parse_state(s_state)
+    if state is None:
+        raise StateParseError("Could not parse {}".format(s_state))
+    return state
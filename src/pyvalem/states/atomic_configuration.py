@@ -8,6 +8,7 @@ labels, creating an HTML representation of the term symbol, etc.
 import pyparsing as pp
 
 from pyvalem.states._base_state import State, StateParseError
+from pyvalem._utils import memoized_property
 
 integer = pp.Word(pp.nums).setParseAction(lambda t: int(t[0]))
 nocc_integer = pp.Optional(pp.Word(pp.nums), default="1").setParseAction(
@@ -34,6 +35,69 @@ for i, elm in enumerate(noble_gases[1:], start=1):
 
 noble_gas_nelectrons = {"He": 2, "Ne": 10, "Ar": 18, "Kr": 36, "Xe": 54, "Rn": 86}
 
+# The subshells (n, l) in the order of their positions in an occupation vector:
+# 1s, 2s, 2p, 3s, 3p, 3d, 4s, ... (extended as needed by _subshells).
+_subshell_layout = []
+
+
+def subshell_index(n, l):
+    """Return the position of the subshell (n, l) in an occupation vector.
+
+    Occupation vectors list the number of electrons in each subshell in the
+    fixed order 1s, 2s, 2p, 3s, 3p, 3d, 4s, ..., so that the subshell (n, l) is
+    at position n(n-1)/2 + l.
+
+    Parameters
+    ----------
+    n, l : int
+
+    Returns
+    -------
+    int
+    """
+    return n * (n - 1) // 2 + l
+
+
+def _subshells(size):
+    """Return the list of the subshells (n, l) of the first size positions of an
+    occupation vector."""
+    n = len(_subshell_layout) and _subshell_layout[-1][0]
+    while len(_subshell_layout) < size:
+        n += 1
+        _subshell_layout.extend((n, l) for l in range(n))
+    return _subshell_layout[:size]
+
+
+def _occupation(subshells):
+    """Return the occupation vector for the (n, l, nocc) of each subshell."""
+    occupation = bytearray()
+    for n, l, nocc in subshells:
+        i = subshell_index(n, l)
+        if i >= len(occupation):
+            occupation.extend(bytes(i + 1 - len(occupation)))
+        occupation[i] = nocc
+    # Explicitly empty subshells, as in "1s2.2p0", leave no trailing zeros.
+    return bytes(occupation).rstrip(b"\0")
+
+
+def _parse_subshells(config):
+    """Parse the explicit subshells of config (e.g. "1s2.2s2.2p6") into a list of
+    (n, l, nocc) tuples."""
+    subshells = []
+    for s_orbital in config.split("."):
+        lletter_index = len(s_orbital.rstrip("0123456789")) - 1
+        n = int(s_orbital[:lletter_index])
+        l = atomic_orbital_symbols.index(s_orbital[lletter_index])
+        nocc = int(s_orbital[lletter_index + 1 :] or 1)
+        subshells.append((n, l, nocc))
+    return subshells
+
+
+noble_gas_occupations = {
+    noble_gas: _occupation(_parse_subshells(noble_gas_configs[noble_gas]))
+    for noble_gas in noble_gases
+}
+
 noble_gas = pp.oneOf(["[{}]".format(symbol) for symbol in noble_gases])
 
 atom_orbital = pp.Group(
@@ -242,6 +306,13 @@ class AtomicConfiguration(State):
     '1s2.2s2.2p6.3p'
     """
 
+    @staticmethod
+    def _may_parse(state_str):
+        # A configuration starts with a principal quantum number (or n) or a
+        # noble gas core.
+        first = state_str.lstrip()[:1]
+        return first.isdigit() or first in ("n", "[")
+
     def __init__(self, state_str):
         self.state_str = self._contract_to_noble_gas_config(state_str)
         self.orbitals = []
@@ -269,11 +340,6 @@ class AtomicConfiguration(State):
                 " configuration syntax: {0}".format(state_str)
             )
 
-        # Expand out noble gas notation, if used, and check that the
-        # subshells 1s, 2s, 2p, ... are unique.
-        subshells = self._expand_noble_gas_config(state_str)
-        subshells = [subshell[:2] for subshell in subshells.split(".")]
-
         for i, parsed_orbital in enumerate(parse_results):
             if not i and type(parsed_orbital) == str:
                 # Noble-gas notation for first atomic orbital
@@ -293,10 +359,133 @@ class AtomicConfiguration(State):
                 raise AtomicConfigurationError(err)
             self.orbitals.append(orbital)
 
-        # Check that the subshells specified are unique
+        # Check that the subshells specified, including any in the noble gas
+        # core, are unique.
+        subshells = [(orbital.n, orbital.l) for orbital in self.orbitals]
+        if self.noble_gas_config:
+            core = noble_gas_configs[self.noble_gas_config[1:-1]]
+            subshells.extend((n, l) for n, l, _ in _parse_subshells(core))
         if len(subshells) != len(set(subshells)):
             raise AtomicConfigurationError("Repeated subshell in {0}".format(state_str))
 
+    @classmethod
+    def from_occupation(cls, occupation):
+        """Create an AtomicConfiguration from its occupation vector.
+
+        The configuration is built directly from the vector, without parsing a
+        configuration string: the largest noble gas core which the configuration
+        contains is written in noble gas notation, and the other occupied
+        subshells follow it in the order of the occupation vector.
+
+        Parameters
+        ----------
+        occupation : bytes or sequence of int
+            The number of electrons in each subshell, in the order given by
+            `subshell_index`.
+
+        Returns
+        -------
+        AtomicConfiguration
+
+        Raises
+        ------
+        AtomicConfigurationError
+            If the occupation vector is empty or not valid.
+
+        Examples
+        --------
+        >>> AtomicConfiguration.from_occupation([2, 2, 6, 2, 6, 0, 1]).state_str
+        '[Ar].4s'
+        """
+        if not isinstance(occupation, bytes):
+            try:
+                occupation = bytes(map(int, occupation))
+            except ValueError:
+                raise AtomicConfigurationError(
+                    "Invalid occupation vector: {}".format(list(occupation))
+                )
+        occupation = occupation.rstrip(b"\0")
+        if not occupation:
+            raise AtomicConfigurationError("Empty occupation vector")
+
+        # Find the largest noble gas core with all of its subshells filled (as
+        # in _contract_to_noble_gas_config, [He] and [Ne] are not used).
+        core, core_occupation = None, b""
+        for noble_gas in noble_gases[:1:-1]:
+            gas_occupation = noble_gas_occupations[noble_gas]
+            if len(occupation) >= len(gas_occupation) and all(
+                occupation[i] == nocc for i, nocc in enumerate(gas_occupation) if nocc
+            ):
+                core, core_occupation = noble_gas, gas_occupation
+                break
+
+        self = cls.__new__(cls)
+        self.orbitals = []
+        self.noble_gas_config = None
+        self.nelectrons = 0
+        s_orbitals = []
+        if core:
+            self.noble_gas_config = "[{}]".format(core)
+            self.nelectrons = noble_gas_nelectrons[core]
+            s_orbitals.append(self.noble_gas_config)
+        for i, ((n, l), nocc) in enumerate(
+            zip(_subshells(len(occupation)), occupation)
+        ):
+            if not nocc or (i < len(core_occupation) and core_occupation[i]):
+                continue
+            try:
+                orbital = AtomicOrbital(n=n, l=l, nocc=nocc)
+            except AtomicOrbitalError as err:
+                raise AtomicConfigurationError(err)
+            self.orbitals.append(orbital)
+            self.nelectrons += nocc
+            s_orbitals.append(repr(orbital))
+        self.state_str = ".".join(s_orbitals)
+        self.__dict__["_memo_occupation"] = occupation
+        return self
+
+    @memoized_property
+    def occupation(self):
+        """The occupation vector of the configuration.
+
+        This is the number of electrons in each subshell, including those of any
+        noble gas core, in the fixed order given by `subshell_index` (1s, 2s, 2p,
+        3s, 3p, 3d, 4s, ...) and with no trailing unoccupied subshells. It is
+        independent of the order in which the subshells were given, and so may
+        be used to compare, hash and store configurations compactly.
+
+        Returns
+        -------
+        bytes
+
+        Raises
+        ------
+        AtomicConfigurationError
+            If the configuration has an incompletely specified orbital, such as
+            ``"nd"``.
+        """
+        if any(orbital.incompletely_specified for orbital in self.orbitals):
+            raise AtomicConfigurationError(
+                "No occupation vector for {}: incompletely specified"
+                " orbital".format(self.state_str)
+            )
+        subshells = [(orbital.n, orbital.l, orbital.nocc) for orbital in self.orbitals]
+        if self.noble_gas_config:
+            core = noble_gas_configs[self.noble_gas_config[1:-1]]
+            subshells.extend(_parse_subshells(core))
+        return _occupation(subshells)
+
+    @property
+    def parity(self):
+        """The parity of the configuration: "o" if odd and None if even.
+
+        Returns
+        -------
+        str or None
+        """
+        l_sum = sum(orbital.l * orbital.nocc for orbital in self.orbitals)
+        return "o" if l_sum % 2 else None
+
     @property
     def html(self):
         """See the `State` base class."""
@@ -6,7 +6,7 @@ an HTML representation of the term symbol, etc.
 
 import pyparsing as pp
 
-from pyvalem.states._base_state import State, StateParseError
+from pyvalem.states._base_state import State, StateParseError, _has_digit
 from pyvalem._utils import parse_fraction, float_to_fraction
 
 atom_L_symbols = "S P D F G H I K L M N O Q R T U V W X Y Z".split()
@@ -41,6 +41,11 @@ class AtomicTermSymbolError(StateParseError):
 
 
 class AtomicTermSymbol(State):
+    @staticmethod
+    def _may_parse(state_str):
+        # A term symbol has a spin multiplicity and an L letter.
+        return _has_digit(state_str) and any(c in atom_L_symbols for c in state_str)
+
     def __init__(self, state_str):
         self.state_str = state_str
         self.Smult = None
@@ -28,6 +28,11 @@ class CompoundLSCouplingError(StateParseError):
 
 
 class CompoundLSCoupling(State):
+    @staticmethod
+    def _may_parse(state_str):
+        # The intermediate terms are given in parentheses.
+        return "(" in state_str
+
     def __init__(self, state_str):
         self.state_str = state_str
         self.atomic_configurations = []
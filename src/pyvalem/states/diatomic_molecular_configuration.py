@@ -182,6 +182,11 @@ class AltDiatomicMolecularOrbital(DiatomicMolecularOrbital):
 
 
 class DiatomicMolecularConfiguration(State):
+    @staticmethod
+    def _may_parse(state_str):
+        # A configuration starts with the number of its first orbital.
+        return state_str.lstrip()[:1].isdigit()
+
     def __init__(self, state_str):
         self.state_str = state_str
         self.orbitals = []
@@ -17,6 +17,11 @@ class GenericExcitedStateError(StateParseError):
 
 
 class GenericExcitedState(State):
+    @staticmethod
+    def _may_parse(state_str):
+        # An excited state is "*", "**", ... or "n*".
+        return "*" in state_str
+
     def __init__(self, state_str):
         self.state_str = state_str
         self.int_n = None
@@ -3,6 +3,7 @@ The KeyValuePair class, representing an arbitrary atomic or molecular state,
 with methods for parsing it from a string and outputting its HTML
 representation, etc.
 """
+
 from pyvalem.states._base_state import State, StateParseError
 
 
@@ -21,6 +22,11 @@ class KeyValuePair(State):
 
     multiple_allowed = True
 
+    @staticmethod
+    def _may_parse(state_str):
+        # A key-value pair is of the form "key=value".
+        return "=" in state_str
+
     def __init__(self, state_str):
         self.state_str = None
         self.key = None
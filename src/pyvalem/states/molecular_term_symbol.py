@@ -3,9 +3,10 @@ The MolecularTermSymbol class, representing a molecular term symbol, with
 methods for parsing a string into quantum numbers and labels, creating
 an HTML representation of the term symbol, etc.
 """
+
 import pyparsing as pp
 
-from pyvalem.states._base_state import State, StateParseError
+from pyvalem.states._base_state import State, StateParseError, _has_digit
 from pyvalem._utils import parse_fraction, float_to_fraction
 
 orbital_irrep_labels = (
@@ -161,6 +162,7 @@ latex_terms = {
 
 integer = pp.Word(pp.nums)
 molecule_Smult = integer.setResultsName("Smult")
+irrep_initials = {label[0] for label in orbital_irrep_labels}
 molecule_irrep = pp.oneOf(orbital_irrep_labels).setResultsName("irrep")
 molecule_Omegastr = (
     pp.Combine(pp.Optional(pp.oneOf(("+", "-"))) + integer)
@@ -193,6 +195,11 @@ class MolecularTermSymbolError(StateParseError):
 
 
 class MolecularTermSymbol(State):
+    @staticmethod
+    def _may_parse(state_str):
+        # A term symbol has a spin multiplicity and an irrep label.
+        return _has_digit(state_str) and any(c in irrep_initials for c in state_str)
+
     def __init__(self, state_str):
         self.state_str = state_str
         self.Smult = None
@@ -42,6 +42,11 @@ class RacahSymbol(State):
     state is an average over J levels.
     """
 
+    @staticmethod
+    def _may_parse(state_str):
+        # The K quantum number is given in square brackets.
+        return "[" in state_str
+
     def __init__(self, state_str):
         self.state_str = state_str
         self.principal = None
@@ -24,6 +24,11 @@ class RotationalStateError(StateParseError):
 
 
 class RotationalState(State):
+    @staticmethod
+    def _may_parse(state_str):
+        # A rotational state is of the form "J=value".
+        return state_str.partition("=")[0].strip() == "J"
+
     def __init__(self, state_str):
         self.state_str = None
         self.J = None
@@ -48,6 +48,16 @@ class VibrationalStateError(StateParseError):
 
 
 class VibrationalState(State):
+    @staticmethod
+    def _may_parse(state_str):
+        # A vibrational state is "*", "**", "***", an integer (optionally preceded
+        # by "v=") or a polyatomic configuration of "v" or "ν" terms.
+        if "*" in state_str or "v" in state_str or "ν" in state_str:
+            return True
+        return (
+            state_str.replace(" ", "").strip().lstrip("+-").replace("_", "").isdigit()
+        )
+
     def __init__(self, state_str):
         self.state_str = state_str.replace(" ", "")
         self.v = None
@@ -0,0 +1,320 @@
+"""
+This module contains functions for the statistical weights (degeneracies) of the
+levels of `StatefulSpecies`, and for the partition functions and equilibrium
+(Boltzmann) populations of sets of levels with given energies.
+
+The statistical weight of a level is determined by its most specific state:
+
+``RotationalState``
+    2J + 1, doubled for the two Λ-doublet components of each J of a
+    `MolecularTermSymbol` with Λ > 0 or Ω > 0 of a linear molecule.
+``AtomicTermSymbol``
+    2J + 1 for a level, (2S + 1)(2L + 1) for a term without J.
+``J1J2_Coupling``, ``J1K_LK_Coupling``
+    2J + 1 for a level; (2J1 + 1)(2J2 + 1), or (2S2 + 1)(2K + 1), without J.
+``MolecularTermSymbol``
+    (2S + 1) times the orbital degeneracy (2 for Λ > 0; the dimension of the
+    irreducible representation of a non-linear molecule); for a multiplet
+    component of given |Ω| of a linear molecule, 2 if Λ > 0 or Ω > 0 (the
+    Λ-doublets and the ±Ω components), and 1 otherwise.
+``AtomicConfiguration``
+    The number of microstates of the configuration, the product of the binomial
+    coefficients C(4l + 2, N) of its subshells.
+
+Any other states (such as a `VibrationalState`) are non-degenerate.
+
+The rotational levels of homonuclear diatomic molecules also carry the weight of
+their nuclear-spin states, which depends on the symmetry of the level under the
+exchange of the nuclei. These nuclear-spin weights are given as a mapping of
+formulas to the pair of weights (g_even, g_odd) of the even and odd J levels of
+a 1Σg+ state, or found from the tabulated nuclear spins of `pyvalem.nuclear_spin`:
+the roles of the even and odd levels are exchanged for 1Σg- and 1Σu+ states, and
+each J level of a state with Λ > 0 has one Λ-doublet component of either
+symmetry. The symmetry of the levels of a Σ state with S > 0 depends on the
+rotational quantum number N, not J, so no nuclear-spin weight is applied to
+them.
+
+Level energies are given relative to the user's zero of energy, in K (divided by
+the Boltzmann constant, as elsewhere in PyValem), cm-1 or eV; temperatures are
+in K. The evaluation of weights for many levels at once, and of partition
+functions and populations, requires NumPy.
+
+Examples
+--------
+>>> from pyvalem.statistical_weights import statistical_weight
+>>> statistical_weight("Fe+ [Ar].3d6.4s 6D_9/2")
+10
+>>> statistical_weight("C 1s2.2s2.2p2 3P")
+9
+>>> statistical_weight("C 1s2.2s2.2p2")
+15
+>>> statistical_weight("NO X(2Π_1/2);v=0;J=5/2")
+12
+>>> statistical_weight("H2 X(1SIGMA+g);v=0;J=1", nuclear_spin_weights={"H2": (1, 3)})
+9
+>>> statistical_weight("(14N)2 X(1SIGMA+g);v=0;J=2", nuclear_spin_weights=True)
+30
+"""
+
+from math import factorial
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .nuclear_spin import (
+    _LAMBDA_DOUBLED,
+    _reversed_symmetry,
+    _symmetric,
+    nuclear_spin_weights as _tabulated_weights,
+)
+from .stateful_species import StatefulSpecies
+from .states import (
+    AtomicConfiguration,
+    AtomicTermSymbol,
+    J1J2_Coupling,
+    J1K_LK_Coupling,
+    MolecularTermSymbol,
+    RotationalState,
+)
+
+# The level energies in each unit, divided by the Boltzmann constant, in K.
+ENERGY_UNITS = {"K": 1.0, "cm-1": 1.438776877, "eV": 11604.51812}
+
+# The number of levels whose Boltzmann factors are evaluated in one block.
+_BLOCK_SIZE = 65536
+
+_Lambdas = {"Σ": 0, "Π": 1, "Δ": 2, "Φ": 3, "Γ": 4}
+
+# The dimensions of the irreducible representations of non-linear molecules, by
+# the initial of their Mulliken symbols.
+_irrep_dimensions = {"A": 1, "B": 1, "E": 2, "T": 3, "G": 4, "H": 5}
+
+
+class StatisticalWeightError(Exception):
+    pass
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for the evaluation of partition functions")
+
+
+def _orbital_degeneracy(term):
+    """Return the orbital degeneracy of a MolecularTermSymbol."""
+    irrep = term.irrep
+    if irrep[0] in _Lambdas:
+        return 1 if irrep[0] == "Σ" else 2
+    return _irrep_dimensions[irrep[0]]
+
+
+def _doubling(term):
+    """Return the number of Λ-doublet (or ±Ω) components of a MolecularTermSymbol
+    of a linear molecule with Ω given or not: 2 if Λ > 0 or Ω > 0, else 1."""
+    return 2 if term.irrep[0] != "Σ" or term.Omega else 1
+
+
+def _nuclear_spin_weight(term, J, weights):
+    """Return the nuclear-spin weight of the rotational level J of a homonuclear
+    diatomic molecule in the electronic state term (which may be None), or 1 if it
+    is not determined."""
+    g_even, g_odd = weights
+    if _reversed_symmetry(term) is _LAMBDA_DOUBLED:
+        # The two Λ-doublet components of each J level are of opposite symmetry.
+        return (g_even + g_odd) / 2
+    symmetric = _symmetric(term, J)
+    if symmetric is None:
+        return 1
+    return g_even if symmetric else g_odd
+
+
+def statistical_weight(species, nuclear_spin_weights=None):
+    """Return the statistical weight (degeneracy) of a level.
+
+    Parameters
+    ----------
+    species : StatefulSpecies or str
+    nuclear_spin_weights : dict or bool, optional
+        The nuclear-spin weights (g_even, g_odd) of the even and odd rotational
+        levels of a 1Σg+ state of homonuclear diatomic molecules, keyed by
+        formula, such as ``{"H2": (1, 3)}``. The weights are applied to the
+        rotational levels of the species with these formulas. If ``True``, the
+        weights of all homonuclear diatomic molecules are found from the nuclear
+        spins of their isotopes (see `pyvalem.nuclear_spin`).
+
+    Returns
+    -------
+    int or float
+        The statistical weight of the level: an int unless nuclear-spin weights
+        which are not integers are applied.
+
+    Raises
+    ------
+    NuclearSpinError
+        If `nuclear_spin_weights` is ``True`` and the nuclear spin of the isotope
+        of a homonuclear diatomic molecule (such as Xe2) is not tabulated.
+    """
+    if not isinstance(species, StatefulSpecies):
+        species = StatefulSpecies(species)
+    configuration = coupled = term = J = None
+    for state in species.states:
+        if isinstance(state, AtomicConfiguration):
+            configuration = state
+        elif isinstance(state, (AtomicTermSymbol, J1J2_Coupling, J1K_LK_Coupling)):
+            coupled = state
+        elif isinstance(state, MolecularTermSymbol):
+            term = state
+        elif isinstance(state, RotationalState):
+            J = state.J
+
+    if J is not None:
+        weight = int(round(2 * J)) + 1
+        if term is not None and term.irrep[0] in _Lambdas:
+            weight *= _doubling(term)
+        if nuclear_spin_weights is True:
+            weights = _tabulated_weights(species.formula)
+        elif nuclear_spin_weights:
+            weights = nuclear_spin_weights.get(repr(species.formula))
+        else:
+            weights = None
+        if weights is not None:
+            weight *= _nuclear_spin_weight(term, J, weights)
+        return weight
+    if coupled is not None:
+        if coupled.J is not None:
+            return int(round(2 * coupled.J)) + 1
+        if isinstance(coupled, AtomicTermSymbol):
+            return coupled.Smult * (2 * coupled.L + 1)
+        if isinstance(coupled, J1J2_Coupling):
+            return int(round(2 * coupled.J1 + 1) * round(2 * coupled.J2 + 1))
+        return coupled.Smult * (int(round(2 * coupled.K)) + 1)
+    if term is not None:
+        if term.Omega is not None and term.irrep[0] in _Lambdas:
+            return _doubling(term)
+        return term.Smult * _orbital_degeneracy(term)
+    if configuration is not None:
+        weight = 1
+        for orbital in configuration.orbitals:
+            n = 4 * orbital.l + 2
+            weight *= (
+                factorial(n) // factorial(orbital.nocc) // factorial(n - orbital.nocc)
+            )
+        return weight
+    return 1
+
+
+def statistical_weights(levels, nuclear_spin_weights=None):
+    """Return the statistical weights of many levels.
+
+    The weight of each distinct level is evaluated once.
+
+    Parameters
+    ----------
+    levels : sequence of StatefulSpecies or str
+    nuclear_spin_weights : dict or bool, optional
+        The nuclear-spin weights of homonuclear diatomic molecules, as for
+        `statistical_weight`.
+
+    Returns
+    -------
+    numpy.ndarray of float
+        The statistical weight of each level.
+
+    Raises
+    ------
+    NuclearSpinError
+        As for `statistical_weight`.
+    """
+    _require_numpy()
+    weights = np.empty(len(levels), dtype=float)
+    cache = {}
+    for i, species in enumerate(levels):
+        key = species if isinstance(species, str) else repr(species)
+        try:
+            weights[i] = cache[key]
+        except KeyError:
+            weights[i] = cache[key] = statistical_weight(species, nuclear_spin_weights)
+    return weights
+
+
+def _boltzmann_exponents(energies, T, units):
+    """Return the energies in K and the reciprocal temperatures as arrays."""
+    try:
+        scale = ENERGY_UNITS[units]
+    except KeyError:
+        raise StatisticalWeightError("Unknown energy units: {}".format(units))
+    energies = np.asarray(energies, dtype=float).reshape(-1) * scale
+    T = np.asarray(T, dtype=float)
+    if np.any(T <= 0):
+        raise StatisticalWeightError("Temperatures must be positive")
+    return energies, 1 / T
+
+
+def partition_function(weights, energies, T, units="K"):
+    """Return the partition function of a set of levels.
+
+    Q(T) = Σ_i g_i exp(-E_i / kT), evaluated for all the temperatures at once.
+
+    Parameters
+    ----------
+    weights : array_like
+        The statistical weights, g_i, of the levels, for example as returned by
+        `statistical_weights`.
+    energies : array_like
+        The energies, E_i, of the levels, relative to the zero of energy of the
+        partition function.
+    T : float or array_like
+        The temperature(s), in K.
+    units : str, default="K"
+        The units of the energies: ``"K"``, ``"cm-1"`` or ``"eV"``.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The partition function at each temperature, with the shape of T.
+
+    Raises
+    ------
+    StatisticalWeightError
+        If the weights and energies have different lengths, the units are unknown
+        or a temperature is not positive.
+    """
+    _require_numpy()
+    weights = np.asarray(weights, dtype=float).reshape(-1)
+    energies, beta = _boltzmann_exponents(energies, T, units)
+    if len(weights) != len(energies):
+        raise StatisticalWeightError(
+            "{} weights and {} energies do not match".format(
+                len(weights), len(energies)
+            )
+        )
+    Q = np.zeros(beta.size)
+    for start in range(0, len(energies), _BLOCK_SIZE):
+        block = slice(start, start + _BLOCK_SIZE)
+        Q += weights[block] @ np.exp(-np.outer(energies[block], beta.reshape(-1)))
+    return Q.reshape(beta.shape)[()]
+
+
+def populations(weights, energies, T, units="K"):
+    """Return the fractional equilibrium (Boltzmann) populations of a set of levels.
+
+    n_i / N = g_i exp(-E_i / kT) / Q(T).
+
+    Parameters
+    ----------
+    weights, energies, T, units
+        As for `partition_function`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The populations, of shape (number of levels,) for a single temperature or
+        (number of levels, number of temperatures) for a one-dimensional array of
+        temperatures.
+    """
+    Q = partition_function(weights, energies, T, units)
+    weights = np.asarray(weights, dtype=float).reshape(-1)
+    energies, beta = _boltzmann_exponents(energies, T, units)
+    fractions = weights[:, None] * np.exp(-np.outer(energies, beta)) / np.ravel(Q)
+    return fractions.reshape(energies.shape + beta.shape)
@@ -0,0 +1,647 @@
+"""
+This module contains functions for evaluating the Wigner 3j, 6j and 9j symbols,
+the coefficients of the transformations between angular momentum coupling schemes
+(for example, between the LS, J1J2 and J1K couplings of atomic states).
+
+Each symbol is evaluated exactly, with Racah's formulas in integer and rational
+arithmetic (using a precomputed table of factorials), as a `SqrtRational`: a
+number ±√q for a rational q. The symbols have many symmetries (12 for the 3j
+symbol, 24 for the 6j and 72 for the 9j symbol) relating those with permuted
+arguments, to within a sign; each symbol is reduced to a canonical form under
+these symmetries and the exact values of the canonical symbols are kept in
+bounded least-recently-used caches. The symbols are also evaluated as floats,
+from their exact values, or as NumPy arrays for arrays of arguments, using a
+table of log-factorials (which loses precision through cancellation for large
+angular momenta, of 50 or so).
+
+Angular momenta are given as integers, half-integer floats or `Fraction`s;
+symbols whose arguments do not satisfy the triangle and projection conditions
+are zero.
+
+Examples
+--------
+>>> from pyvalem.wigner import wigner_3j, wigner_3j_exact, wigner_6j_exact
+>>> wigner_3j_exact(1, 1, 0, 1, -1, 0)
+sqrt(1/3)
+>>> wigner_6j_exact(1, 1, 1, 1, 1, 1)
+1/6
+>>> wigner_3j(0.5, 0.5, 1, 0.5, -0.5, 0)
+0.408248290463863
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+import itertools
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# The maximum number of canonical symbols of each kind whose values are cached.
+CACHE_SIZE = 65536
+
+
+class WignerError(Exception):
+    pass
+
+
+def _isqrt(n):
+    """Return the integer square root of the non-negative integer n."""
+    if n < 2:
+        return n
+    x = 1 << ((n.bit_length() + 1) // 2)
+    while True:
+        y = (x + n // x) // 2
+        if y >= x:
+            return x
+        x = y
+
+
+class SqrtRational:
+    """The exact value of a Wigner symbol, ±√q for a non-negative rational q.
+
+    Attributes
+    ----------
+    sign : int
+        -1, 0 or 1.
+    square : Fraction
+        q, the square of the value.
+    """
+
+    __slots__ = ("sign", "square")
+
+    def __init__(self, sign, square):
+        self.sign = sign if square else 0
+        self.square = Fraction(square) if self.sign else Fraction(0)
+
+    def __float__(self):
+        return self.sign * math.sqrt(self.square)
+
+    def __neg__(self):
+        return SqrtRational(-self.sign, self.square)
+
+    def __eq__(self, other):
+        if isinstance(other, SqrtRational):
+            return self.sign == other.sign and self.square == other.square
+        if isinstance(other, (int, Fraction)):
+            return self.sign * other >= 0 and self.square == other * other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.sign, self.square))
+
+    def __repr__(self):
+        if not self.sign:
+            return "0"
+        s_sign = "-" if self.sign < 0 else ""
+        num, den = self.square.numerator, self.square.denominator
+        root_num, root_den = _isqrt(num), _isqrt(den)
+        if root_num * root_num == num and root_den * root_den == den:
+            return s_sign + str(Fraction(root_num, root_den))
+        return "{}sqrt({})".format(s_sign, self.square)
+
+
+_factorials = [1]
+
+
+def _factorial(n):
+    """Return n!, from a table extended as needed."""
+    while len(_factorials) <= n:
+        _factorials.append(_factorials[-1] * len(_factorials))
+    return _factorials[n]
+
+
+_log_factorials = None
+
+
+def _log_factorial_table(n):
+    """Return a NumPy array of log(k!) for k = 0, 1, ..., at least n."""
+    global _log_factorials
+    if _log_factorials is None or len(_log_factorials) <= n:
+        size = max(2 * n, 256)
+        _log_factorials = np.array([math.lgamma(k + 1) for k in range(size)])
+    return _log_factorials
+
+
+def _two(j):
+    """Return twice the integer or half-integer j, as an int."""
+    two_j = 2 * j
+    if two_j != int(two_j):
+        raise WignerError("Not an integer or half-integer: {}".format(j))
+    return int(two_j)
+
+
+def _two_array(j):
+    """Return twice the array of integers or half-integers j, as an int array."""
+    two_j = 2 * np.asarray(j, dtype=float)
+    rounded = np.rint(two_j)
+    if np.any(rounded != two_j):
+        raise WignerError("Not integers or half-integers: {}".format(j))
+    return rounded.astype(int)
+
+
+def _triangle(a, b, c):
+    """Do the doubled angular momenta a, b, c satisfy the triangle condition?"""
+    return abs(a - b) <= c <= a + b and not (a + b + c) % 2
+
+
+def _delta(a, b, c):
+    """The triangle coefficient Δ(abc) of the doubled angular momenta a, b, c."""
+    return Fraction(
+        _factorial((a + b - c) // 2)
+        * _factorial((a - b + c) // 2)
+        * _factorial((b + c - a) // 2),
+        _factorial((a + b + c) // 2 + 1),
+    )
+
+
+def _sign(x):
+    return (x > 0) - (x < 0)
+
+
+def _canonical_3j(a, b, c, d, e, f):
+    """Return the canonical form of the 3j symbol with doubled arguments, and the
+    sign relating it to the symbol."""
+    odd_phase = -1 if (a + b + c) // 2 % 2 else 1
+    best = None
+    for columns, sign in (
+        (((a, d), (b, e), (c, f)), 1),
+        (((a, -d), (b, -e), (c, -f)), odd_phase),
+    ):
+        order = sorted(range(3), key=lambda i: columns[i], reverse=True)
+        inversions = sum(order[i] > order[j] for i in range(3) for j in range(i + 1, 3))
+        columns = [columns[i] for i in order]
+        key = tuple(j for j, _ in columns) + tuple(m for _, m in columns)
+        candidate = key, sign * (odd_phase if inversions % 2 else 1)
+        if best is None or candidate[0] > best[0]:
+            best = candidate
+    return best
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _exact_3j(a, b, c, d, e, f):
+    """The (sign, square) of the 3j symbol with doubled arguments, by Racah's
+    formula."""
+    k1, k2, k3 = (a + d) // 2, (c - b + d) // 2, (c - a - e) // 2
+    n1, n2, n3 = (a + b - c) // 2, (a - d) // 2, (b + e) // 2
+    total = Fraction(0)
+    for t in range(max(0, -k2, -k3), min(n1, n2, n3) + 1):
+        term = Fraction(
+            1,
+            _factorial(t)
+            * _factorial(k2 + t)
+            * _factorial(k3 + t)
+            * _factorial(n1 - t)
+            * _factorial(n2 - t)
+            * _factorial(n3 - t),
+        )
+        total += -term if t % 2 else term
+    square = (
+        _delta(a, b, c)
+        * _factorial(k1)
+        * _factorial(n2)
+        * _factorial((b + e) // 2)
+        * _factorial((b - e) // 2)
+        * _factorial((c + f) // 2)
+        * _factorial((c - f) // 2)
+        * total
+        * total
+    )
+    phase = -1 if (a - b - f) // 2 % 2 else 1
+    return phase * _sign(total), square
+
+
+def _valid_3j(a, b, c, d, e, f):
+    return (
+        d + e + f == 0
+        and _triangle(a, b, c)
+        and all(abs(m) <= j and not (j + m) % 2 for j, m in ((a, d), (b, e), (c, f)))
+    )
+
+
+def wigner_3j_exact(j1, j2, j3, m1, m2, m3):
+    """Return the exact value of a Wigner 3j symbol.
+
+    Parameters
+    ----------
+    j1, j2, j3, m1, m2, m3 : int, float or Fraction
+        The arguments of the symbol (j1 j2 j3; m1 m2 m3), integers or
+        half-integers.
+
+    Returns
+    -------
+    SqrtRational
+
+    Raises
+    ------
+    WignerError
+        If an argument is not an integer or half-integer.
+    """
+    args = tuple(_two(j) for j in (j1, j2, j3, m1, m2, m3))
+    if not _valid_3j(*args):
+        return SqrtRational(0, 0)
+    key, sign = _canonical_3j(*args)
+    value_sign, square = _exact_3j(*key)
+    return SqrtRational(sign * value_sign, square)
+
+
+def _canonical_6j(a, b, c, d, e, f):
+    """Return the canonical form of the 6j symbol with doubled arguments."""
+    columns = ((a, d), (b, e), (c, f))
+    variants = []
+    for flips in ((0, 0, 0), (1, 1, 0), (1, 0, 1), (0, 1, 1)):
+        flipped = [col[::-1] if flip else col for col, flip in zip(columns, flips)]
+        for permuted in itertools.permutations(flipped):
+            variants.append(
+                tuple(j for j, _ in permuted) + tuple(j for _, j in permuted)
+            )
+    return min(variants)
+
+
+def _racah_6j_sum(a, b, c, d, e, f):
+    """The sum in Racah's formula for the 6j symbol with doubled arguments."""
+    alphas = ((a + b + c) // 2, (a + e + f) // 2, (d + b + f) // 2, (d + e + c) // 2)
+    betas = ((a + b + d + e) // 2, (b + c + e + f) // 2, (c + a + f + d) // 2)
+    total = Fraction(0)
+    for t in range(max(alphas), min(betas) + 1):
+        denominator = 1
+        for alpha in alphas:
+            denominator *= _factorial(t - alpha)
+        for beta in betas:
+            denominator *= _factorial(beta - t)
+        term = Fraction(_factorial(t + 1), denominator)
+        total += -term if t % 2 else term
+    return total
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _exact_6j(a, b, c, d, e, f):
+    """The (sign, square) of the 6j symbol with doubled arguments, by Racah's
+    formula."""
+    total = _racah_6j_sum(a, b, c, d, e, f)
+    square = (_delta(a, b, c) * _delta(a, e, f) * _delta(d, b, f) * _delta(d, e, c)) * (
+        total * total
+    )
+    return _sign(total), square
+
+
+def _valid_6j(a, b, c, d, e, f):
+    return (
+        _triangle(a, b, c)
+        and _triangle(a, e, f)
+        and _triangle(d, b, f)
+        and _triangle(d, e, c)
+    )
+
+
+def wigner_6j_exact(j1, j2, j3, j4, j5, j6):
+    """Return the exact value of a Wigner 6j symbol.
+
+    Parameters
+    ----------
+    j1, j2, j3, j4, j5, j6 : int, float or Fraction
+        The arguments of the symbol {j1 j2 j3; j4 j5 j6}, integers or
+        half-integers.
+
+    Returns
+    -------
+    SqrtRational
+
+    Raises
+    ------
+    WignerError
+        If an argument is not an integer or half-integer.
+    """
+    args = tuple(_two(j) for j in (j1, j2, j3, j4, j5, j6))
+    if not _valid_6j(*args):
+        return SqrtRational(0, 0)
+    return SqrtRational(*_exact_6j(*_canonical_6j(*args)))
+
+
+def _canonical_9j(args):
+    """Return the canonical form of the 9j symbol with doubled arguments args (by
+    rows), and the sign relating it to the symbol."""
+    odd_phase = -1 if sum(args) // 2 % 2 else 1
+    rows = [args[0:3], args[3:6], args[6:9]]
+    best = None
+    for matrix in (rows, list(zip(*rows))):
+        for row_order in itertools.permutations(range(3)):
+            for col_order in itertools.permutations(range(3)):
+                key = tuple(matrix[i][j] for i in row_order for j in col_order)
+                if best is None or key > best[0]:
+                    odd = _permutation_parity(row_order) ^ _permutation_parity(
+                        col_order
+                    )
+                    best = key, odd_phase if odd else 1
+    return best
+
+
+def _permutation_parity(order):
+    return (
+        sum(
+            order[i] > order[j]
+            for i in range(len(order))
+            for j in range(i + 1, len(order))
+        )
+        % 2
+    )
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _exact_9j(a, b, c, d, e, f, g, h, i):
+    """The (sign, square) of the 9j symbol with doubled arguments, by rows, as a
+    sum over products of 6j symbols."""
+    # The triangle coefficients depending on x appear squared in the product of
+    # the three 6j symbols, and the others once.
+    total = Fraction(0)
+    x_min = max(abs(a - i), abs(d - h), abs(b - f))
+    x_max = min(a + i, d + h, b + f)
+    for x in range(x_min, x_max + 1, 2):
+        term = (
+            (x + 1)
+            * _delta(a, i, x)
+            * _delta(h, d, x)
+            * _delta(b, x, f)
+            * _racah_6j_sum(a, d, g, h, i, x)
+            * _racah_6j_sum(b, e, h, d, x, f)
+            * _racah_6j_sum(c, f, i, x, a, b)
+        )
+        total += -term if x % 2 else term
+    square = (
+        _delta(a, d, g)
+        * _delta(h, i, g)
+        * _delta(b, e, h)
+        * _delta(d, e, f)
+        * _delta(c, f, i)
+        * _delta(c, a, b)
+    ) * (total * total)
+    return _sign(total), square
+
+
+def _valid_9j(args):
+    rows = [args[0:3], args[3:6], args[6:9]]
+    return all(_triangle(*row) for row in rows) and all(
+        _triangle(*col) for col in zip(*rows)
+    )
+
+
+def wigner_9j_exact(j1, j2, j3, j4, j5, j6, j7, j8, j9):
+    """Return the exact value of a Wigner 9j symbol.
+
+    Parameters
+    ----------
+    j1, j2, j3, j4, j5, j6, j7, j8, j9 : int, float or Fraction
+        The arguments of the symbol {j1 j2 j3; j4 j5 j6; j7 j8 j9}, by rows,
+        integers or half-integers.
+
+    Returns
+    -------
+    SqrtRational
+
+    Raises
+    ------
+    WignerError
+        If an argument is not an integer or half-integer.
+    """
+    args = tuple(_two(j) for j in (j1, j2, j3, j4, j5, j6, j7, j8, j9))
+    if not _valid_9j(args):
+        return SqrtRational(0, 0)
+    key, sign = _canonical_9j(args)
+    value_sign, square = _exact_9j(*key)
+    return SqrtRational(sign * value_sign, square)
+
+
+def wigner_3j(j1, j2, j3, m1, m2, m3):
+    """Return the value of a Wigner 3j symbol as a float.
+
+    The parameters are those of `wigner_3j_exact`.
+
+    Returns
+    -------
+    float
+    """
+    return float(wigner_3j_exact(j1, j2, j3, m1, m2, m3))
+
+
+def wigner_6j(j1, j2, j3, j4, j5, j6):
+    """Return the value of a Wigner 6j symbol as a float.
+
+    The parameters are those of `wigner_6j_exact`.
+
+    Returns
+    -------
+    float
+    """
+    return float(wigner_6j_exact(j1, j2, j3, j4, j5, j6))
+
+
+def wigner_9j(j1, j2, j3, j4, j5, j6, j7, j8, j9):
+    """Return the value of a Wigner 9j symbol as a float.
+
+    The parameters are those of `wigner_9j_exact`.
+
+    Returns
+    -------
+    float
+    """
+    return float(wigner_9j_exact(j1, j2, j3, j4, j5, j6, j7, j8, j9))
+
+
+def _triangle_array(a, b, c):
+    return (abs(a - b) <= c) & (c <= a + b) & ((a + b + c) % 2 == 0)
+
+
+def _log_delta_array(lf, a, b, c):
+    return (
+        lf[(a + b - c) // 2]
+        + lf[(a - b + c) // 2]
+        + lf[(b + c - a) // 2]
+        - lf[(a + b + c) // 2 + 1]
+    )
+
+
+def _sum_array(valid, t_min, t_max, log_term):
+    """Sum (-1)**t exp(log_term(t)) for t from t_min to t_max where valid."""
+    total = np.zeros(valid.shape)
+    if not valid.any():
+        return total
+    t_min = np.where(valid, t_min, 0)
+    t_max = np.where(valid, t_max, -1)
+    for k in range(int((t_max - t_min).max()) + 1):
+        t = t_min + k
+        active = t <= t_max
+        t = np.where(active, t, t_min)
+        sign = np.where(t % 2, -1.0, 1.0)
+        total += np.where(active, sign * np.exp(log_term(t)), 0.0)
+    return total
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for arrays of Wigner symbols")
+
+
+def wigner_3j_array(j1, j2, j3, m1, m2, m3):
+    """Return the values of Wigner 3j symbols for arrays of arguments.
+
+    Parameters
+    ----------
+    j1, j2, j3, m1, m2, m3 : array_like
+        The arguments of the symbols, integers or half-integers, broadcast
+        together.
+
+    Returns
+    -------
+    numpy.ndarray of float
+
+    Raises
+    ------
+    WignerError
+        If an argument is not an integer or half-integer.
+    """
+    _require_numpy()
+    a, b, c, d, e, f = np.broadcast_arrays(
+        *(_two_array(j) for j in (j1, j2, j3, m1, m2, m3))
+    )
+    valid = (
+        (d + e + f == 0)
+        & _triangle_array(a, b, c)
+        & (abs(d) <= a)
+        & (abs(e) <= b)
+        & (abs(f) <= c)
+        & ((a + d) % 2 == 0)
+        & ((b + e) % 2 == 0)
+        & ((c + f) % 2 == 0)
+    )
+    a, b, c = (np.where(valid, j, 0) for j in (a, b, c))
+    d, e, f = (np.where(valid, m, 0) for m in (d, e, f))
+    lf = _log_factorial_table(int((a + b + c).max(initial=0)) // 2 + 2)
+    k2, k3 = (c - b + d) // 2, (c - a - e) // 2
+    n1, n2, n3 = (a + b - c) // 2, (a - d) // 2, (b + e) // 2
+    log_prefactor = 0.5 * (
+        _log_delta_array(lf, a, b, c)
+        + lf[(a + d) // 2]
+        + lf[n2]
+        + lf[n3]
+        + lf[(b - e) // 2]
+        + lf[(c + f) // 2]
+        + lf[(c - f) // 2]
+    )
+
+    def log_term(t):
+        return log_prefactor - (
+            lf[t] + lf[k2 + t] + lf[k3 + t] + lf[n1 - t] + lf[n2 - t] + lf[n3 - t]
+        )
+
+    t_min = np.maximum(0, np.maximum(-k2, -k3))
+    t_max = np.minimum(n1, np.minimum(n2, n3))
+    total = _sum_array(valid, t_min, t_max, log_term)
+    phase = np.where((a - b - f) // 2 % 2, -1.0, 1.0)
+    return phase * total
+
+
+def _6j_array(a, b, c, d, e, f):
+    """The 6j symbols of the arrays of doubled arguments."""
+    valid = (
+        _triangle_array(a, b, c)
+        & _triangle_array(a, e, f)
+        & _triangle_array(d, b, f)
+        & _triangle_array(d, e, c)
+    )
+    a, b, c, d, e, f = (np.where(valid, j, 0) for j in (a, b, c, d, e, f))
+    alphas = [(a + b + c) // 2, (a + e + f) // 2, (d + b + f) // 2, (d + e + c) // 2]
+    betas = [(a + b + d + e) // 2, (b + c + e + f) // 2, (c + a + f + d) // 2]
+    lf = _log_factorial_table(int(max(beta.max(initial=0) for beta in betas)) + 2)
+    log_prefactor = 0.5 * (
+        _log_delta_array(lf, a, b, c)
+        + _log_delta_array(lf, a, e, f)
+        + _log_delta_array(lf, d, b, f)
+        + _log_delta_array(lf, d, e, c)
+    )
+
+    def log_term(t):
+        log = log_prefactor + lf[t + 1]
+        for alpha in alphas:
+            log = log - lf[t - alpha]
+        for beta in betas:
+            log = log - lf[beta - t]
+        return log
+
+    t_min = np.maximum.reduce(alphas)
+    t_max = np.minimum.reduce(betas)
+    return _sum_array(valid, t_min, t_max, log_term)
+
+
+def wigner_6j_array(j1, j2, j3, j4, j5, j6):
+    """Return the values of Wigner 6j symbols for arrays of arguments.
+
+    Parameters
+    ----------
+    j1, j2, j3, j4, j5, j6 : array_like
+        The arguments of the symbols, integers or half-integers, broadcast
+        together.
+
+    Returns
+    -------
+    numpy.ndarray of float
+
+    Raises
+    ------
+    WignerError
+        If an argument is not an integer or half-integer.
+    """
+    _require_numpy()
+    args = np.broadcast_arrays(*(_two_array(j) for j in (j1, j2, j3, j4, j5, j6)))
+    return _6j_array(*args)
+
+
+def wigner_9j_array(j1, j2, j3, j4, j5, j6, j7, j8, j9):
+    """Return the values of Wigner 9j symbols for arrays of arguments.
+
+    Parameters
+    ----------
+    j1, j2, j3, j4, j5, j6, j7, j8, j9 : array_like
+        The arguments of the symbols, by rows, integers or half-integers,
+        broadcast together.
+
+    Returns
+    -------
+    numpy.ndarray of float
+
+    Raises
+    ------
+    WignerError
+        If an argument is not an integer or half-integer.
+    """
+    _require_numpy()
+    a, b, c, d, e, f, g, h, i = np.broadcast_arrays(
+        *(_two_array(j) for j in (j1, j2, j3, j4, j5, j6, j7, j8, j9))
+    )
+    valid = (
+        _triangle_array(a, b, c)
+        & _triangle_array(d, e, f)
+        & _triangle_array(g, h, i)
+        & _triangle_array(a, d, g)
+        & _triangle_array(b, e, h)
+        & _triangle_array(c, f, i)
+    )
+    x_min = np.maximum.reduce([abs(a - i), abs(d - h), abs(b - f)])
+    x_max = np.minimum.reduce([a + i, d + h, b + f])
+    total = np.zeros(valid.shape)
+    if not valid.any():
+        return total
+    x_min = np.where(valid, x_min, 0)
+    x_max = np.where(valid, x_max, -2)
+    for k in range(0, int((x_max - x_min).max()) + 1, 2):
+        x = x_min + k
+        active = x <= x_max
+        term = (
+            (x + 1)
+            * _6j_array(a, d, g, h, i, x)
+            * _6j_array(b, e, h, d, x, f)
+            * _6j_array(c, f, i, x, a, b)
+        )
+        total += np.where(active, np.where(x % 2, -term, term), 0.0)
+    return total
@@ -7,6 +7,7 @@ import unittest
 from pyvalem.states.atomic_configuration import (
     AtomicConfiguration,
     AtomicConfigurationError,
+    subshell_index,
 )
 
 
@@ -114,6 +115,54 @@ class AtomicConfigurationTest(unittest.TestCase):
         self.assertEqual(c1.html, "1s<sup>2</sup><em>n</em>p")
         self.assertEqual(c1.latex, "1s^{2}np")
 
+    def test_repeated_subshells(self):
+        self.assertEqual(repr(AtomicConfiguration("10s.10p")), "10s.10p")
+        self.assertRaises(AtomicConfigurationError, AtomicConfiguration, "2s.3p.2s")
+        self.assertRaises(AtomicConfigurationError, AtomicConfiguration, "[Ar].3p")
+
+    def test_occupation(self):
+        self.assertEqual(subshell_index(1, 0), 0)
+        self.assertEqual(subshell_index(3, 2), 5)
+        c1 = AtomicConfiguration("1s2.2s2.2p6.3s2.3p6.3d.4s2")
+        c2 = AtomicConfiguration("[Ar].4s2.3d")
+        self.assertEqual(c1.occupation, bytes([2, 2, 6, 2, 6, 1, 2]))
+        self.assertEqual(c1.occupation, c2.occupation)
+        self.assertEqual(sum(c1.occupation), c1.nelectrons)
+        # Explicitly empty subshells leave no trailing zeros.
+        self.assertEqual(AtomicConfiguration("1s2.2p0").occupation, b"\x02")
+        self.assertEqual(
+            AtomicConfiguration("1s2.2s2.2p6.3s0.3p0").occupation,
+            AtomicConfiguration("1s2.2s2.2p6").occupation,
+        )
+        self.assertEqual(AtomicConfiguration("1s2.2s2.2p").parity, "o")
+        self.assertIsNone(AtomicConfiguration("[Ne].3p2").parity)
+        with self.assertRaises(AtomicConfigurationError):
+            _ = AtomicConfiguration("1s2.nd").occupation
+
+    def test_from_occupation(self):
+        for s_config in (
+            "1s",
+            "1s2.2s2.2p3",
+            "[Ar].3d.4s2",
+            "[Xe].4f2",
+            "[Rn].5f3.6d.7s2",
+            "5g.10s",
+        ):
+            c = AtomicConfiguration(s_config)
+            c2 = AtomicConfiguration.from_occupation(c.occupation)
+            self.assertEqual(c2.state_str, s_config)
+            self.assertEqual(repr(c2), repr(c))
+            self.assertEqual(c2.nelectrons, c.nelectrons)
+            self.assertEqual(c2.occupation, c.occupation)
+        c = AtomicConfiguration.from_occupation([2, 2, 6, 2, 6, 10, 2, 6, 1, 0, 0])
+        self.assertEqual(c.state_str, "[Kr].4d")
+        for occupation in ([], [0, 0], [3], [2, 2, 7], [-1]):
+            self.assertRaises(
+                AtomicConfigurationError,
+                AtomicConfiguration.from_occupation,
+                occupation,
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,94 @@
+"""
+Unit tests for the atomic_terms module of PyValem
+"""
+
+import itertools
+import unittest
+
+from pyvalem.atomic_terms import (
+    AtomicTermsError,
+    configuration_terms,
+    couple_terms,
+    subshell_terms,
+    term_symbols,
+)
+from pyvalem.states import AtomicConfiguration
+
+
+def brute_force_terms(configuration):
+    """Find the terms of a configuration by enumerating its microstates."""
+    subshell_microstates = []
+    for orbital in AtomicConfiguration(configuration).orbitals:
+        spin_orbitals = [
+            (ml, ms2) for ml in range(-orbital.l, orbital.l + 1) for ms2 in (-1, 1)
+        ]
+        subshell_microstates.append(
+            list(itertools.combinations(spin_orbitals, orbital.nocc))
+        )
+    counts = {}
+    for microstate in itertools.product(*subshell_microstates):
+        electrons = [e for subshell in microstate for e in subshell]
+        key = sum(e[0] for e in electrons), sum(e[1] for e in electrons)
+        counts[key] = counts.get(key, 0) + 1
+    terms = {}
+    for (ML, MS2), n in counts.items():
+        if ML >= 0 and MS2 >= 0:
+            n += counts.get((ML + 1, MS2 + 2), 0)
+            n -= counts.get((ML + 1, MS2), 0) + counts.get((ML, MS2 + 2), 0)
+            if n:
+                terms[MS2 + 1, ML] = n
+    return terms
+
+
+class AtomicTermsTest(unittest.TestCase):
+    def test_subshell_terms(self):
+        self.assertEqual(subshell_terms(1, 2), {(1, 0): 1, (1, 2): 1, (3, 1): 1})
+        self.assertEqual(subshell_terms(1, 3), {(4, 0): 1, (2, 2): 1, (2, 1): 1})
+        self.assertEqual(subshell_terms(1, 4), subshell_terms(1, 2))
+        self.assertEqual(subshell_terms(2, 10), {(1, 0): 1})
+        # The numbers of terms of d5, f3 and f7.
+        self.assertEqual(sum(subshell_terms(2, 5).values()), 16)
+        self.assertEqual(sum(subshell_terms(3, 3).values()), 17)
+        self.assertEqual(sum(subshell_terms(3, 7).values()), 119)
+        self.assertEqual(subshell_terms(2, 5)[2, 2], 3)
+        self.assertRaises(AtomicTermsError, subshell_terms, 1, 7)
+
+    def test_couple_terms(self):
+        # s x p -> 1P, 3P; 2P x 2P -> 1S, 1P, 1D, 3S, 3P, 3D.
+        self.assertEqual(couple_terms({(2, 0): 1}, {(2, 1): 1}), {(1, 1): 1, (3, 1): 1})
+        terms = couple_terms({(2, 1): 1}, {(2, 1): 1})
+        self.assertEqual(
+            sorted(terms), [(1, 0), (1, 1), (1, 2), (3, 0), (3, 1), (3, 2)]
+        )
+
+    def test_configuration_terms(self):
+        for configuration in (
+            "1s2.2s2.2p3",
+            "2p.3p",
+            "2p2.3d",
+            "3d2.4s.4p",
+            "4f2.5d",
+            "[Ar].3d5",
+            "1s.2s.3s",
+        ):
+            self.assertEqual(
+                configuration_terms(configuration), brute_force_terms(configuration)
+            )
+        self.assertEqual(configuration_terms("[Ne]"), {(1, 0): 1})
+
+    def test_term_symbols(self):
+        self.assertEqual(
+            [repr(term) for term in term_symbols("1s2.2s2.2p3")],
+            ["2Po_1/2", "2Po_3/2", "2Do_3/2", "2Do_5/2", "4So_3/2"],
+        )
+        self.assertEqual(
+            [repr(term) for term in term_symbols("3d.4s", J=False)], ["1D", "3D"]
+        )
+        # The levels of 4f7 (327 in total) are listed once per distinct J.
+        levels = term_symbols(AtomicConfiguration("[Xe].4f7"))
+        self.assertEqual(len(levels), len({repr(level) for level in levels}))
+        self.assertTrue(all(level.parity == "o" for level in levels))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Unit tests for the configuration_arrays module of PyValem
+"""
+
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from pyvalem.configuration_arrays import (
+    classify_excitations,
+    electron_counts,
+    from_occupation_array,
+    occupation_array,
+    parities,
+    subshell_l,
+    unique_configurations,
+)
+from pyvalem.states.atomic_configuration import (
+    AtomicConfiguration,
+    AtomicConfigurationError,
+)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class ConfigurationArraysTest(unittest.TestCase):
+    configurations = [
+        "[Ar].3d.4s2",
+        "[Ar].3d2.4s",
+        "1s2.2s2.2p6.3s2.3p6.4s2.3d",
+        "[Ar].3d.4s.4p",
+        "1s2.2s2.2p6.3s2.3p5.4s",
+    ]
+
+    def test_occupation_array(self):
+        array = occupation_array(self.configurations)
+        self.assertEqual(array.shape, (5, 8))
+        self.assertEqual(array.dtype, np.uint8)
+        self.assertEqual(array[0].tobytes(), array[2].tobytes())
+        self.assertEqual(
+            array[4].tobytes().rstrip(b"\0"),
+            AtomicConfiguration("[Ne].3s2.3p5.4s").occupation,
+        )
+        self.assertEqual(occupation_array(self.configurations, width=12).shape, (5, 12))
+        self.assertRaises(
+            AtomicConfigurationError, occupation_array, self.configurations, width=7
+        )
+        self.assertEqual(occupation_array([]).shape, (0, 0))
+
+    def test_array_operations(self):
+        array = occupation_array(self.configurations)
+        self.assertEqual(list(subshell_l(8)), [0, 0, 1, 0, 1, 2, 0, 1])
+        self.assertEqual(list(electron_counts(array)), [21, 21, 21, 21, 18])
+        self.assertEqual(list(parities(array)), [0, 0, 0, 1, 1])
+        unique, inverse = unique_configurations(array)
+        self.assertEqual(len(unique), 4)
+        self.assertEqual(inverse[0], inverse[2])
+        self.assertTrue((unique[inverse] == array).all())
+
+    def test_from_occupation_array(self):
+        array = occupation_array(self.configurations)
+        configurations = from_occupation_array(array)
+        self.assertEqual(
+            [c.state_str for c in configurations],
+            [
+                "[Ar].3d.4s2",
+                "[Ar].3d2.4s",
+                "[Ar].3d.4s2",
+                "[Ar].3d.4s.4p",
+                "1s2.2s2.2p6.3s2.3p5.4s",
+            ],
+        )
+
+    def test_classify_excitations(self):
+        lower = occupation_array(["[Ar].3d.4s2"] * 4 + ["1s2.2s2.2p"])
+        upper = occupation_array(
+            ["[Ar].3d.4s2", "[Ar].3d2.4s", "[Ar].3d.4s.4p", "[Ne].3s2.3p5.3d3.4s"]
+            + ["1s2.2p3"]
+        )
+        excitations = classify_excitations(lower, upper)
+        self.assertEqual(list(excitations.rank), [0, 1, 1, 2, 2])
+        self.assertEqual(
+            excitations.donors.tolist(), [[-1, -1], [6, -1], [6, -1], [4, 6], [1, 1]]
+        )
+        self.assertEqual(
+            excitations.acceptors.tolist(),
+            [[-1, -1], [5, -1], [7, -1], [5, 5], [2, 2]],
+        )
+        self.assertEqual(
+            list(excitations.parity_change), [False, False, True, True, False]
+        )
+
+        # The lower and upper arrays may have different widths.
+        excitations = classify_excitations(lower[4:, :3], upper[4:])
+        self.assertEqual(excitations.acceptors.tolist(), [[2, 2]])
+        self.assertRaises(
+            AtomicConfigurationError, classify_excitations, lower[4:], upper[1:2]
+        )
+        self.assertRaises(
+            AtomicConfigurationError, classify_excitations, lower, upper[:2]
+        )
+        excitations = classify_excitations(lower[:0], upper[:0])
+        self.assertEqual(excitations.donors.shape, (0, 0))
+
+    def test_classify_excitations_random(self):
+        rng = np.random.default_rng(1)
+        lower = rng.integers(0, 3, size=(200, 6)).astype(np.uint8)
+        upper = lower.copy()
+        for row in upper:
+            for _ in range(rng.integers(0, 4)):
+                i, j = rng.integers(0, 6, size=2)
+                if row[i]:
+                    row[i] -= 1
+                    row[j] += 1
+        excitations = classify_excitations(lower, upper)
+        l = subshell_l(6)
+        for k in range(len(lower)):
+            donors, acceptors = [], []
+            for i in range(6):
+                d = int(upper[k, i]) - int(lower[k, i])
+                donors += [i] * max(-d, 0)
+                acceptors += [i] * max(d, 0)
+            rank = len(donors)
+            self.assertEqual(excitations.rank[k], rank)
+            self.assertEqual(list(excitations.donors[k, :rank]), donors)
+            self.assertEqual(list(excitations.acceptors[k, :rank]), acceptors)
+            self.assertTrue((excitations.donors[k, rank:] == -1).all())
+            self.assertEqual(
+                excitations.parity_change[k], (sum(l[acceptors]) - sum(l[donors])) % 2
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
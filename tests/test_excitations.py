@@ -0,0 +1,113 @@
+"""
+Unit tests for the excitations module of PyValem
+"""
+
+import itertools
+import unittest
+
+from pyvalem.excitations import ExcitationError, count_excitations, excitations
+from pyvalem.states.atomic_configuration import AtomicConfiguration, _subshells
+
+
+def brute_force_excitations(reference, subshells, max_rank):
+    """Find the occupation vectors reachable from reference by moving up to
+    max_rank electrons, one at a time, into subshells."""
+    size = max(len(reference), max(subshells) + 1)
+    capacities = [4 * l + 2 for _, l in _subshells(size)]
+    reference = list(reference) + [0] * (size - len(reference))
+    found = {tuple(reference)}
+    frontier = [tuple(reference)]
+    for _ in range(max_rank):
+        new_frontier = []
+        for occupation in frontier:
+            for i, j in itertools.product(range(size), subshells):
+                if i == j or not occupation[i] or occupation[j] == capacities[j]:
+                    continue
+                new = list(occupation)
+                new[i] -= 1
+                new[j] += 1
+                new = tuple(new)
+                if new not in found:
+                    found.add(new)
+                    new_frontier.append(new)
+        frontier = new_frontier
+    found.remove(tuple(reference))
+    # Only keep the configurations within max_rank of the reference (moving
+    # an electron twice may only count once).
+    return {
+        bytes(occupation).rstrip(b"\0")
+        for occupation in found
+        if sum(max(0, a - b) for a, b in zip(occupation, reference)) <= max_rank
+    }
+
+
+class ExcitationsTest(unittest.TestCase):
+    def test_excitations(self):
+        for reference, n_max, l_max in (
+            ("1s2.2s", 2, None),
+            ("1s2.2s2.2p2", 3, None),
+            ("[Ne].3s2", 4, 2),
+            ("[Ar].3d5.4s", 4, None),
+        ):
+            occupation = AtomicConfiguration(reference).occupation
+            subshells = [
+                i
+                for i, (n, l) in enumerate(_subshells(n_max * (n_max + 1) // 2))
+                if l_max is None or l <= l_max
+            ]
+            for max_rank in (1, 2):
+                expected = brute_force_excitations(occupation, subshells, max_rank)
+                generated = list(
+                    excitations(
+                        reference,
+                        n_max=n_max,
+                        l_max=l_max,
+                        max_rank=max_rank,
+                        as_occupation=True,
+                    )
+                )
+                self.assertEqual(len(generated), len(set(generated)))
+                self.assertEqual(set(generated), expected)
+                self.assertEqual(
+                    count_excitations(
+                        reference, n_max=n_max, l_max=l_max, max_rank=max_rank
+                    ),
+                    len(expected),
+                )
+
+    def test_orbitals_and_donors(self):
+        configurations = excitations(
+            "[Ne].3s2", orbitals=["3p", (3, 2)], donors=["3s"], max_rank=2
+        )
+        self.assertEqual(
+            [c.state_str for c in configurations],
+            [
+                "1s2.2s2.2p6.3s.3p",
+                "1s2.2s2.2p6.3s.3d",
+                "1s2.2s2.2p6.3p2",
+                "1s2.2s2.2p6.3p.3d",
+                "1s2.2s2.2p6.3d2",
+            ],
+        )
+        self.assertEqual(
+            count_excitations("[Ne].3s2", orbitals=["3p", "3d"], donors=["3s"]), 5
+        )
+
+    def test_several_references(self):
+        references = ["1s2.2s2", "1s2.2p2"]
+        generated = list(excitations(references, n_max=2, as_occupation=True))
+        self.assertEqual(len(generated), len(set(generated)))
+        self.assertNotIn(AtomicConfiguration("1s2.2p2").occupation, generated)
+        self.assertEqual(count_excitations(references, n_max=2), len(generated))
+
+    def test_invalid(self):
+        with self.assertRaises(ExcitationError):
+            list(excitations("1s2"))
+        with self.assertRaises(ExcitationError):
+            list(excitations("1s2", orbitals=["2d"]))
+        with self.assertRaises(ExcitationError):
+            list(excitations("1s2", orbitals=[(2, 2)]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -163,6 +163,21 @@ class FormulaTest(unittest.TestCase):
         self.assertRaises(FormulaParseError, Formula, "H3O^+")
         self.assertRaises(FormulaParseError, Formula, "H_2S")
 
+    def test_try_parse(self):
+        self.assertEqual(repr(Formula.try_parse("(1H)2(16O)")), "(1H)2(16O)")
+        self.assertEqual(repr(Formula.try_parse("e")), "e-")
+        for formula in ("Mq", "(27N)", "H3O^+", "H_2S", "Li+2-", "", "Argon", "h2o"):
+            self.assertIsNone(Formula.try_parse(formula))
+        self.assertEqual(repr(Formula.try_parse("cis-CH3CHCHCH3")), "cis-CH3CHCHCH3")
+        self.assertEqual(repr(Formula.try_parse("hν")), "hν")
+
+    def test_may_parse(self):
+        # The cheap test never rejects a valid formula.
+        for formula in good_formulas:
+            self.assertTrue(Formula._may_parse(formula))
+        for formula in ("Argon", "water", "h2o", "H3O^+", "23"):
+            self.assertFalse(Formula._may_parse(formula))
+
     def test_formula_hash(self):
         f1 = Formula("hv")
         f2 = Formula("Ar")
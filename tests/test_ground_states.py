@@ -0,0 +1,110 @@
+"""
+Unit tests for the ground_states module of PyValem
+"""
+
+import unittest
+
+from pyvalem.formula import Formula
+from pyvalem.ground_states import (
+    GroundStateError,
+    _ground_state_strings,
+    generate_ground_states,
+    ground_configuration,
+    ground_state,
+    ground_term,
+    hund_ground_term,
+)
+
+
+class GroundStatesTest(unittest.TestCase):
+    def test_shipped_table(self):
+        generated = {
+            (Z, charge): (configuration, term)
+            for Z, charge, configuration, term in generate_ground_states()
+        }
+        self.assertEqual(len(generated), 118 * 119 // 2)
+        self.assertEqual(_ground_state_strings, generated)
+
+    def test_neutral_atoms(self):
+        for symbol, configuration, term in (
+            ("H", "1s", "2S_1/2"),
+            ("He", "1s2", "1S_0"),
+            ("C", "1s2.2s2.2p2", "3P_0"),
+            ("N", "1s2.2s2.2p3", "4So_3/2"),
+            ("O", "1s2.2s2.2p4", "3P_2"),
+            ("Cr", "[Ar].3d5.4s", "7S_3"),
+            ("Fe", "[Ar].3d6.4s2", "5D_4"),
+            ("Cu", "[Ar].3d10.4s", "2S_1/2"),
+            ("Ce", "[Xe].4f.5d.6s2", "1Go_4"),
+            ("Gd", "[Xe].4f7.5d.6s2", "9Do_2"),
+            ("Pt", "[Xe].4f14.5d9.6s", "3D_3"),
+            ("U", "[Rn].5f3.6d.7s2", "5Lo_6"),
+            ("Lr", "[Rn].5f14.7s2.7p", "2Po_1/2"),
+        ):
+            state = ground_state(symbol)
+            self.assertEqual(state.configuration.state_str, configuration)
+            self.assertEqual(repr(state.term), term)
+
+    def test_ions(self):
+        self.assertEqual(ground_configuration("Fe+").state_str, "[Ar].3d6.4s")
+        self.assertEqual(repr(ground_term("Fe+")), "6D_9/2")
+        self.assertEqual(ground_configuration("Fe+13").state_str, "1s2.2s2.2p6.3s2.3p")
+        self.assertEqual(repr(ground_term("Fe+13")), "2Po_1/2")
+        self.assertEqual(ground_configuration("W+42").state_str, "[Ar].3d10.4s2.4p2")
+        self.assertEqual(repr(ground_term("W+42")), "3P_0")
+        self.assertEqual(ground_configuration("U+91").state_str, "1s")
+
+    def test_near_neutral_ions(self):
+        # Ions whose ground configurations (from the NIST ASD) are exceptions to
+        # ionization from the subshells of greatest n.
+        for species, configuration, term in (
+            ("V+", "[Ar].3d4", "5D_0"),
+            ("Co+", "[Ar].3d8", "3F_4"),
+            ("Ni+", "[Ar].3d9", "2D_5/2"),
+            ("Y+", "[Kr].5s2", "1S_0"),
+            ("Lu+", "[Xe].4f14.6s2", "1S_0"),
+            ("Lu+2", "[Xe].4f14.6s", "2S_1/2"),
+            ("Hf+", "[Xe].4f14.5d.6s2", "2D_3/2"),
+            ("Ac+", "[Rn].7s2", "1S_0"),
+            ("Ac+2", "[Rn].7s", "2S_1/2"),
+            ("Th+3", "[Rn].5f", "2Fo_5/2"),
+            # Ions following the rules.
+            ("Sc+", "[Ar].3d.4s", "3D_1"),
+            ("Ti+", "[Ar].3d2.4s", "4F_3/2"),
+            ("Cr+", "[Ar].3d5", "6S_5/2"),
+            ("Mn+", "[Ar].3d5.4s", "7S_3"),
+            ("Cu+", "[Ar].3d10", "1S_0"),
+            ("Nb+", "[Kr].4d4", "5D_0"),
+            ("Pd+", "[Kr].4d9", "2D_5/2"),
+            ("Ta+", "[Xe].4f14.5d3.6s", "5F_1"),
+            ("Pt+", "[Xe].4f14.5d9", "2D_5/2"),
+            ("Ni+2", "[Ar].3d8", "3F_4"),
+        ):
+            state = ground_state(species)
+            self.assertEqual(state.configuration.state_str, configuration)
+            self.assertEqual(repr(state.term), term)
+
+    def test_lookup(self):
+        state = ground_state("Fe+13")
+        self.assertIs(ground_state(26, 13), state)
+        self.assertIs(ground_state("Fe", 13), state)
+        self.assertIs(ground_state(Formula("Fe+13")), state)
+        self.assertEqual(ground_state("(56Fe)+13"), state)
+        self.assertEqual(ground_state(26), ground_state("Fe"))
+
+    def test_hund_ground_term(self):
+        self.assertEqual(repr(hund_ground_term("1s2.2s2.2p2")), "3P_0")
+        self.assertEqual(repr(hund_ground_term("[Ar].3d8")), "3F_4")
+        self.assertEqual(repr(hund_ground_term("[Ne].3s.3p")), "3Po_0")
+
+    def test_ground_state_errors(self):
+        self.assertRaises(GroundStateError, ground_state, "H2")
+        self.assertRaises(GroundStateError, ground_state, "CO+")
+        self.assertRaises(GroundStateError, ground_state, "H+")
+        self.assertRaises(GroundStateError, ground_state, "H-")
+        self.assertRaises(GroundStateError, ground_state, "Xx", 0)
+        self.assertRaises(GroundStateError, ground_state, 119)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,12 @@ class StatesImportTest(unittest.TestCase):
         self.assertIn("AtomicTermSymbol", states.__dict__)
         self.assertIn("CompoundLSCoupling", states.__dict__)
 
+    def test_electronic_states(self):
+        for StateClass in states.ELECTRONIC_STATES:
+            self.assertIn(StateClass, STATES)
+        self.assertNotIn(states.VibrationalState, states.ELECTRONIC_STATES)
+        self.assertNotIn(states.RotationalState, states.ELECTRONIC_STATES)
+
 
 class StatesInitFileTest(unittest.TestCase):
     def test___init___imports(self):
@@ -0,0 +1,87 @@
+"""
+Unit tests for the kinetics module of PyValem
+"""
+
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import scipy
+except ImportError:
+    scipy = None
+
+from pyvalem.reaction import Reaction
+from pyvalem.kinetics import KineticsRHS, KineticsError
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class KineticsRHSTest(unittest.TestCase):
+    def setUp(self):
+        self.reactions = [
+            Reaction("H + H + M → H2 + M"),
+            Reaction("H2 + hv → 2H"),
+            Reaction("e- + CO v=0 → e- + CO v=1"),
+            Reaction("CO v=1 + CO v=1 → CO v=0 + CO v=2"),
+        ]
+        self.f = KineticsRHS(self.reactions)
+        self.y = np.array([1.5, 10.0, 2.0, 3.0, 4.0, 5.0, 0.5])
+        self.k = np.array([0.5, 0.1, 2.0, 0.3])
+
+    def reference_dydt(self, y, k):
+        dydt = np.zeros_like(y)
+        for j, reaction in enumerate(self.reactions):
+            rate = k[j]
+            for n, ss in reaction.reactants:
+                if repr(ss) != "hν":
+                    rate *= y[self.f.species_index(ss)] ** n
+            for side, sign in ((reaction.reactants, -1), (reaction.products, 1)):
+                for n, ss in side:
+                    if repr(ss) != "hν":
+                        dydt[self.f.species_index(ss)] += sign * n * rate
+        return dydt
+
+    def test_species(self):
+        self.assertEqual(
+            self.f.species, ["H", "M", "H2", "e-", "CO v=0", "CO v=1", "CO v=2"]
+        )
+        self.assertEqual(self.f.species_index("CO v=1"), 5)
+        self.assertRaises(KineticsError, self.f.species_index, "CO v=3")
+
+        f = KineticsRHS(self.reactions[:2], species=["H2", "H", "M"])
+        self.assertEqual(f.species, ["H2", "H", "M"])
+        self.assertRaises(KineticsError, KineticsRHS, self.reactions, ["H", "M"])
+
+    def test_rhs(self):
+        np.testing.assert_allclose(
+            self.f(0, self.y, self.k), self.reference_dydt(self.y, self.k)
+        )
+        # Species conservation of H atoms.
+        dydt = self.f(0, self.y, self.k)
+        self.assertAlmostEqual(dydt[0] + 2 * dydt[2], 0)
+
+    def test_jacobian(self):
+        J = self.f.jacobian(0, self.y, self.k)
+        eps = 1.0e-6
+        J_fd = np.empty_like(J)
+        for l in range(len(self.y)):
+            dy = np.zeros_like(self.y)
+            dy[l] = eps
+            J_fd[:, l] = (
+                self.f(0, self.y + dy, self.k) - self.f(0, self.y - dy, self.k)
+            ) / (2 * eps)
+        np.testing.assert_allclose(J, J_fd, rtol=1.0e-6, atol=1.0e-8)
+        # Only the structurally nonzero elements are stored.
+        self.assertEqual(len(self.f.jacobian_rows), np.count_nonzero(J))
+
+    @unittest.skipIf(scipy is None, "SciPy is not installed")
+    def test_jacobian_sparse(self):
+        J = self.f.jacobian_sparse(0, self.y, self.k)
+        np.testing.assert_allclose(J.toarray(), self.f.jacobian(0, self.y, self.k))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Unit tests for the nuclear_spin module of PyValem
+"""
+
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from pyvalem.atom_data import isotopes
+from pyvalem.formula import Formula
+from pyvalem.nuclear_spin import (
+    NuclearSpinError,
+    nuclear_spin,
+    nuclear_spin_factors,
+    nuclear_spin_weights,
+    nuclear_spins,
+    principal_isotopes,
+    spin_isomer,
+    spin_isomers,
+)
+from pyvalem.stateful_species import StatefulSpecies
+
+
+class NuclearSpinTest(unittest.TestCase):
+    def test_nuclear_spin(self):
+        self.assertEqual(nuclear_spin("1H"), 0.5)
+        self.assertEqual(nuclear_spin("H"), 0.5)
+        self.assertEqual(nuclear_spin("2H"), 1)
+        self.assertEqual(nuclear_spin(isotopes["17O"]), 2.5)
+        self.assertEqual(nuclear_spin("N"), 1)
+        self.assertEqual(nuclear_spin("15N"), 0.5)
+        self.assertEqual(nuclear_spin("Cs"), 3.5)
+        self.assertRaises(NuclearSpinError, nuclear_spin, "99Tc")
+        self.assertRaises(NuclearSpinError, nuclear_spin, "U")
+        # Every tabulated isotope is known to PyValem.
+        for symbol in nuclear_spins:
+            self.assertIn(symbol, isotopes)
+        for element, symbol in principal_isotopes.items():
+            self.assertEqual(isotopes[symbol].symbol, symbol)
+            self.assertTrue(symbol.endswith(element))
+
+    def test_nuclear_spin_weights(self):
+        self.assertEqual(nuclear_spin_weights("H2"), (1, 3))
+        self.assertEqual(nuclear_spin_weights(Formula("(1H)2")), (1, 3))
+        self.assertEqual(nuclear_spin_weights("H2+"), (1, 3))
+        self.assertEqual(nuclear_spin_weights("(2H)2"), (6, 3))
+        self.assertEqual(nuclear_spin_weights("(14N)2"), (6, 3))
+        self.assertEqual(nuclear_spin_weights("(15N)2"), (1, 3))
+        self.assertEqual(nuclear_spin_weights("O2"), (1, 0))
+        self.assertEqual(nuclear_spin_weights("(17O)2"), (15, 21))
+        self.assertEqual(nuclear_spin_weights("(35Cl)2"), (6, 10))
+        for formula in ("HD", "CO", "(16O)(18O)", "H2O", "O3", "H"):
+            self.assertIsNone(nuclear_spin_weights(formula))
+        self.assertRaises(NuclearSpinError, nuclear_spin_weights, "(99Tc)2")
+
+    def test_spin_isomer(self):
+        self.assertEqual(spin_isomer("H2 J=0"), "para")
+        self.assertEqual(spin_isomer("H2 X(1SIGMA+g);v=1;J=3"), "ortho")
+        self.assertEqual(spin_isomer(StatefulSpecies("D2 J=2")), "ortho")
+        self.assertEqual(spin_isomer("(14N)2 X(1SIGMA+g);J=1"), "para")
+        # The even-J levels of the Σu+ state of H2 are antisymmetric.
+        self.assertEqual(spin_isomer("H2 B(1SIGMA+u);J=0"), "ortho")
+        self.assertIsNone(spin_isomer("H2 C(1PIu);J=1"))
+        self.assertIsNone(spin_isomer("H2 X(1SIGMA+g)"))
+        self.assertIsNone(spin_isomer("O2 X(3SIGMA-g);J=1"))
+        self.assertIsNone(spin_isomer("(14N)2 A(3SIGMA+u);J=1"))
+        self.assertIsNone(spin_isomer("HD J=1"))
+        self.assertIsNone(spin_isomer("H2+ X(2SIGMA+g);J=1/2"))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_arrays(self):
+        J = np.arange(6)
+        self.assertTrue(
+            np.array_equal(nuclear_spin_factors("H2", J), [1, 3, 1, 3, 1, 3])
+        )
+        self.assertTrue(
+            np.array_equal(
+                nuclear_spin_factors("O2", J, "b(1SIGMA+g)"), [1, 0, 1, 0, 1, 0]
+            )
+        )
+        self.assertTrue(
+            np.array_equal(nuclear_spin_factors("O2", J, "X(3SIGMA-g)"), [1] * 6)
+        )
+        self.assertTrue(
+            np.array_equal(nuclear_spin_factors("D2", J, "c(3PIu)"), [4.5] * 6)
+        )
+        self.assertTrue(np.array_equal(nuclear_spin_factors("HD", J), [1] * 6))
+        self.assertTrue(
+            np.array_equal(nuclear_spin_factors("H2+", [0.5, 1, 2]), [1, 3, 1])
+        )
+        self.assertEqual(
+            list(spin_isomers("(14N)2", J[:3])), ["ortho", "para", "ortho"]
+        )
+        self.assertEqual(list(spin_isomers("H2", [0, 1, 1.5])), ["para", "ortho", ""])
+        self.assertEqual(list(spin_isomers("O2", J[:2])), ["", ""])
+        self.assertEqual(list(spin_isomers("D2", J[:2], "a(3SIGMA+g)")), ["", ""])
+        for j in range(4):
+            level = "H2 B(1SIGMA+u);J={}".format(j)
+            self.assertEqual(
+                spin_isomers("H2", [j], "B(1SIGMA+u)")[0], spin_isomer(level)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
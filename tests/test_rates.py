@@ -0,0 +1,107 @@
+"""
+Unit tests for the rates module of PyValem
+"""
+
+import math
+import unittest
+
+from pyvalem.reaction import Reaction
+from pyvalem.rates import (
+    Arrhenius,
+    ModifiedArrhenius,
+    TabulatedRate,
+    RateEvaluator,
+    RateLaw,
+    RateLawError,
+    evaluate_rates,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class RateLawTest(unittest.TestCase):
+    def test_arrhenius(self):
+        k = Arrhenius(1.0e-10, 1000)
+        self.assertAlmostEqual(float(k(500)), 1.0e-10 * math.exp(-2))
+        k = ModifiedArrhenius(1.0e-10, 0.5, 1000, T0=300)
+        self.assertAlmostEqual(float(k(1200)), 2.0e-10 * math.exp(-1 / 1.2))
+        np.testing.assert_allclose(k([300, 1200]), [k(300), k(1200)])
+
+    def test_tabulated(self):
+        k = TabulatedRate([100, 1000, 10000], [1.0e-12, 1.0e-11, 1.0e-9])
+        np.testing.assert_allclose(
+            k([50, 100, 316.22776601683796, 1000, 3162.2776601683795, 20000]),
+            [1.0e-12, 1.0e-12, 10**-11.5, 1.0e-11, 1.0e-10, 1.0e-9],
+        )
+        k = TabulatedRate([100, 200], [0, 2.0e-10], loglog=False)
+        np.testing.assert_allclose(k([150, 175]), [1.0e-10, 1.5e-10])
+
+        self.assertRaises(RateLawError, TabulatedRate, [100], [1.0e-12])
+        self.assertRaises(RateLawError, TabulatedRate, [100, 50], [1, 2])
+        self.assertRaises(RateLawError, TabulatedRate, [100, 200], [1, 2, 3])
+        self.assertRaises(RateLawError, TabulatedRate, [100, 200], [0, 2])
+
+    def test_reaction_rate(self):
+        r = Reaction("O + H2 → OH + H", rate=Arrhenius(3.44e-13, 4000))
+        self.assertEqual(r.rate.Ea, 4000)
+        self.assertIsNone(Reaction("O + H2 → OH + H").rate)
+        self.assertIsNone(r.reversed().rate)
+
+    def test_abstract(self):
+        self.assertRaises(TypeError, RateLaw)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class RateEvaluatorTest(unittest.TestCase):
+    def test_evaluate(self):
+        rates = [
+            Arrhenius(3.44e-13, 4000),
+            TabulatedRate([100, 1000, 10000], [1.0e-12, 1.0e-11, 1.0e-9]),
+            None,
+            ModifiedArrhenius(1.0e-10, -0.5, 0),
+            TabulatedRate([300, 600, 900, 1200], [1, 4, 9, 16], loglog=False),
+            TabulatedRate([500, 5000], [2.0e-9, 2.0e-8]),
+        ]
+        reactions = [Reaction("O + H2 → OH + H", rate=rate) for rate in rates]
+        T = np.array([50.0, 300.0, 750.0, 1000.0, 2500.0, 1.0e5])
+        k = RateEvaluator(reactions)(T)
+        self.assertEqual(k.shape, (6, 6))
+        self.assertTrue(np.all(np.isnan(k[2])))
+        for i, rate in enumerate(rates):
+            if rate is not None:
+                np.testing.assert_allclose(k[i], rate(T), rtol=1.0e-12)
+
+        k = evaluate_rates(reactions, 1000)
+        self.assertEqual(k.shape, (6, 1))
+        self.assertAlmostEqual(k[4, 0], 11.0 + 1 / 3)
+
+        self.assertEqual(evaluate_rates([], T).shape, (0, 6))
+
+    def test_custom_rate(self):
+        class PowerLaw(RateLaw):
+            def __init__(self, A, n):
+                self.A, self.n = A, n
+
+            def __call__(self, T):
+                return self.A * np.asarray(T, dtype=float) ** self.n
+
+        rates = [Arrhenius(3.44e-13, 4000), PowerLaw(1.0e-12, 0.5), None]
+        reactions = [Reaction("O + H2 → OH + H", rate=rate) for rate in rates]
+        T = np.array([100.0, 400.0, 900.0])
+        k = RateEvaluator(reactions)(T)
+        np.testing.assert_allclose(k[0], rates[0](T), rtol=1.0e-12)
+        np.testing.assert_allclose(k[1], [1.0e-11, 2.0e-11, 3.0e-11], rtol=1.0e-12)
+        self.assertTrue(np.all(np.isnan(k[2])))
+        self.assertEqual(evaluate_rates(reactions[1:2], 400).shape, (1, 1))
+
+    def test_unsupported_rate(self):
+        reactions = [Reaction("O + H2 → OH + H", rate=lambda T: 1.0e-10)]
+        self.assertRaises(RateLawError, RateEvaluator, reactions)
+
+
+if __name__ == "__main__":
+    unittest.main()
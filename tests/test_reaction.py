@@ -2,6 +2,7 @@
 # Unit tests for the reaction module of PyValem
 """
 
+import io
 import unittest
 
 from pyvalem.reaction import (
@@ -9,7 +10,11 @@ from pyvalem.reaction import (
     ReactionParseError,
     ReactionStoichiometryError,
     ReactionChargeError,
+    ReactionLineError,
+    iter_reactions,
+    render_rows,
 )
+from pyvalem.states import StateParseError
 
 
 class ReactionParseTest(unittest.TestCase):
@@ -203,6 +208,118 @@ class ReactionParseTest(unittest.TestCase):
         self.assertEqual(r.products_text_count_map, {"C-": 2})
         self.assertEqual(repr(r), "2e- + C2 → C- + C-")
 
+    def test_reaction_from_species(self):
+        r = Reaction("CO v=1 + 2O2 → CO2 + O + O2")
+        r2 = Reaction.from_species(r.reactants, [ss for _, ss in r.products], "->")
+        self.assertEqual(r, r2)
+        self.assertEqual(str(r2), str(r))
+        self.assertEqual(r2.reactants_text_count_map, {"CO v=1": 1, "O2": 2})
+        self.assertRaises(
+            ReactionStoichiometryError,
+            Reaction.from_species,
+            r.reactants,
+            r.products[:1],
+        )
+        self.assertRaises(ReactionParseError, Reaction.from_species, [], [], "=>")
+
+
+class IterReactionsTest(unittest.TestCase):
+    def setUp(self):
+        self.text = "\n".join(
+            [
+                "# A comment",
+                "CO + O2 → CO2 + O",
+                "",
+                "BeH+ + I2 <-> BeI + HI",
+                "BeH + I2 <-> BeI",
+                "CO + O2 CO2 + O",
+                "CO v=1 + O2 J=2;X(3SIGMA-g) → CO2 + O",
+                "C2H4 v + H -> C2H5",
+                "e- + Ar → Ar+ + 2e-",
+            ]
+        )
+
+    def check_parsed(self, parsed):
+        self.assertEqual(len(parsed), 7)
+        self.assertEqual(parsed[0], Reaction("CO + O2 → CO2 + O"))
+        for i, lineno, exc in (
+            (1, 4, ReactionChargeError),
+            (2, 5, ReactionStoichiometryError),
+            (3, 6, ReactionParseError),
+            (5, 8, StateParseError),
+        ):
+            self.assertIsInstance(parsed[i], ReactionLineError)
+            self.assertEqual(parsed[i].lineno, lineno)
+            self.assertIsInstance(parsed[i].error, exc)
+        self.assertEqual(repr(parsed[4]), "CO v=1 + O2 X(3Σ-g);J=2 → CO2 + O")
+        self.assertEqual(repr(parsed[6]), "e- + Ar → Ar+ + 2e-")
+
+    def test_iter_reactions(self):
+        parsed = list(iter_reactions(io.StringIO(self.text)))
+        self.check_parsed(parsed)
+
+        parsed = list(iter_reactions(io.StringIO(self.text), strict=False))
+        self.assertIsInstance(parsed[1], Reaction)
+        self.assertIsInstance(parsed[2], Reaction)
+
+    def test_iter_reactions_column(self):
+        lines = [
+            "{}\t{}\t1.0e-10".format(i, line)
+            for i, line in enumerate(self.text.splitlines())
+        ]
+        lines.append("9")
+        parsed = list(iter_reactions(io.StringIO("\n".join(lines)), column=1))
+        # NB the comment and blank lines are no longer skipped.
+        self.assertEqual(len(parsed), 10)
+        self.assertEqual(parsed[1], Reaction("CO + O2 → CO2 + O"))
+        self.assertIsInstance(parsed[-1], ReactionLineError)
+        self.assertEqual(parsed[-1].lineno, 10)
+
+    def test_iter_reactions_processes(self):
+        parsed = list(
+            iter_reactions(
+                io.StringIO(self.text), processes=2, chunksize=2, max_chunks=2
+            )
+        )
+        self.check_parsed(parsed)
+
+    def test_iter_reactions_invalid_state(self):
+        text = "CO + O2 → CO2 + O\nAr (1,1/2)_2 → Ar (1,1/2)_2\ne- + Ar → Ar+ + 2e-\n"
+        for processes in (None, 2):
+            parsed = list(iter_reactions(io.StringIO(text), processes=processes))
+            self.assertEqual(len(parsed), 3)
+            self.assertEqual(parsed[0], Reaction("CO + O2 → CO2 + O"))
+            self.assertIsInstance(parsed[1], ReactionLineError)
+            self.assertEqual(parsed[1].lineno, 2)
+            self.assertIsInstance(parsed[1].error, ValueError)
+            self.assertEqual(parsed[2], Reaction("e- + Ar → Ar+ + 2e-"))
+
+
+class RenderRowsTest(unittest.TestCase):
+    def test_render_rows(self):
+        reactions = [
+            Reaction("e- + Ar 3p6 → e- + Ar 3p5.4s"),
+            Reaction("Ar 3p5.4s + Ar 3p5.4s → Ar+ + Ar + e-"),
+            Reaction("CO + O2 <-> CO2 + O"),
+        ]
+        rows = list(render_rows(iter(reactions), columns=[lambda r: "<{}>".format(1)]))
+        self.assertEqual(len(rows), 3)
+        for reaction, row in zip(reactions, rows):
+            self.assertEqual(
+                row, "<tr><td>{}</td><td>&lt;1&gt;</td></tr>".format(reaction.html)
+            )
+        rows = list(render_rows(reactions, "latex", cache_size=1))
+        for reaction, row in zip(reactions, rows):
+            self.assertEqual(row, "${}$ \\\\".format(reaction.latex))
+        self.assertRaises(ValueError, next, render_rows(reactions, "rtf"))
+
+    def test_memoized_rendering(self):
+        r = Reaction("e- + CO X(1SIGMA+);v=0 → e- + CO A(1PI);v=1")
+        ss = r.reactants[1][1]
+        self.assertIs(ss.html, ss.html)
+        self.assertIs(ss.states[0].latex, ss.states[0].latex)
+        self.assertEqual(r.html, r.html)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,121 @@
+"""
+Unit tests for the reaction_classifier module of PyValem
+"""
+
+import unittest
+
+from pyvalem.reaction import Reaction
+from pyvalem.reaction_classifier import (
+    ReactionClassifier,
+    ReactionClassifierError,
+    SpeciesTable,
+    ELECTRON,
+    HEAVY,
+    PHOTON,
+)
+
+
+class SpeciesTableTest(unittest.TestCase):
+    def test_encode(self):
+        table = SpeciesTable()
+        record = table.encode(Reaction("e- + 2H -> e- + H + H"))
+        self.assertEqual(record.lhs, record.rhs)
+        self.assertEqual(len(record.lhs), 3)
+        self.assertEqual(len(table), 2)
+        record = table.encode(Reaction("H + hv -> H+ + e-"))
+        self.assertEqual(len(table), 4)
+        e_id, h_id, hv_id, hplus_id = (
+            table.species.index(s) for s in ("e-", "H", "hν", "H+")
+        )
+        self.assertEqual(record.lhs, tuple(sorted((h_id, hv_id))))
+        self.assertEqual(table.kinds[e_id], ELECTRON)
+        self.assertEqual(table.kinds[hv_id], PHOTON)
+        self.assertEqual(table.kinds[h_id], HEAVY)
+        self.assertEqual(table.charges[hplus_id], 1)
+        self.assertNotEqual(table.formula_ids[h_id], table.formula_ids[hplus_id])
+        self.assertEqual(table.neutral_ids[h_id], table.neutral_ids[hplus_id])
+        self.assertFalse(record.charge_swapped)
+        record = table.encode(Reaction("Ar+ + Ar -> Ar + Ar+"))
+        self.assertEqual(record.lhs, record.rhs)
+        self.assertTrue(record.charge_swapped)
+        self.assertFalse(table.encode(Reaction("Ar+ + Ar -> Ar+ + Ar")).charge_swapped)
+
+
+class ReactionClassifierTest(unittest.TestCase):
+    def setUp(self):
+        self.classifier = ReactionClassifier()
+
+    def test_default_rules(self):
+        expected = {
+            "e- + Ar -> e- + Ar": "elastic",
+            "e- + Ar -> Ar+ + 2e-": "ionization",
+            "hv + H2 -> H2+ + e-": "ionization",
+            "e- + H2 -> H + H+ + 2e-": "ionization",
+            "e- + H- -> H + 2e-": "detachment",
+            "e- + O2+ -> O + O": "recombination",
+            "e- + Ar+ -> Ar + hv": "recombination",
+            "H+ + H- -> H + H": "recombination",
+            "e- + O2 -> O2-": "attachment",
+            "e- + O2 -> O- + O": "attachment",
+            "e- + H2 -> e- + H + H": "dissociation",
+            "hv + H2O -> OH + H": "dissociation",
+            "H + H + M -> H2 + M": "association",
+            "Ar+ + H -> Ar + H+": "charge exchange",
+            "He+2 + H -> He+ + H+": "charge exchange",
+            "Ar+ + Ar -> Ar + Ar+": "charge exchange",
+            "Ar+ + Ar -> Ar+ + Ar": "elastic",
+            "H2+ + H2 v=1 -> H2 v=1 + H2+": "charge exchange",
+            "e- + CO v=0 -> e- + CO v=1": "excitation",
+            "Ar + Ar * -> Ar + Ar": "excitation",
+            "Ar * -> Ar + hv": "radiative",
+            "O + H2 -> OH + H": "rearrangement",
+            "Ar+ + He ->": "unclassified",
+        }
+        for r_str, label in expected.items():
+            with self.subTest(r_str):
+                reaction = Reaction(r_str, strict=False)
+                self.assertEqual(self.classifier.classify(reaction), label)
+
+        records = [self.classifier.encode(Reaction(s, strict=False)) for s in expected]
+        self.assertEqual(self.classifier.classify_all(records), list(expected.values()))
+
+    def test_register(self):
+        r = Reaction("hv + H2O -> OH + H")
+        self.classifier.register(
+            "photodissociation",
+            lambda f: f.n_hv_lhs and len(f.rhs) > len(f.lhs),
+            before="dissociation",
+        )
+        self.assertEqual(self.classifier.classify(r), "photodissociation")
+        self.assertEqual(
+            self.classifier.classify(Reaction("e- + H2 -> e- + H + H")),
+            "dissociation",
+        )
+
+        table = self.classifier.species_table
+        self.classifier.register(
+            "water chemistry",
+            lambda f: any(table.species[sid] == "H2O" for sid in f.lhs),
+        )
+        self.assertEqual(self.classifier.classify(r), "water chemistry")
+
+        self.assertRaises(
+            ReactionClassifierError,
+            self.classifier.register,
+            "nothing",
+            lambda f: False,
+            before="no such label",
+        )
+
+    def test_shared_species_table(self):
+        # An empty table is shared, not replaced.
+        table = SpeciesTable()
+        classifier = ReactionClassifier(table)
+        self.assertIs(classifier.species_table, table)
+        table.encode(Reaction("e- + Ar -> e- + Ar"))
+        classifier.classify(Reaction("e- + Ar -> e- + Ar"))
+        self.assertEqual(len(table), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
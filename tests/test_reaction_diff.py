@@ -0,0 +1,79 @@
+"""
+Unit tests for the reaction_diff module of PyValem
+"""
+
+import unittest
+
+from pyvalem.rates import Arrhenius
+from pyvalem.reaction import Reaction, ReactionParseError
+from pyvalem.reaction_diff import (
+    diff_reactions,
+    ADDED,
+    REMOVED,
+    CHANGED,
+    UNCHANGED,
+)
+
+
+class DiffReactionsTest(unittest.TestCase):
+    def setUp(self):
+        self.old = [
+            "CO + O2 → CO2 + O",
+            "H + H + M → H2 + M",
+            "e- + Ar → Ar+ + 2e-",
+            "e- + CO v=0 → e- + CO v=1",
+            "e- + CO v=0 → e- + CO v=1",
+        ]
+        self.new = [
+            Reaction("2H + M → H2 + M"),
+            "e- + Ar → Ar+ + 2e-",
+            "e- + CO v=0 → e- + CO v=1",
+            "e- + N2 → N2+ + 2e-",
+            "CO2 + O → CO + O2",
+        ]
+
+    def test_diff_reactions(self):
+        diff = list(diff_reactions(self.old, self.new))
+        self.assertEqual(
+            [(d.status, d.old_index, d.new_index) for d in diff],
+            [
+                (CHANGED, 1, 0),
+                (ADDED, None, 3),
+                (ADDED, None, 4),
+                (REMOVED, 0, None),
+                (REMOVED, 4, None),
+            ],
+        )
+        self.assertIsInstance(diff[0].old, Reaction)
+        self.assertEqual(diff[0].old, diff[0].new)
+
+        diff = list(diff_reactions(self.old, self.new, unchanged=True))
+        self.assertEqual(sum(d.status == UNCHANGED for d in diff), 2)
+
+    def test_match_reverse(self):
+        diff = list(diff_reactions(self.old, self.new, match_reverse=True))
+        self.assertEqual(
+            [(d.status, d.old_index, d.new_index) for d in diff],
+            [(CHANGED, 1, 0), (ADDED, None, 3), (CHANGED, 0, 4), (REMOVED, 4, None)],
+        )
+
+    def test_changed(self):
+        old = [Reaction("O + H2 → OH + H", rate=Arrhenius(3.44e-13, 4000))]
+        new = [Reaction("O + H2 → OH + H", rate=Arrhenius(3.44e-13, 4100))]
+        self.assertEqual(list(diff_reactions(old, new)), [])
+        diff = list(
+            diff_reactions(old, new, changed=lambda a, b: a.rate.Ea != b.rate.Ea)
+        )
+        self.assertEqual(len(diff), 1)
+        self.assertEqual(diff[0].status, CHANGED)
+
+    def test_strict(self):
+        self.assertRaises(
+            ReactionParseError, list, diff_reactions(["BeH+ + I2 → BeI + HI"], [])
+        )
+        diff = list(diff_reactions(["BeH+ + I2 → BeI + HI"], [], strict=False))
+        self.assertEqual(diff[0].status, REMOVED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Unit tests for the reaction_enumeration module of PyValem
+"""
+
+import itertools
+import unittest
+
+from pyvalem.reaction import Reaction, ReactionParseError
+from pyvalem.reaction_enumeration import (
+    CompositionTable,
+    ReactionEnumerationError,
+    enumerate_channels,
+    enumerate_reactions,
+)
+
+
+class EnumerateReactionsTest(unittest.TestCase):
+    species = ["H", "H+", "H-", "H2", "O", "O+", "OH", "e-", "M"]
+
+    def brute_force(self, n_reactants, n_products):
+        """Test every combination of reactants and products by parsing it.
+
+        Reaction does not check the conservation of the third body, M, but
+        enumerate_reactions does.
+        """
+        found = set()
+        for lhs in itertools.combinations_with_replacement(self.species, n_reactants):
+            for rhs in itertools.combinations_with_replacement(
+                self.species, n_products
+            ):
+                if lhs == rhs or lhs.count("M") != rhs.count("M"):
+                    continue
+                try:
+                    found.add(repr(Reaction(" + ".join(lhs) + " → " + " + ".join(rhs))))
+                except ReactionParseError:
+                    pass
+        return found
+
+    def test_composition_table(self):
+        table = CompositionTable(["OH+", "H2", "e-", "M", "H2"])
+        self.assertEqual(len(table), 4)
+        self.assertEqual(table.components, ["H", "M", "O", None])
+        self.assertEqual(
+            table.vectors, [(1, 0, 1, 1), (2, 0, 0, 0), (0, 0, 0, -1), (0, 1, 0, 0)]
+        )
+        self.assertEqual(table.species_id("H2"), 1)
+        self.assertRaises(ReactionEnumerationError, table.species_id, "O")
+
+    def test_enumerate_matches_brute_force(self):
+        for n_reactants, n_products in ((2, 2), (1, 2), (2, 1)):
+            with self.subTest(n_reactants=n_reactants, n_products=n_products):
+                found = {
+                    repr(r)
+                    for r in enumerate_reactions(self.species, n_reactants, n_products)
+                }
+                self.assertEqual(found, self.brute_force(n_reactants, n_products))
+
+    def test_enumerate_options(self):
+        table = CompositionTable(self.species)
+        m = table.species_id("M")
+        channels = list(enumerate_channels(table, 3, (1, 2), reactants=["M"]))
+        self.assertTrue(channels)
+        self.assertTrue(all(m in lhs and m in rhs for lhs, rhs in channels))
+        self.assertIn(
+            "H + H + M → H2 + M",
+            {repr(r) for r in enumerate_reactions(self.species, 3, 2, ["M"])},
+        )
+        self.assertEqual(list(enumerate_reactions(["H", "M"])), [])
+        self.assertEqual(
+            [repr(r) for r in enumerate_reactions(["H", "M"], elastic=True)],
+            ["H + H → H + H", "H + M → H + M", "M + M → M + M"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Unit tests for the reaction_index module of PyValem
+"""
+
+import io
+import unittest
+
+from pyvalem.reaction import Reaction
+from pyvalem.reaction_index import ReactionIndex, ReactionIndexError
+from pyvalem.stateful_species import StatefulSpecies
+
+
+class ReactionIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.r_strings = [
+            "CO v=1 + O2 → CO2 + O",
+            "CO + O2 → CO2 + O",
+            "e- + Ar → Ar+ + 2e-",
+            "Ar+ + H2 → ArH+ + H",
+            "e- + CO v=1 → CO v=0 + e-",
+            "H2 + hv -> H + H",
+        ]
+        self.index = ReactionIndex()
+        self.ids = self.index.update(Reaction(s) for s in self.r_strings)
+
+    def test_add(self):
+        self.assertEqual(self.ids, list(range(6)))
+        self.assertEqual(len(self.index), 6)
+        self.assertIn(3, self.index)
+        self.assertEqual(self.index.add(Reaction("H + H -> H2"), reaction_id=10), 10)
+        self.assertEqual(self.index.add(Reaction("H + H -> H2")), 11)
+        self.assertRaises(
+            ReactionIndexError, self.index.add, Reaction("H + H -> H2"), 10
+        )
+
+    def test_find_by_side(self):
+        self.assertEqual(self.index.find(reactants=["CO v=1"]), [0, 4])
+        self.assertEqual(self.index.find(reactants=["CO"]), [0, 1, 4])
+        self.assertEqual(self.index.find(products=["CO"]), [4])
+        self.assertEqual(self.index.find(products=["CO v=1"]), [])
+        self.assertEqual(self.index.find(products="e-"), [2, 4])
+        self.assertEqual(self.index.find(reactants=["hν"]), [5])
+        self.assertEqual(
+            self.index.find(reactants=[StatefulSpecies("CO v=1")], products=["e-"]),
+            [4],
+        )
+
+    def test_find_and_or(self):
+        self.assertEqual(self.index.find(species=["Ar+", "H2"]), [3])
+        self.assertEqual(self.index.find(species=["Ar+", "H2"], match="any"), [2, 3, 5])
+        self.assertEqual(self.index.find(species=["Ar+", "Xe"]), [])
+        self.assertEqual(self.index.find(), [])
+        self.assertRaises(ReactionIndexError, self.index.find, ["H2"], match="some")
+
+    def test_remove(self):
+        self.index.remove(0)
+        self.assertEqual(self.index.find(reactants=["CO v=1"]), [4])
+        self.assertEqual(self.index.find(reactants=["CO"]), [1, 4])
+        self.index.remove(4)
+        self.assertEqual(self.index.find(species=["CO"]), [1])
+        self.assertEqual(self.index.find(products=["e-"]), [2])
+        self.assertNotIn(4, self.index)
+        self.assertRaises(ReactionIndexError, self.index.remove, 4)
+
+    def test_dump_and_load(self):
+        self.index.remove(1)
+        fp = io.StringIO()
+        self.index.dump(fp)
+        fp.seek(0)
+        index = ReactionIndex.load(fp)
+        self.assertEqual(index.ids, [0, 2, 3, 4, 5])
+        for query in ("CO", "CO v=1", "e-", "Ar+", "H2", "hν"):
+            with self.subTest(query):
+                self.assertEqual(
+                    index.find(species=[query]), self.index.find(species=[query])
+                )
+        self.assertEqual(index.add(Reaction("H + H -> H2")), 6)
+
+        self.assertRaises(ReactionIndexError, ReactionIndex.load, io.StringIO("{}"))
+
+
+if __name__ == "__main__":
+    unittest.main()
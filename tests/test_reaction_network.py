@@ -0,0 +1,88 @@
+"""
+Unit tests for the reaction_network module of PyValem
+"""
+
+import unittest
+
+from pyvalem.reaction import Reaction
+from pyvalem.reaction_network import ReactionNetwork, ReactionNetworkError
+
+
+class ReactionNetworkTest(unittest.TestCase):
+    def setUp(self):
+        self.network = ReactionNetwork(
+            Reaction(s)
+            for s in (
+                "e- + N2 → N2+ + 2e-",  # 0
+                "N2+ + O2 → O2+ + N2",  # 1
+                "e- + O2+ → O + O",  # 2
+                "e- + N2 → N + N + e-",  # 3
+                "N + O2 → NO + O",  # 4
+                "N + O + M → NO + M",  # 5
+                "e- + NO → NO+ + 2e-",  # 6
+                "e- + CO v=0 → e- + CO v=1",  # 7
+            )
+        )
+
+    def test_csr(self):
+        network = self.network
+        self.assertEqual(len(network.species), 10)
+        self.assertNotIn("e-", network.species)
+        self.assertNotIn("M", network.species)
+        self.assertEqual(network.consumers("N2"), [0, 3])
+        self.assertEqual(network.producers("N2"), [1])
+        self.assertEqual(network.producers("O"), [2, 4])
+        self.assertEqual(network.consumers("CO v=0"), [7])
+        self.assertEqual(list(network.consumers_indptr)[-1], 11)
+        self.assertEqual(len(network.products_indptr), 9)
+        self.assertRaises(ReactionNetworkError, network.consumers, "Xe")
+
+    def test_shortest_path(self):
+        pathway = self.network.shortest_path("N2", "NO+")
+        self.assertEqual(pathway.species, ["N2", "N", "NO", "NO+"])
+        self.assertEqual(pathway.reactions, [3, 4, 6])
+        self.assertEqual(pathway.cost, 3)
+        self.assertIsNone(self.network.shortest_path("NO+", "N2"))
+        self.assertIsNone(self.network.shortest_path("CO v=0", "N2"))
+        self.assertEqual(self.network.shortest_path("O", "O").reactions, [])
+
+    def test_weighted_shortest_path(self):
+        costs = [1, 1, 1, 10, 1, 1, 1, 1]
+        pathway = self.network.shortest_path("N2", "NO", cost=costs)
+        self.assertEqual(pathway.reactions, [0, 1, 2, 5])
+        self.assertEqual(pathway.cost, 4)
+        pathway = self.network.shortest_path(
+            "N2", "NO", cost=lambda r: 1 + len(r.products)
+        )
+        self.assertEqual(pathway.reactions, [3, 4])
+        self.assertRaises(
+            ReactionNetworkError, self.network.shortest_path, "N2", "NO", [1, 2]
+        )
+        self.assertRaises(
+            ReactionNetworkError,
+            self.network.shortest_path,
+            "N2",
+            "NO",
+            [-1] * 8,
+        )
+
+    def test_reachable(self):
+        closure = self.network.reachable(["N2"])
+        self.assertEqual(sorted(closure.species), ["N", "N2", "N2+"])
+        self.assertEqual(closure.reactions, [0, 3])
+        closure = self.network.reachable(["N2", "O2"])
+        self.assertEqual(
+            sorted(closure.species),
+            ["N", "N2", "N2+", "NO", "NO+", "O", "O2", "O2+"],
+        )
+        self.assertEqual(closure.reactions, [0, 1, 2, 3, 4, 5, 6])
+        closure = self.network.reachable(["O2"], require_all_reactants=False)
+        self.assertEqual(
+            sorted(closure.species),
+            ["N", "N2", "N2+", "NO", "NO+", "O", "O2", "O2+"],
+        )
+        self.assertEqual(closure.reactions, [0, 1, 2, 3, 4, 5, 6])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Unit tests for the reaction_pairs module of PyValem
+"""
+
+import unittest
+
+from pyvalem.reaction import Reaction
+from pyvalem.reaction_pairs import (
+    pair_key,
+    group_reactions,
+    find_duplicates,
+    find_reverse_pairs,
+    fold_reversible,
+)
+
+
+class ReactionPairsTest(unittest.TestCase):
+    def setUp(self):
+        self.reactions = [
+            Reaction(s)
+            for s in (
+                "e- + Ar → Ar+ + 2e-",
+                "CO + O2 → CO2 + O",
+                "Ar+ + 2e- → Ar + e-",
+                "2H + M → H2 + M",
+                "CO2 + O <-> CO + O2",
+                "H + H + M -> H2 + M",
+                "e- + Ar -> Ar+ + e- + e-",
+                "O + CO2 → CO + O2",
+            )
+        ]
+
+    def test_reversed(self):
+        r = Reaction("e- + Ar → Ar+ + 2e-")
+        self.assertEqual(repr(r.reversed()), "2e- + Ar+ → Ar + e-")
+        self.assertEqual(r.reversed().reversed(), r)
+        self.assertEqual(r.reversed(), self.reactions[2])
+        self.assertEqual(repr(r), "e- + Ar → Ar+ + 2e-")
+        self.assertEqual(len({r, self.reactions[6], self.reactions[0]}), 1)
+
+    def test_pair_key(self):
+        r1, r2 = self.reactions[0], self.reactions[2]
+        self.assertEqual(pair_key(r1), pair_key(r2))
+        self.assertEqual(pair_key(self.reactions[1]), pair_key(self.reactions[4]))
+        self.assertNotEqual(pair_key(self.reactions[1]), pair_key(self.reactions[7]))
+
+    def test_group_reactions(self):
+        groups = group_reactions(self.reactions)
+        self.assertEqual(len(groups), 4)
+        self.assertEqual(groups[0], ([0, 6], [2], []))
+        self.assertEqual(groups[1], ([1], [], [4]))
+        self.assertEqual(groups[2], ([3, 5], [], []))
+        self.assertEqual(groups[3], ([7], [], []))
+
+    def test_find_duplicates(self):
+        self.assertEqual(find_duplicates(self.reactions), [[0, 6], [3, 5]])
+
+    def test_find_reverse_pairs(self):
+        self.assertEqual(find_reverse_pairs(self.reactions), [(0, 2)])
+
+    def test_fold_reversible(self):
+        folded = fold_reversible(self.reactions)
+        self.assertEqual(
+            [repr(r) for r in folded],
+            [
+                "e- + Ar ⇌ Ar+ + 2e-",
+                "CO + O2 ⇌ CO2 + O",
+                "H + H + M → H2 + M",
+                "O + CO2 → CO + O2",
+            ],
+        )
+        # The original reactions are not modified.
+        self.assertEqual(self.reactions[0].sep, "→")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Unit tests for the reaction_reduction module of PyValem
+"""
+
+import unittest
+
+from pyvalem.rates import Arrhenius
+from pyvalem.reaction import Reaction
+from pyvalem.reaction_reduction import (
+    NetworkReducer,
+    electronic_states,
+    strip_states,
+    vibrational_above,
+)
+from pyvalem.stateful_species import StatefulSpecies
+
+
+class LumpingRulesTest(unittest.TestCase):
+    def test_lumping_rules(self):
+        ss = StatefulSpecies("CO X(1SIGMA+);v=7;J=3;n=2")
+        self.assertEqual(repr(strip_states(ss)), "CO")
+        self.assertEqual(repr(electronic_states(ss)), "CO X(1Σ+)")
+        self.assertEqual(repr(vibrational_above(5)(ss)), "CO X(1Σ+);J=3;n=2;v=6+")
+        self.assertEqual(repr(vibrational_above(7)(ss)), "CO X(1Σ+);v=7;J=3;n=2")
+        self.assertEqual(repr(electronic_states(StatefulSpecies("Ar"))), "Ar")
+
+
+class NetworkReducerTest(unittest.TestCase):
+    def setUp(self):
+        self.reactions = [
+            Reaction("e- + N2 X(1SIGMA+g);v=0 → e- + N2 X(1SIGMA+g);v=1"),
+            Reaction("e- + N2 X(1SIGMA+g);v=0 → e- + N2 A(3SIGMA+u);v=0"),
+            Reaction("e- + N2 X(1SIGMA+g);v=1 → e- + N2 A(3SIGMA+u);v=2"),
+            Reaction(
+                "N2 A(3SIGMA+u);v=0 + O → N2 X(1SIGMA+g);v=0 + O",
+                rate=Arrhenius(1.0e-12, 100),
+            ),
+            Reaction("N2 A(3SIGMA+u);v=0 + O2 → N2 X(1SIGMA+g);v=0 + O + O"),
+            Reaction("e- + Ar → e- + Ar *"),
+        ]
+
+    def test_electronic_states(self):
+        reducer = NetworkReducer(electronic_states)
+        reducer.add(self.reactions[:3])
+        reducer.add(self.reactions[3:])
+        self.assertEqual(reducer.nadded, 6)
+        self.assertEqual(
+            [repr(r) for r in reducer.reactions],
+            [
+                "e- + N2 X(1Σ+g) → N2 A(3Σ+u) + e-",
+                "N2 A(3Σ+u) + O → N2 X(1Σ+g) + O",
+                "N2 A(3Σ+u) + O2 → N2 X(1Σ+g) + O + O",
+                "e- + Ar → Ar * + e-",
+            ],
+        )
+        self.assertEqual(reducer.sources, [[1, 2], [3], [4], [5]])
+        self.assertIsNone(reducer.reactions[0].rate)
+        self.assertIsNotNone(reducer.reactions[1].rate)
+
+        reducer.add([Reaction("N2 A(3SIGMA+u);v=3 + O → N2 X(1SIGMA+g);v=1 + O")])
+        self.assertEqual(reducer.sources[1], [3, 6])
+        self.assertIsNone(reducer.reactions[1].rate)
+
+    def test_drop_null(self):
+        reducer = NetworkReducer(strip_states, drop_null=False)
+        reducer.add(self.reactions)
+        self.assertEqual(len(reducer.reactions), 4)
+        self.assertEqual(reducer.sources[0], [0, 1, 2])
+
+    def test_reduce(self):
+        reducer = NetworkReducer(electronic_states)
+        reducer.add(self.reactions)
+        reduced = reducer.reduce(seeds=["N2 X(1SIGMA+g);v=7"])
+        self.assertEqual(reduced.sources, [[1, 2]])
+        reduced = reducer.reduce(seeds=["N2 X(1SIGMA+g)", "O"])
+        self.assertEqual(reduced.sources, [[1, 2], [3]])
+        # The O produced by the quenching of N2 A by O2 quenches N2 A in turn.
+        reduced = reducer.reduce(seeds=["O2", "N2 A(3SIGMA+u)"])
+        self.assertEqual(reduced.sources, [[1, 2], [3], [4]])
+        reduced = reducer.reduce(species=["N2 X(1SIGMA+g)", "N2 A(3SIGMA+u)", "O"])
+        self.assertEqual(reduced.sources, [[1, 2], [3]])
+        self.assertEqual(reducer.reduce(seeds=["Xe"]).reactions, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
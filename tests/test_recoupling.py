@@ -0,0 +1,120 @@
+"""
+Unit tests for the recoupling module of PyValem
+"""
+
+from fractions import Fraction
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from pyvalem.recoupling import (
+    RecouplingError,
+    basis,
+    transformation_matrices,
+    transformation_matrix,
+)
+from pyvalem.states import (
+    AtomicTermSymbol,
+    CompoundLSCoupling,
+    J1J2_Coupling,
+    J1K_LK_Coupling,
+)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class RecouplingTest(unittest.TestCase):
+    def test_basis(self):
+        states = basis("[Ne].3s2.3p5.4p", 1, "LS")
+        self.assertEqual(
+            [repr(state.state) for state in states], ["1P_1", "3S_1", "3P_1", "3D_1"]
+        )
+        self.assertIsInstance(states[0].parents, CompoundLSCoupling)
+        self.assertIsInstance(states[0].state, AtomicTermSymbol)
+        self.assertEqual(repr(states[0].parents), "3p5(2Po)4p(2Po)")
+
+        states = basis("[Ne].3s2.3p5.4p", 1, "jj")
+        self.assertIsInstance(states[0].state, J1J2_Coupling)
+        self.assertEqual(
+            [repr(state.state) for state in states],
+            ["(1/2,1/2)_1", "(1/2,3/2)_1", "(3/2,1/2)_1", "(3/2,3/2)_1"],
+        )
+        self.assertEqual(repr(states[1].parents), "3p5(2Po_1/2)4p(2Po_3/2)")
+
+        states = basis("[Ne].3s2.3p5.4p", 1, "jK")
+        self.assertIsInstance(states[0].state, J1K_LK_Coupling)
+        self.assertEqual(
+            [repr(state.state) for state in states],
+            ["2[1/2]_1", "2[3/2]_1", "2[1/2]_1", "2[3/2]_1"],
+        )
+        self.assertEqual(repr(states[2].parents), "3p5(2Po_3/2)4p(2Po)")
+
+        states = basis("1s2.2s2.2p.3d", Fraction(3), "LS")
+        self.assertEqual(
+            [repr(state.state) for state in states],
+            ["1Fo_3", "3Do_3", "3Fo_3"],
+        )
+
+    def test_p_p_J0(self):
+        transformation = transformation_matrix("2p.3p", 0, "LS", "jj")
+        self.assertEqual(
+            [repr(state.state) for state in transformation.columns], ["1S_0", "3P_0"]
+        )
+        self.assertEqual(
+            [repr(state.state) for state in transformation.rows],
+            ["(1/2,1/2)_0", "(3/2,3/2)_0"],
+        )
+        self.assertTrue(
+            np.allclose(
+                abs(transformation.matrix),
+                np.sqrt([[1 / 3, 2 / 3], [2 / 3, 1 / 3]]),
+            )
+        )
+
+    def test_orthogonality_and_composition(self):
+        for configuration in ("2p5.3p", "[Ar].3d.4p", "2p2.3s", "[Xe].4f.5d"):
+            matrices = transformation_matrices(configuration, "LS", "jK")
+            for J, transformation in matrices.items():
+                matrix = transformation.matrix
+                self.assertEqual(len(transformation.rows), len(transformation.columns))
+                self.assertTrue(np.allclose(matrix @ matrix.T, np.eye(len(matrix))))
+                ls_jj = transformation_matrix(configuration, J, "LS", "jj").matrix
+                jj_jK = transformation_matrix(configuration, J, "jj", "jK").matrix
+                self.assertTrue(np.allclose(jj_jK @ ls_jj, matrix))
+                jK_ls = transformation_matrix(configuration, J, "jK", "LS").matrix
+                self.assertTrue(np.allclose(jK_ls, matrix.T))
+                self.assertTrue(
+                    np.allclose(
+                        transformation_matrix(configuration, J, "jj", "jj").matrix,
+                        np.eye(len(matrix)),
+                    )
+                )
+        self.assertEqual(
+            list(transformation_matrices("2p5.3p", "LS", "jK")), [0, 1, 2, 3]
+        )
+
+    def test_parents(self):
+        self.assertRaises(RecouplingError, basis, "[Ar].3d3.4s", 2)
+        states = basis("[Ar].3d3.4s", 2, parents=("4F", None))
+        self.assertEqual([repr(state.state) for state in states], ["3F_2", "5F_2"])
+        matrix = transformation_matrix(
+            "[Ar].3d3.4s", 2, "LS", "jK", parents=("4F", "2S")
+        ).matrix
+        self.assertTrue(np.allclose(matrix @ matrix.T, np.eye(len(matrix))))
+        self.assertRaises(
+            RecouplingError, basis, "[Ar].3d3.4s", 2, parents=("4P", "2P")
+        )
+        self.assertRaises(
+            RecouplingError, basis, "[Ar].3d3.4s", 2, parents=("1S", None)
+        )
+
+    def test_errors(self):
+        self.assertRaises(RecouplingError, basis, "1s2.2s2.2p", 0.5)
+        self.assertRaises(RecouplingError, basis, "1s.2s.2p", 0.5)
+        self.assertRaises(RecouplingError, basis, "2p5.3p", 1, "jl")
+
+
+if __name__ == "__main__":
+    unittest.main()
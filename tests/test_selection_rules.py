@@ -0,0 +1,161 @@
+"""
+Unit tests for the selection_rules module of PyValem
+"""
+
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from pyvalem.selection_rules import (
+    ALLOWED,
+    DIFFERENT_SPECIES,
+    FORBIDDEN_COUPLING,
+    FORBIDDEN_J,
+    FORBIDDEN_PARITY,
+    FORBIDDEN_SPIN,
+    RIGOROUS,
+    SelectionRuleError,
+    check_transition,
+    check_transitions,
+    quantum_numbers,
+)
+from pyvalem.stateful_species import StatefulSpecies
+
+
+class SelectionRulesTest(unittest.TestCase):
+    def test_quantum_numbers(self):
+        formula, qn = quantum_numbers("Fe+ [Ar].3d6.4s 6D_9/2")
+        self.assertEqual(formula, "Fe+")
+        self.assertEqual((qn.J2, qn.parity, qn.S2, qn.L), (9, 0, 5, 2))
+        self.assertEqual((qn.K2, qn.Lambda, qn.reflection), (-1, -1, 0))
+        _, qn = quantum_numbers(StatefulSpecies("N2 X(1SIGMA+g);v=0;J=2"))
+        self.assertEqual(
+            (qn.J2, qn.parity, qn.S2, qn.Lambda, qn.reflection), (4, 0, 0, 0, 1)
+        )
+        _, qn = quantum_numbers("C 1s2.2s2.2p.3s")
+        self.assertEqual((qn.J2, qn.parity), (-1, 1))
+
+    def test_atomic_transitions(self):
+        self.assertEqual(check_transition("H 2p 2Po_1/2", "H 1s 2S_1/2"), ALLOWED)
+        self.assertEqual(check_transition("H 2s 2S_1/2", "H 1s 2S_1/2"), 10)
+        self.assertEqual(check_transition("H 2s 2S_1/2", "H 1s 2S_1/2", "M1"), ALLOWED)
+        # J = 1/2 <-> 1/2 and L = 0 <-> 0 are forbidden for E2.
+        self.assertEqual(
+            check_transition("H 2s 2S_1/2", "H 1s 2S_1/2", "E2"),
+            FORBIDDEN_J | FORBIDDEN_COUPLING,
+        )
+        self.assertEqual(
+            check_transition("H 3d 2D_5/2", "H 1s 2S_1/2"),
+            FORBIDDEN_J | FORBIDDEN_PARITY | FORBIDDEN_COUPLING,
+        )
+        self.assertEqual(check_transition("H 3d 2D_5/2", "H 1s 2S_1/2", "E2"), ALLOWED)
+        self.assertEqual(
+            check_transition("Mg 3s.3p 3Po_1", "Mg 3s2 1S_0"), FORBIDDEN_SPIN
+        )
+        self.assertEqual(
+            check_transition("Mg 3s.3p 3Po_0", "Mg 3s2 1S_0") & RIGOROUS, FORBIDDEN_J
+        )
+        self.assertEqual(
+            check_transition("O+ 2p3 2Do_3/2", "O+ 2p3 4So_3/2", "M1"),
+            FORBIDDEN_SPIN | FORBIDDEN_COUPLING,
+        )
+        self.assertEqual(
+            check_transition("C 2p.3s 3Po_1", "C 2p2 3P_1", "E2"), FORBIDDEN_PARITY
+        )
+        self.assertEqual(
+            check_transition("Fe+ 6D_9/2", "Fe 5D_4") & DIFFERENT_SPECIES,
+            DIFFERENT_SPECIES,
+        )
+
+    def test_coupled_transitions(self):
+        self.assertEqual(
+            check_transition("Ne 2p5.3p 2[3/2]_2", "Ne 2p5.3s 2[3/2]o_1"), ALLOWED
+        )
+        self.assertEqual(
+            check_transition("Ne 2p5.4p 2[5/2]_3", "Ne 2p5.3s 2[1/2]o_1"),
+            FORBIDDEN_J | FORBIDDEN_COUPLING,
+        )
+        self.assertEqual(check_transition("Xe (3/2,1/2)o_2", "Xe (3/2,3/2)_2"), ALLOWED)
+        self.assertEqual(
+            check_transition("Xe (1/2,1/2)o_1", "Xe (3/2,3/2)_2"), FORBIDDEN_COUPLING
+        )
+
+    def test_molecular_transitions(self):
+        self.assertEqual(
+            check_transition("CO A(1PI);J=1", "CO X(1SIGMA+);J=0"), ALLOWED
+        )
+        self.assertEqual(
+            check_transition("CO A(1PI);J=3", "CO X(1SIGMA+);J=0"), FORBIDDEN_J
+        )
+        self.assertEqual(check_transition("N2 B(3PIg)", "N2 A(3SIGMA+u)"), ALLOWED)
+        self.assertEqual(
+            check_transition("N2 B(3PIg)", "N2 X(1SIGMA+g)"),
+            FORBIDDEN_PARITY | FORBIDDEN_SPIN,
+        )
+        self.assertEqual(check_transition("O2 B(3SIGMA-u)", "O2 X(3SIGMA-g)"), ALLOWED)
+        self.assertEqual(
+            check_transition("O2 c(1SIGMA-u)", "O2 X(1SIGMA+g)"), FORBIDDEN_COUPLING
+        )
+        # The atmospheric band of O2 is a magnetic dipole transition.
+        self.assertEqual(
+            check_transition("O2 b(1SIGMA+g)", "O2 X(3SIGMA-g)", "M1"), FORBIDDEN_SPIN
+        )
+        self.assertEqual(
+            check_transition("CO a(3PI)", "CO X(1SIGMA+)", "E1"), FORBIDDEN_SPIN
+        )
+        self.assertEqual(
+            check_transition("CO d(3DELTA)", "CO X(1SIGMA+)") & FORBIDDEN_COUPLING,
+            FORBIDDEN_COUPLING,
+        )
+
+    def test_polyatomic_transitions(self):
+        self.assertEqual(check_transition("H2O 1B2", "H2O 1A1"), ALLOWED)
+        self.assertEqual(check_transition("H2O 3B1", "H2O 1A1"), FORBIDDEN_SPIN)
+        self.assertEqual(check_transition("NH3 2A'", 'NH3 2A"'), ALLOWED)
+        _, qn = quantum_numbers("H2O 1B2")
+        self.assertEqual((qn.S2, qn.Lambda, qn.reflection), (0, -1, 0))
+
+    def test_invalid_multipole(self):
+        for multipole in ("", "E", "X1", "E0", "M-1"):
+            self.assertRaises(
+                SelectionRuleError, check_transition, "H 2p", "H 1s", multipole
+            )
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_check_transitions(self):
+        levels = [
+            "H 1s 2S_1/2",
+            "H 2s 2S_1/2",
+            "H 2p 2Po_1/2",
+            "H 2p 2Po_3/2",
+            "H 3d 2D_5/2",
+            "He 1s2 1S_0",
+        ]
+        uppers = [2, 3, 1, 4, 4, 2, 3]
+        lowers = [0, 0, 0, 0, 3, 5, 2]
+        for multipole in ("E1", "M1", "E2", "M2"):
+            codes = check_transitions(uppers, lowers, multipole, levels=levels)
+            self.assertEqual(codes.dtype, np.uint8)
+            self.assertEqual(
+                list(codes),
+                [
+                    check_transition(levels[i], levels[j], multipole)
+                    for i, j in zip(uppers, lowers)
+                ],
+            )
+        codes = check_transitions(
+            [levels[i] for i in uppers],
+            [StatefulSpecies(levels[j]) for j in lowers],
+        )
+        self.assertEqual(list(codes), [0, 0, 10, 11, 0, 21, 2])
+        self.assertEqual(len(check_transitions([], [])), 0)
+        self.assertRaises(
+            SelectionRuleError, check_transitions, [0, 1], [0], levels=levels
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Unit tests for the species_index module of PyValem
+"""
+
+import unittest
+
+from pyvalem.species_index import SpeciesIndex, quantum_numbers
+from pyvalem.stateful_species import StatefulSpecies
+from pyvalem.states import (
+    AtomicTermSymbol,
+    KeyValuePair,
+    MolecularTermSymbol,
+    RacahSymbol,
+    RotationalState,
+    VibrationalState,
+)
+
+
+class SpeciesIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.species = [
+            "CO v=0",
+            "CO v=3",
+            "CO X(1SIGMA+);v=5;J=2",
+            "CO A(1PI);v=3",
+            "CO+ v=4",
+            "CO",
+            "Ar+ 2P_1/2",
+            "Ar+ 2P_3/2",
+            "Ar+",
+            "Ar 3p5.4s 3P_1",
+            "H n=3",
+            "H n=4",
+            "H2 v=*",
+            "Ne 3p[5/2]_3",
+            "Ne 3p[5/2]_2",
+        ]
+        self.index = SpeciesIndex(self.species)
+
+    def check(self, expected, **kwargs):
+        self.assertEqual([repr(ss) for ss in self.index.find(**kwargs)], expected)
+
+    def test_quantum_numbers(self):
+        ss = StatefulSpecies("CO X(1SIGMA+);v=5;J=2;n=2;k=a")
+        qns = [quantum_numbers(state) for state in ss.states]
+        self.assertEqual(qns, [{"S": 0}, {"v": 5}, {"J": 2}, {"n": 2}, {}])
+        ss = StatefulSpecies("Ne 3p[5/2]_3")
+        self.assertEqual(quantum_numbers(ss.states[0]), {"principal": 3, "J": 3})
+
+    def test_add(self):
+        self.assertEqual(len(self.index), len(self.species))
+        self.assertEqual(self.index.add("CO J=2;X(1SIGMA+);v=5"), 2)
+        self.assertEqual(len(self.index), len(self.species))
+        self.assertIn(StatefulSpecies("Ar+"), self.index)
+        self.assertNotIn("Ar", self.index)
+        self.assertEqual(self.index.add("Ar"), len(self.species))
+
+    def test_find(self):
+        self.check(
+            ["CO v=3", "CO X(1Σ+);v=5;J=2", "CO A(1Π);v=3"], formula="CO", v=(3, None)
+        )
+        self.check(["CO v=0", "CO v=3", "CO A(1Π);v=3", "CO+ v=4"], v=(None, 4))
+        self.check(["CO v=3", "CO A(1Π);v=3"], v=3)
+        self.check(["Ar+ 2P_1/2", "Ar+ 2P_3/2", "Ar+"], formula="Ar+")
+        self.check(["Ar+ 2P_1/2"], state_type=AtomicTermSymbol, J=0.5)
+        self.check(["CO X(1Σ+);v=5;J=2", "Ne 3p[5/2]_2"], J=2)
+        self.check(["Ne 3p[5/2]_3"], state_type=RacahSymbol, J=(3, None))
+        self.check([], state_type=AtomicTermSymbol, J=2)
+        self.check(["CO X(1Σ+);v=5;J=2"], state_type=RotationalState)
+        self.check(
+            ["CO X(1Σ+);v=5;J=2", "CO A(1Π);v=3"], state_type=MolecularTermSymbol
+        )
+        self.check(["CO A(1Π);v=3"], state="A(1PI)")
+        self.check(["H n=4"], state_type=KeyValuePair, n=(3.5, 10))
+        self.check(["CO+ v=4"], formula=StatefulSpecies("CO+ v=1"), v=4)
+        self.check(["H2 v=*"], formula="H2", state_type=VibrationalState)
+        self.check([], formula="H2", v=(0, None))
+        self.assertEqual(self.index.find_ids(), list(range(len(self.species))))
+
+
+if __name__ == "__main__":
+    unittest.main()
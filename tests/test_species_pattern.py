@@ -0,0 +1,83 @@
+"""
+Unit tests for the species_pattern module of PyValem
+"""
+
+import unittest
+
+from pyvalem.species_index import SpeciesIndex
+from pyvalem.species_pattern import SpeciesPattern, SpeciesPatternError
+
+
+class SpeciesPatternTest(unittest.TestCase):
+    species = [
+        "CO",
+        "CO v=0",
+        "CO v=6",
+        "CO v=*",
+        "CO X(1SIGMA+);v=2",
+        "CO+ v=1",
+        "H2 X(1SIGMA+g);v=0;J=0",
+        "H2 X(1SIGMA+g);v=3;J=5/2",
+        "H2 X(1SIGMA+g);v=7;J=1",
+        "H2 b(3SIGMA+u);v=1;J=1",
+        "Ar+",
+        "Ar+ *",
+        "Ar+ 2P_3/2",
+        "Ar *",
+        "H n=2",
+        "H n=5",
+        "H 1s;n=2",
+        "H n=-1",
+    ]
+
+    expected = {
+        "CO": ["CO"],
+        "CO v=*": ["CO v=0", "CO v=6", "CO v=*"],
+        "CO v=0-5": ["CO v=0"],
+        "CO v=0-5 *": ["CO v=0", "CO X(1Σ+);v=2"],
+        "CO *": ["CO", "CO v=0", "CO v=6", "CO v=*", "CO X(1Σ+);v=2"],
+        "H2 X(1SIGMA+g);v=0-5;J=*": [
+            "H2 X(1Σ+g);v=0;J=0",
+            "H2 X(1Σ+g);v=3;J=5/2",
+        ],
+        "H2 J=1/2-5/2 *": [
+            "H2 X(1Σ+g);v=3;J=5/2",
+            "H2 X(1Σ+g);v=7;J=1",
+            "H2 b(3Σ+u);v=1;J=1",
+        ],
+        "Ar+ *": ["Ar+", "Ar+ *", "Ar+ 2P_3/2"],
+        "Ar *": ["Ar *"],
+        "* v=1 *": ["CO+ v=1", "H2 b(3Σ+u);v=1;J=1"],
+        "H n=*": ["H n=2", "H n=5", "H n=-1"],
+        "H n=-1": ["H n=-1"],
+        "* n=-1 *": ["H n=-1"],
+        "H n=-1-2": ["H n=2", "H n=-1"],
+        "H n=3-9 *": ["H n=5"],
+        "* n=2 *": ["H n=2", "H 1s;n=2"],
+    }
+
+    def test_filter(self):
+        for pattern, expected in self.expected.items():
+            with self.subTest(pattern):
+                self.assertEqual(
+                    [repr(ss) for ss in SpeciesPattern(pattern).filter(self.species)],
+                    expected,
+                )
+
+    def test_select(self):
+        index = SpeciesIndex(self.species)
+        for pattern, expected in self.expected.items():
+            with self.subTest(pattern):
+                self.assertEqual(
+                    [repr(ss) for ss in SpeciesPattern(pattern).select(index)],
+                    expected,
+                )
+
+    def test_invalid_patterns(self):
+        for pattern in ("", "CO v=a-b", "CO v=5-", "CO v=1=2"):
+            with self.subTest(pattern):
+                self.assertRaises(SpeciesPatternError, SpeciesPattern, pattern)
+
+
+if __name__ == "__main__":
+    unittest.main()
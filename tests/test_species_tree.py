@@ -0,0 +1,93 @@
+"""
+Unit tests for the species_tree module of PyValem
+"""
+
+import unittest
+
+from pyvalem.species_tree import SpeciesTree, SpeciesTreeError, species_path
+
+
+class SpeciesTreeTest(unittest.TestCase):
+    def setUp(self):
+        self.tree = SpeciesTree()
+        self.populations = {
+            "CO": 1,
+            "CO v=1": 2,
+            "CO X(1SIGMA+);v=0": 40,
+            "CO X(1SIGMA+);v=1;J=0": 8,
+            "CO X(1SIGMA+);v=1;J=1": 16,
+            "CO a(3PI);v=0": 4,
+            "CO+ X(2SIGMA+)": 32,
+            "Ar 1s2.2s2.2p6.3s2.3p5.4s 3P_2": 64,
+        }
+        for species, population in self.populations.items():
+            self.tree[species] = population
+
+    def test_species_path(self):
+        self.assertEqual(
+            species_path("CO J=1;v=2;X(1SIGMA+)"), ("CO", "X(1Σ+)", "v=2", "J=1")
+        )
+        self.assertEqual(species_path("CO J=1;n=3"), ("CO", "", "", "J=1", "n=3"))
+        self.assertEqual(species_path("Ar 3p5.4s 3P_2"), ("Ar", "3p5.4s;3P_2"))
+        self.assertEqual(species_path("CO+"), ("CO+",))
+
+    def test_lookup(self):
+        self.assertEqual(len(self.tree), len(self.populations))
+        self.assertEqual(self.tree["CO J=1;v=1;X(1SIGMA+)"], 16)
+        self.assertIn("CO v=1", self.tree)
+        self.assertNotIn("CO X(1SIGMA+)", self.tree)
+        self.assertRaises(KeyError, lambda: self.tree["CO X(1SIGMA+)"])
+        self.assertIsNone(self.tree.get("N2"))
+
+    def test_totals(self):
+        self.assertEqual(self.tree.total(), 167)
+        self.assertEqual(self.tree.total("CO"), 71)
+        self.assertEqual(self.tree.total("CO X(1SIGMA+)"), 64)
+        self.assertEqual(self.tree.total("CO X(1SIGMA+);v=1"), 24)
+        self.assertEqual(self.tree.total("CO v=1"), 2)
+        self.assertEqual(self.tree.total("N2"), 0)
+        self.assertEqual(self.tree.count("CO"), 6)
+        self.assertEqual(self.tree.count("CO X(1SIGMA+)"), 3)
+
+        self.tree["CO X(1SIGMA+);v=1;J=0"] = 0
+        self.tree.add("CO X(1SIGMA+);v=1;J=1", 8)
+        self.tree.add("CO X(1SIGMA+);v=2")
+        self.assertEqual(self.tree.total("CO X(1SIGMA+);v=1"), 24)
+        self.assertEqual(self.tree.count("CO X(1SIGMA+)"), 4)
+
+        del self.tree["CO X(1SIGMA+);v=1;J=1"]
+        del self.tree["CO X(1SIGMA+);v=1;J=0"]
+        self.assertEqual(self.tree.total("CO X(1SIGMA+)"), 40)
+        self.assertEqual(self.tree.count("CO X(1SIGMA+);v=1"), 0)
+        self.assertRaises(KeyError, self.tree.__delitem__, "CO X(1SIGMA+);v=1")
+        self.assertEqual(len(self.tree), len(self.populations) - 1)
+
+    def test_items(self):
+        items = {repr(ss): value for ss, value in self.tree.items()}
+        self.assertEqual(len(items), len(self.populations))
+        self.assertEqual(
+            [repr(ss) for ss, _ in self.tree.items("CO X(1SIGMA+)")],
+            ["CO X(1Σ+);v=0", "CO X(1Σ+);v=1;J=0", "CO X(1Σ+);v=1;J=1"],
+        )
+        self.assertEqual(list(self.tree.items("N2")), [])
+
+    def test_aggregate(self):
+        self.assertEqual(
+            self.tree.aggregate("formula"), {"CO": 71, "CO+": 32, "Ar": 64}
+        )
+        self.assertEqual(
+            self.tree.aggregate("electronic"),
+            {
+                "CO": 3,
+                "CO X(1Σ+)": 64,
+                "CO a(3Π)": 4,
+                "CO+ X(2Σ+)": 32,
+                "Ar 1s2.2s2.2p6.3s2.3p5.4s;3P_2": 64,
+            },
+        )
+        self.assertEqual(self.tree.aggregate(2)["CO X(1Σ+);v=1"], 24)
+        self.assertRaises(SpeciesTreeError, self.tree.aggregate, "nuclear")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,8 @@ from pyvalem.formula import FormulaParseError
 from pyvalem.states._base_state import StateParseError
 from pyvalem.stateful_species import StatefulSpecies, StatefulSpeciesError
 from pyvalem.states.vibrational_state import VibrationalState
+from pyvalem.states import AtomicTermSymbol, RotationalState
+from pyvalem.states._state_parser import state_parser, try_parse_state
 
 
 class StatefulSpeciesTest(unittest.TestCase):
@@ -137,6 +139,49 @@ class StatefulSpeciesTest(unittest.TestCase):
         _ = StatefulSpecies("Pd 6s2.6p.7s (3/2,1/2)")
         _ = StatefulSpecies("Bi 5d4.6s(6D)31d (1/2,3/2)o_2")
 
+    def test_try_parse(self):
+        for s in (
+            "CO",
+            "CO v=1;J=2",
+            "Ar+ 3p5 2P_3/2",
+            "H2 X(1SIGMA+g) v=0 J=1/2",
+            "C 2s2.2p(2Po_1/2)5g 2[7/2]o_3",
+            "Pd 6s2.6p.7s (3/2,1/2)",
+            "N2 C(3PIu);v=2;n=3",
+        ):
+            self.assertEqual(
+                repr(StatefulSpecies.try_parse(s)), repr(StatefulSpecies(s))
+            )
+        for s in (
+            "Argon",
+            "CO v=1;J=2;J=3",
+            "H2 v=1 *5",
+            "He 2s2 1s",
+            "",
+            "H (1,1/2)_2",
+            "H 2[9/2]o_3",
+        ):
+            self.assertIsNone(StatefulSpecies.try_parse(s))
+
+    def test_state_try_parse(self):
+        self.assertEqual(repr(RotationalState.try_parse("J=5/2")), "J=5/2")
+        self.assertIsNone(RotationalState.try_parse("v=2"))
+        self.assertIsNone(AtomicTermSymbol.try_parse("J=1"))
+        for s in (
+            "*",
+            "3*",
+            "1s2.2s",
+            "3P_1",
+            "v=2",
+            "2v1+v3",
+            "J=1",
+            "n=3",
+            "1s2.2s(3S)",
+        ):
+            self.assertEqual(repr(try_parse_state(s)), repr(state_parser(s)))
+        self.assertIsNone(try_parse_state("J=1=2"))
+        self.assertIsNone(try_parse_state("not a state"))
+
 
 if __name__ == "__main__":
     unittest.main()
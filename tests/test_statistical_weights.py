@@ -0,0 +1,140 @@
+"""
+Unit tests for the statistical_weights module of PyValem
+"""
+
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from pyvalem.nuclear_spin import NuclearSpinError
+from pyvalem.stateful_species import StatefulSpecies
+from pyvalem.statistical_weights import (
+    StatisticalWeightError,
+    partition_function,
+    populations,
+    statistical_weight,
+    statistical_weights,
+)
+
+
+class StatisticalWeightTest(unittest.TestCase):
+    def test_atomic_weights(self):
+        self.assertEqual(statistical_weight("H 2p 2Po_3/2"), 4)
+        self.assertEqual(statistical_weight("H 2p 2Po"), 6)
+        self.assertEqual(statistical_weight("Fe 3d6.4s2 5D"), 25)
+        self.assertEqual(statistical_weight("Fe [Ar].3d6.4s2"), 210)
+        self.assertEqual(statistical_weight(StatefulSpecies("Ne 1s2.2s2.2p6")), 1)
+        self.assertEqual(statistical_weight("Ne 2p5.3p 2[5/2]_3"), 7)
+        self.assertEqual(statistical_weight("Ne 2p5.3p 2[5/2]"), 12)
+        self.assertEqual(statistical_weight("Ne 2p5.3p 4[5/2]"), 24)
+        self.assertEqual(statistical_weight("Xe (3/2,1/2)o_2"), 5)
+        self.assertEqual(statistical_weight("Xe (3/2,1/2)o"), 8)
+        self.assertEqual(statistical_weight("Ar"), 1)
+
+    def test_molecular_weights(self):
+        self.assertEqual(statistical_weight("CO X(1SIGMA+);v=0;J=3"), 7)
+        self.assertEqual(statistical_weight("CO A(1PI);v=0;J=3"), 14)
+        self.assertEqual(statistical_weight("OH X(2Π_3/2);J=3/2"), 8)
+        self.assertEqual(statistical_weight("HCl J=2"), 5)
+        self.assertEqual(statistical_weight("O2 X(3SIGMA-g)"), 3)
+        self.assertEqual(statistical_weight("NO X(2PI)"), 4)
+        # The Ω components of a 3Π state are all Λ-doubled.
+        self.assertEqual(statistical_weight("CO a(3PI_0)"), 2)
+        self.assertEqual(statistical_weight("CO a(3PI_0);v=0;J=1"), 6)
+        self.assertEqual(
+            sum(statistical_weight("CO a(3PI_{})".format(Omega)) for Omega in range(3)),
+            statistical_weight("CO a(3PI)"),
+        )
+        self.assertEqual(statistical_weight("O2 X(3SIGMA-g_0)"), 1)
+        self.assertEqual(statistical_weight("O2 X(3SIGMA-g_1)"), 2)
+        self.assertEqual(statistical_weight("CH4 X(1A1)"), 1)
+        self.assertEqual(statistical_weight("NH3+ A(2E)"), 4)
+
+    def test_nuclear_spin_weights(self):
+        weights = {"H2": (1, 3), "(16O)2": (1, 0)}
+        for J, g in enumerate((1, 9, 5, 21)):
+            self.assertEqual(
+                statistical_weight("H2 X(1SIGMA+g);v=0;J={}".format(J), weights), g
+            )
+            self.assertEqual(statistical_weight("H2 J={}".format(J), weights), g)
+            self.assertEqual(
+                statistical_weight("D2 J={}".format(J), weights), 2 * J + 1
+            )
+        self.assertEqual(statistical_weight("(16O)2 b(1SIGMA+g);J=1", weights), 0)
+        self.assertEqual(statistical_weight("(16O)2 b(1SIGMA+g);J=2", weights), 5)
+        # The even-J levels of a Σu+ state are antisymmetric.
+        self.assertEqual(statistical_weight("H2 B(1SIGMA+u);J=0", weights), 3)
+        # The symmetry of the J levels of a Σ state with S > 0 is not determined:
+        # the J = 2 levels of O2 X(3Σg-) have N = 1 and N = 3.
+        self.assertEqual(statistical_weight("(16O)2 X(3SIGMA-g);J=2", weights), 5)
+        self.assertEqual(statistical_weight("(16O)2 B(3SIGMA-u);J=2", weights), 5)
+        self.assertEqual(statistical_weight("H2 c(3PIu);J=1", weights), 12)
+        self.assertEqual(statistical_weight("H2 X(2SIGMA+g);J=1/2", weights), 2)
+        # The weights found from the tabulated nuclear spins.
+        self.assertEqual(statistical_weight("H2 J=1", True), 9)
+        self.assertEqual(statistical_weight("D2 X(1SIGMA+g);J=2", True), 30)
+        self.assertEqual(statistical_weight("O2 X(3SIGMA-g);v=0;J=2", True), 5)
+        self.assertEqual(statistical_weight("O2 a(1DELTAg);J=2", True), 5)
+        self.assertRaises(NuclearSpinError, statistical_weight, "Xe2 J=1", True)
+        self.assertEqual(statistical_weight("D2 c(3PIu);J=1", True), 27)
+        self.assertEqual(statistical_weight("CO X(1SIGMA+);J=1", True), 3)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_statistical_weights(self):
+        levels = ["H 1s 2S_1/2", "H 2p 2Po_1/2", "H 2p 2Po_3/2", "H 1s 2S_1/2"]
+        g = statistical_weights(levels)
+        self.assertTrue(np.array_equal(g, [2, 2, 4, 2]))
+        g = statistical_weights(
+            [StatefulSpecies("H2 J={}".format(J)) for J in range(4)], {"H2": (1, 3)}
+        )
+        self.assertTrue(np.array_equal(g, [1, 9, 5, 21]))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_partition_function(self):
+        g, E = [2, 2, 4], [0, 1000, 1500]
+        self.assertAlmostEqual(
+            partition_function(g, E, 1000), 2 + 2 / np.e + 4 / np.e**1.5
+        )
+        T = np.array([[100, 1000], [1e4, 1e8]])
+        Q = partition_function(g, E, T)
+        self.assertEqual(Q.shape, (2, 2))
+        self.assertAlmostEqual(Q[1, 1], 8, places=3)
+        expected = [sum(gi * np.exp(-Ei / t) for gi, Ei in zip(g, E)) for t in T.flat]
+        self.assertTrue(np.allclose(Q.reshape(-1), expected))
+        self.assertTrue(
+            np.allclose(
+                partition_function(g, np.array(E) / 11604.51812, T, units="eV"), Q
+            )
+        )
+
+        # A rigid rotor, Q = kT / B + 1 / 3 at high temperature.
+        B = 2.0
+        J = np.arange(1000)
+        Q = partition_function(2 * J + 1, B * J * (J + 1), [1e3, 1e4], "cm-1")
+        self.assertTrue(
+            np.allclose(Q, np.array([1e3, 1e4]) / (B * 1.438776877) + 1 / 3)
+        )
+
+        self.assertRaises(StatisticalWeightError, partition_function, g, E[:2], 300)
+        self.assertRaises(StatisticalWeightError, partition_function, g, E, 300, "kJ")
+        self.assertRaises(StatisticalWeightError, partition_function, g, E, [300, 0])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_populations(self):
+        g, E = [1, 3, 5], [0, 100, 300]
+        n = populations(g, E, 200)
+        self.assertEqual(n.shape, (3,))
+        self.assertAlmostEqual(n.sum(), 1)
+        self.assertAlmostEqual(n[1] / n[0], 3 * np.exp(-0.5))
+        n = populations(g, E, [100, 200, 1e6])
+        self.assertEqual(n.shape, (3, 3))
+        self.assertTrue(np.allclose(n.sum(axis=0), 1))
+        self.assertTrue(np.allclose(n[:, 1], populations(g, E, 200)))
+        self.assertTrue(np.allclose(n[:, 2], [1 / 9, 3 / 9, 5 / 9], rtol=1e-3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+"""
+Unit tests for the wigner module of PyValem
+"""
+
+from fractions import Fraction
+import itertools
+import math
+import random
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from pyvalem.wigner import (
+    SqrtRational,
+    WignerError,
+    _exact_3j,
+    _exact_6j,
+    _exact_9j,
+    wigner_3j,
+    wigner_3j_array,
+    wigner_3j_exact,
+    wigner_6j,
+    wigner_6j_array,
+    wigner_6j_exact,
+    wigner_9j,
+    wigner_9j_array,
+    wigner_9j_exact,
+)
+
+
+def projections(j):
+    return [-j + k for k in range(int(2 * j) + 1)]
+
+
+def sixj_from_3j(j1, j2, j3, j4, j5, j6):
+    """Evaluate a 6j symbol as a sum over products of four 3j symbols."""
+    total = 0
+    for m1, m2, m5 in itertools.product(
+        projections(j1), projections(j2), projections(j5)
+    ):
+        m3, m6 = -m1 - m2, m5 - m1
+        m4 = m6 - m2
+        if abs(m3) > j3 or abs(m4) > j4 or abs(m6) > j6:
+            continue
+        phase = (-1) ** round(j1 + j2 + j3 + j4 + j5 + j6 - m1 - m2 - m3 - m4 - m5 - m6)
+        total += (
+            phase
+            * wigner_3j(j1, j2, j3, -m1, -m2, -m3)
+            * wigner_3j(j1, j5, j6, m1, -m5, m6)
+            * wigner_3j(j4, j2, j6, m4, m2, -m6)
+            * wigner_3j(j4, j5, j3, -m4, m5, m3)
+        )
+    return total
+
+
+class WignerTest(unittest.TestCase):
+    def test_sqrt_rational(self):
+        self.assertEqual(repr(SqrtRational(-1, Fraction(1, 6))), "-sqrt(1/6)")
+        self.assertEqual(repr(SqrtRational(1, Fraction(4, 9))), "2/3")
+        self.assertEqual(repr(SqrtRational(-1, 0)), "0")
+        self.assertEqual(SqrtRational(-1, Fraction(1, 4)), Fraction(-1, 2))
+        self.assertNotEqual(SqrtRational(-1, Fraction(1, 4)), Fraction(1, 2))
+        self.assertEqual(-SqrtRational(-1, 2), SqrtRational(1, 2))
+        self.assertAlmostEqual(float(SqrtRational(-1, 2)), -math.sqrt(2))
+
+    def test_3j(self):
+        self.assertEqual(
+            wigner_3j_exact(1, 1, 1, 1, 0, -1), SqrtRational(-1, Fraction(1, 6))
+        )
+        self.assertEqual(
+            wigner_3j_exact(2, 2, 2, 0, 0, 0), SqrtRational(-1, Fraction(2, 35))
+        )
+        self.assertEqual(
+            wigner_3j_exact(0.5, 0.5, 1, 0.5, 0.5, -1), SqrtRational(-1, Fraction(1, 3))
+        )
+        # (j j 0; m -m 0) = (-1)**(j-m) / sqrt(2j+1).
+        for j in (0, 0.5, 1, 1.5, 2, 7.5):
+            for m in projections(j):
+                self.assertAlmostEqual(
+                    wigner_3j(j, j, 0, m, -m, 0),
+                    (-1) ** round(j - m) / math.sqrt(2 * j + 1),
+                )
+        # Symbols violating the selection rules are zero.
+        self.assertEqual(wigner_3j_exact(1, 1, 3, 0, 0, 0), 0)
+        self.assertEqual(wigner_3j_exact(1, 1, 1, 0, 0, 0), 0)
+        self.assertEqual(wigner_3j_exact(1, 1, 1, 1, 1, -1), 0)
+        self.assertEqual(wigner_3j_exact(1, 1, 1, 2, -1, -1), 0)
+        self.assertEqual(wigner_3j_exact(1, 0.5, 0.5, 0.5, 0, -0.5), 0)
+        self.assertRaises(WignerError, wigner_3j_exact, 0.3, 1, 1, 0, 0, 0)
+
+    def test_3j_orthogonality(self):
+        j1, j2 = 1.5, 2
+        for j3, j3p in itertools.product((0.5, 1.5, 2.5, 3.5), repeat=2):
+            total = sum(
+                (2 * j3 + 1)
+                * wigner_3j(j1, j2, j3, m1, m2, -m1 - m2)
+                * wigner_3j(j1, j2, j3p, m1, m2, -m1 - m2)
+                for m1 in projections(j1)
+                for m2 in projections(j2)
+                if m1 + m2 == 0.5
+            )
+            self.assertAlmostEqual(total, float(j3 == j3p))
+
+    def test_symmetries(self):
+        # The symbols of canonical and non-canonical arguments agree.
+        rng = random.Random(1)
+        for _ in range(200):
+            j1, j2 = rng.randint(0, 8), rng.randint(0, 8)
+            j3 = rng.randrange(abs(j1 - j2), j1 + j2 + 1, 2)
+            m1 = rng.randrange(-j1, j1 + 1, 2)
+            m2 = rng.randrange(-j2, j2 + 1, 2)
+            if abs(m1 + m2) > j3:
+                continue
+            args = (j1, j2, j3, m1, m2, -m1 - m2)
+            sign, square = _exact_3j(*args)
+            value = wigner_3j_exact(*(x / 2 for x in args))
+            self.assertEqual((value.sign, value.square), (sign, square))
+        for _ in range(100):
+            a, b, d, e = (rng.randint(0, 6) for _ in range(4))
+            c = rng.randrange(abs(a - b), a + b + 1, 2)
+            f = rng.randrange(abs(a - e), a + e + 1, 2)
+            args = (a, b, c, d, e, f)
+            value = wigner_6j_exact(*(x / 2 for x in args))
+            if value.sign:
+                self.assertEqual((value.sign, value.square), _exact_6j(*args))
+        for _ in range(50):
+            a, b, d, e = (rng.randint(0, 4) for _ in range(4))
+            c = rng.randrange(abs(a - b), a + b + 1, 2)
+            f = rng.randrange(abs(d - e), d + e + 1, 2)
+            g = rng.randrange(abs(a - d), a + d + 1, 2)
+            h = rng.randrange(abs(b - e), b + e + 1, 2)
+            i = rng.randrange(abs(c - f), c + f + 1, 2)
+            args = (a, b, c, d, e, f, g, h, i)
+            value = wigner_9j_exact(*(x / 2 for x in args))
+            if value.sign:
+                self.assertEqual((value.sign, value.square), _exact_9j(*args))
+
+    def test_6j(self):
+        self.assertEqual(wigner_6j_exact(1, 1, 1, 1, 1, 1), Fraction(1, 6))
+        self.assertEqual(wigner_6j_exact(0.5, 0.5, 1, 0.5, 0.5, 0), Fraction(1, 2))
+        self.assertEqual(wigner_6j_exact(1, 1, 3, 1, 1, 1), 0)
+        for args in (
+            (1, 1, 1, 1, 1, 1),
+            (1.5, 1, 0.5, 0.5, 1, 1.5),
+            (2, 1, 1, 1, 2, 2),
+            (2, 1.5, 0.5, 1, 1.5, 2.5),
+        ):
+            self.assertAlmostEqual(wigner_6j(*args), sixj_from_3j(*args))
+        # {a b c; 0 c b} = (-1)**(a+b+c) / sqrt((2b+1)(2c+1)).
+        self.assertAlmostEqual(wigner_6j(2, 1.5, 2.5, 0, 2.5, 1.5), 1 / math.sqrt(24))
+
+    def test_9j(self):
+        # {a b e; c d e; f f 0} =
+        #     (-1)**(b+c+e+f) / sqrt((2e+1)(2f+1)) {a b e; d c f}.
+        for a, b, c, d, e, f in (
+            (1, 1, 1, 1, 1, 1),
+            (1, 0.5, 1.5, 1, 1.5, 2),
+            (2, 1, 1, 2, 2, 1),
+        ):
+            self.assertAlmostEqual(
+                wigner_9j(a, b, e, c, d, e, f, f, 0),
+                (-1) ** round(b + c + e + f)
+                / math.sqrt((2 * e + 1) * (2 * f + 1))
+                * wigner_6j(a, b, e, d, c, f),
+            )
+        self.assertEqual(wigner_9j_exact(1, 1, 1, 1, 1, 1, 1, 1, 0), Fraction(1, 18))
+        self.assertEqual(wigner_9j_exact(1, 1, 3, 1, 1, 1, 1, 1, 0), 0)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_arrays(self):
+        rng = np.random.default_rng(2)
+        j1, j2 = rng.integers(0, 12, size=(2, 500))
+        j3 = j1 + j2 - 2 * rng.integers(0, 4, size=500)
+        m1 = rng.integers(-12, 13, size=500)
+        m2 = rng.integers(-12, 13, size=500)
+        args = [x / 2 for x in (j1, j2, j3, m1, m2, -m1 - m2)]
+        values = wigner_3j_array(*args)
+        self.assertEqual(values.shape, (500,))
+        for k in range(500):
+            self.assertAlmostEqual(values[k], wigner_3j(*(x[k] for x in args)))
+
+        args = [rng.integers(0, 8, size=300) / 2 for _ in range(6)]
+        values = wigner_6j_array(*args)
+        for k in range(300):
+            self.assertAlmostEqual(values[k], wigner_6j(*(x[k] for x in args)))
+
+        args = [rng.integers(0, 5, size=300) / 2 for _ in range(9)]
+        values = wigner_9j_array(*args)
+        for k in range(300):
+            self.assertAlmostEqual(values[k], wigner_9j(*(x[k] for x in args)))
+
+        # The arguments are broadcast together.
+        values = wigner_6j_array(1, 1, [0, 1, 2, 3], 1, 1, 1)
+        self.assertTrue(
+            np.allclose(values, [wigner_6j(1, 1, j, 1, 1, 1) for j in range(4)])
+        )
+        self.assertRaises(WignerError, wigner_6j_array, [0.25], 1, 1, 1, 1, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()